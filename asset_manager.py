@@ -0,0 +1,281 @@
+import os
+import time
+import pygame
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from settings import ASSET_CACHE_BUDGET, ASSET_LOADER_THREADS
+from asset_pack import AssetPack, key_name
+
+
+class AssetManager:
+    """
+    Shared cache for images and sounds.
+    Hands out one Surface/Sound per (path, size, flip, convert mode) so that
+    every sprite using the same texture shares it, and evicts the least
+    recently used entries once the memory budget is exceeded.
+    """
+
+    def __init__(self, budget=ASSET_CACHE_BUDGET):
+        """
+        Initialize an empty cache
+
+        Args:
+            budget (int): Approximate memory budget in bytes
+        """
+        self.budget = budget
+        self.cache = OrderedDict()  # key -> (asset, size in bytes)
+        self.failed = {}  # key -> exception raised while loading
+        self.used = 0
+        self.pack = None  # Optional AssetPack consulted before loose files
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_times = OrderedDict()  # key -> seconds spent creating the asset
+
+    def get_image(self, path, size=None, flip=(False, False), convert='alpha'):
+        """
+        Get a shared image Surface
+
+        Args:
+            path (str): Image file path
+            size (tuple): Optional (width, height) to scale to
+            flip (tuple): (flip_x, flip_y) flags
+            convert (str): 'alpha' for convert_alpha(), 'opaque' for convert(),
+                None to keep the decoded pixel format
+
+        Returns:
+            pygame.Surface: Shared surface, do not draw onto it
+
+        Raises:
+            FileNotFoundError, pygame.error: If the file cannot be loaded
+        """
+        key = (path, size, tuple(flip), convert)
+        return self._get(key, lambda: self._build_image(path, size, tuple(flip), convert))
+
+    def get_sound(self, path):
+        """
+        Get a shared Sound
+
+        Args:
+            path (str): Sound file path
+
+        Returns:
+            pygame.mixer.Sound: Shared sound object
+
+        Raises:
+            FileNotFoundError, pygame.error: If the file cannot be loaded
+        """
+        return self._get(('sound', path), lambda: pygame.mixer.Sound(path))
+
+    def get_surface(self, name, factory):
+        """
+        Get a shared generated Surface (fallback images and the like)
+
+        Args:
+            name: Cache key for the surface
+            factory: Callable creating the surface on a cache miss
+
+        Returns:
+            pygame.Surface: Shared surface
+        """
+        return self._get(('generated', name), factory)
+
+    def open_pack(self, path):
+        """
+        Use a pre-built asset pack for the assets it contains
+
+        Args:
+            path (str): Path of the pack built by asset_pack.py
+
+        Returns:
+            bool: True if the pack was opened, False if it is missing or invalid
+        """
+        if not os.path.exists(path):
+            return False
+        try:
+            pack = AssetPack(path)
+        except (OSError, ValueError) as e:
+            print(f"Error opening asset pack: {e}")
+            return False
+        if self.pack is not None:
+            self.pack.close()
+        self.pack = pack
+        return True
+
+    def preload(self, images=(), sounds=(), workers=ASSET_LOADER_THREADS):
+        """
+        Decode several files in parallel and add them to the cache
+
+        Files are decoded on a thread pool; pixel format conversion still
+        happens on the calling thread since it needs the display. Later
+        get_image/get_sound calls for the same files are cache hits. Files
+        that fail to load are remembered like any other failed load.
+
+        Args:
+            images: Iterable of (path, convert) pairs, see get_image
+            sounds: Iterable of sound file paths
+            workers (int): Number of decoding threads
+
+        Returns:
+            list: Exceptions of the files that failed to load
+        """
+        errors = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            jobs = []
+            for path, convert in images:
+                key = (path, None, (False, False), convert)
+                if self._needs_load(key):
+                    jobs.append((key, convert, pool.submit(self._timed, pygame.image.load, path)))
+            for path in sounds:
+                key = ('sound', path)
+                if self._needs_load(key):
+                    jobs.append((key, None, pool.submit(self._timed, pygame.mixer.Sound, path)))
+
+            # Collect in submission order so the cache order is deterministic
+            for key, convert, future in jobs:
+                self.misses += 1
+                try:
+                    asset, seconds = future.result()
+                except (pygame.error, FileNotFoundError) as e:
+                    self.failed[key] = e
+                    errors.append(e)
+                    continue
+                start = time.perf_counter()
+                if convert == 'alpha':
+                    asset = asset.convert_alpha()
+                elif convert == 'opaque':
+                    asset = asset.convert()
+                self.load_times[key] = seconds + time.perf_counter() - start
+                self._store(key, asset)
+        return errors
+
+    def _needs_load(self, key):
+        """Check if an asset is neither cached, known to fail, nor available in the pack"""
+        if key in self.cache or key in self.failed:
+            return False
+        return self.pack is None or key not in self.pack
+
+    @staticmethod
+    def _timed(loader, path):
+        """Run a loader on a worker thread, returning the asset and the seconds it took"""
+        start = time.perf_counter()
+        asset = loader(path)
+        return asset, time.perf_counter() - start
+
+    def _build_image(self, path, size, flip, convert):
+        """Create an image variant, reusing the cached base image where possible"""
+        if flip != (False, False):
+            base = self.get_image(path, size, (False, False), convert)
+            return pygame.transform.flip(base, flip[0], flip[1])
+        if size is not None:
+            base = self.get_image(path, None, (False, False), convert)
+            return pygame.transform.scale(base, size)
+
+        image = pygame.image.load(path)
+        if convert == 'alpha':
+            image = image.convert_alpha()
+        elif convert == 'opaque':
+            image = image.convert()
+        return image
+
+    def _get(self, key, factory):
+        """Look up a key, creating and caching the asset on a miss"""
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return entry[0]
+
+        # Remember failed loads so missing files are not retried every call
+        if key in self.failed:
+            self.hits += 1
+            raise self.failed[key]
+
+        self.misses += 1
+        start = time.perf_counter()
+        asset = None
+        if self.pack is not None:
+            try:
+                asset = self.pack.load(key)
+            except (pygame.error, ValueError) as e:
+                print(f"Error loading {key_name(key)} from the asset pack: {e}")
+        try:
+            if asset is None:
+                asset = factory()
+        except (pygame.error, FileNotFoundError) as e:
+            self.failed[key] = e
+            raise
+        self.load_times[key] = time.perf_counter() - start
+
+        self._store(key, asset)
+        return asset
+
+    def _store(self, key, asset):
+        """Add a newly created asset to the cache"""
+        size = self._estimate_size(asset)
+        self.cache[key] = (asset, size)
+        self.used += size
+        self._evict()
+
+    def _estimate_size(self, asset):
+        """Approximate memory used by a Surface or Sound in bytes"""
+        if isinstance(asset, pygame.Surface):
+            return asset.get_width() * asset.get_height() * asset.get_bytesize()
+        if isinstance(asset, pygame.mixer.Sound):
+            mixer = pygame.mixer.get_init()
+            if mixer:
+                frequency, sample_format, channels = mixer
+                return int(asset.get_length() * frequency * channels * (abs(sample_format) // 8))
+        return 0
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits its budget"""
+        while self.used > self.budget and len(self.cache) > 1:
+            _, (_, size) = self.cache.popitem(last=False)
+            self.used -= size
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every cached asset"""
+        self.cache.clear()
+        self.failed.clear()
+        self.used = 0
+
+    def timing_report(self):
+        """
+        Describe where asset loading time went
+
+        Returns:
+            list: (description, seconds) for every asset created so far, slowest first
+        """
+        report = []
+        for key, seconds in self.load_times.items():
+            if key[0] in ('sound', 'generated'):
+                description = f"{key[0]} {key[1]}"
+            else:
+                path, size, flip, convert = key
+                description = path
+                if size is not None:
+                    description += f" {size[0]}x{size[1]}"
+                if flip != (False, False):
+                    description += " flipped"
+            report.append((description, seconds))
+        report.sort(key=lambda item: item[1], reverse=True)
+        return report
+
+    def stats(self):
+        """Return cache counters as a dictionary"""
+        return {
+            'entries': len(self.cache),
+            'bytes': self.used,
+            'budget': self.budget,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+# Shared instance used by the game modules
+assets = AssetManager()
@@ -0,0 +1,260 @@
+"""
+Asset pack builder and reader
+Bakes the images and sounds the game uses into one file holding their final
+pixel data (already scaled and flipped) and decoded PCM samples, so startup
+creates Surfaces and Sounds straight from the memory-mapped file without
+decoding JPEG/PNG/WAV.
+
+File layout (little-endian):
+    header    magic, version, entry count, mixer frequency, sample size, channels
+    index     entry count records of (kind, pixel format, width, height,
+              name length, data offset, data length) each followed by the name
+    data      raw pixel rows or PCM samples of every entry
+
+Entry names encode the AssetManager cache key, see key_name().
+
+Example:
+    python asset_pack.py assets/assets.pak
+"""
+
+import os
+import sys
+import mmap
+import struct
+import pygame
+from settings import (
+    screen_width, screen_height, tile_size, ASSET_PACK_PATH,
+    BACKGROUND_IMAGE_PATH, PLAYER_IMAGE_PATH, TILE_IMAGE_PATH, COIN_IMAGE_PATHS, COIN_SIZE,
+    SOUND_COIN, SOUND_JUMP, SOUND_LEVEL_COMPLETE
+)
+
+MAGIC = b'PKAP'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIihH')  # magic, version, reserved, count, frequency, size, channels
+ENTRY = struct.Struct('<BBHHHQI')
+
+KIND_IMAGE = 0
+KIND_SOUND = 1
+
+# Pixel formats in code order, as understood by pygame.image.tobytes/frombuffer
+PIXEL_FORMATS = ('RGBA', 'RGB')
+
+# Image variants baked into the pack, as (path, size, flip, convert) like AssetManager.get_image
+PACK_IMAGES = [
+    (BACKGROUND_IMAGE_PATH, (screen_width, screen_height), (False, False), 'opaque'),
+    (PLAYER_IMAGE_PATH, (50, 50), (False, False), 'alpha'),
+    (PLAYER_IMAGE_PATH, (50, 50), (True, False), 'alpha'),
+    (TILE_IMAGE_PATH, (tile_size, tile_size), (False, False), 'alpha'),
+] + [(path, (COIN_SIZE, COIN_SIZE), (False, False), 'alpha') for path in COIN_IMAGE_PATHS.values()]
+PACK_SOUNDS = [SOUND_COIN, SOUND_JUMP, SOUND_LEVEL_COMPLETE]
+
+
+def key_name(key):
+    """
+    Turn an AssetManager cache key into a pack entry name
+
+    Args:
+        key (tuple): ('sound', path), ('generated', name) or (path, size, flip, convert)
+
+    Returns:
+        str: Entry name
+    """
+    if key[0] in ('sound', 'generated'):
+        return f"{key[0]}|{key[1]}"
+    path, size, flip, convert = key
+    size_text = f"{size[0]}x{size[1]}" if size is not None else "-"
+    flip_text = f"{int(flip[0])}{int(flip[1])}"
+    return f"image|{path}|{size_text}|{flip_text}|{convert}"
+
+
+def build_pack(destination, images=PACK_IMAGES, sounds=PACK_SOUNDS):
+    """
+    Build an asset pack
+
+    Needs an initialized display and mixer; sounds are stored in the
+    mixer's current sample format. Missing source files are skipped.
+
+    Args:
+        destination (str): Output path
+        images: Iterable of (path, size, flip, convert)
+        sounds: Iterable of sound file paths
+
+    Returns:
+        list: Names of the entries written
+    """
+    # Private cache so building never touches the game's shared one
+    from asset_manager import AssetManager
+    manager = AssetManager(budget=float('inf'))
+
+    entries = []  # (kind, format code, width, height, name, data)
+    for path, size, flip, convert in images:
+        key = (path, size, tuple(flip), convert)
+        try:
+            image = manager.get_image(path, size, flip, convert)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Skipping {path}: {e}")
+            continue
+        pixel_format = 'RGB' if convert == 'opaque' else 'RGBA'
+        entries.append((
+            KIND_IMAGE, PIXEL_FORMATS.index(pixel_format), image.get_width(), image.get_height(),
+            key_name(key), pygame.image.tobytes(image, pixel_format)
+        ))
+
+    for path in sounds:
+        try:
+            sound = manager.get_sound(path)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Skipping {path}: {e}")
+            continue
+        entries.append((KIND_SOUND, 0, 0, 0, key_name(('sound', path)), sound.get_raw()))
+
+    # Data starts after the header and the whole index
+    names = [entry[4].encode('utf-8') for entry in entries]
+    offset = HEADER.size + sum(ENTRY.size + len(name) for name in names)
+    frequency, sample_size, channels = pygame.mixer.get_init() or (0, 0, 0)
+
+    parts = [HEADER.pack(MAGIC, VERSION, 0, len(entries), frequency, sample_size, channels)]
+    for (kind, pixel_format, width, height, _, data), name in zip(entries, names):
+        parts.append(ENTRY.pack(kind, pixel_format, width, height, len(name), offset, len(data)))
+        parts.append(name)
+        offset += len(data)
+    parts.extend(entry[5] for entry in entries)
+
+    with open(destination, 'wb') as f:
+        f.write(b''.join(parts))
+    return [entry[4] for entry in entries]
+
+
+class AssetPack:
+    """
+    Memory-mapped asset pack.
+    Entries are created on request from views into the mapped file; images
+    are only wrapped and converted to the display format, never decoded.
+    """
+
+    def __init__(self, path):
+        """
+        Map an asset pack
+
+        Args:
+            path (str): Path of the pack
+
+        Raises:
+            ValueError: If the file is not an asset pack of a supported version,
+                or its index or data are cut short or out of range
+        """
+        self.path = path
+        self.mtime = os.path.getmtime(path)
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise ValueError(f"Truncated asset pack: {path}")
+            self.mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, count, frequency, sample_size, channels = HEADER.unpack_from(self.mapping)
+        if magic != MAGIC or version != VERSION:
+            self.mapping.close()
+            raise ValueError(f"Not an asset pack (version {VERSION}): {path}")
+        self.mixer_format = (frequency, sample_size, channels)
+        try:
+            self.entries = self._read_index(count)
+        except ValueError:
+            self.mapping.close()
+            raise
+        self.view = memoryview(self.mapping)
+
+    def _read_index(self, count):
+        """
+        Read and check the entry index
+
+        Args:
+            count (int): Number of entries the header lists
+
+        Returns:
+            dict: name -> (kind, pixel format code, width, height, offset, length)
+
+        Raises:
+            ValueError: If an index record or entry data lies outside the file
+        """
+        size = len(self.mapping)
+        entries = {}
+        position = HEADER.size
+        for _ in range(count):
+            if position + ENTRY.size > size:
+                raise ValueError(f"Truncated asset pack index: {self.path}")
+            kind, pixel_format, width, height, name_length, offset, length = ENTRY.unpack_from(
+                self.mapping, position
+            )
+            position += ENTRY.size
+            if position + name_length > size:
+                raise ValueError(f"Truncated asset pack index: {self.path}")
+            name = self.mapping[position:position + name_length].decode('utf-8')
+            position += name_length
+
+            if offset + length > size:
+                raise ValueError(f"Truncated asset pack data for {name}: {self.path}")
+            if kind == KIND_IMAGE and (
+                    pixel_format >= len(PIXEL_FORMATS)
+                    or length != width * height * len(PIXEL_FORMATS[pixel_format])):
+                raise ValueError(f"Corrupt asset pack image {name}: {self.path}")
+            entries[name] = (kind, pixel_format, width, height, offset, length)
+        return entries
+
+    def __contains__(self, key):
+        return key_name(key) in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def is_stale(self, key):
+        """Check if the source file of an entry changed after the pack was built"""
+        path = key[1] if key[0] == 'sound' else key[0]
+        return os.path.exists(path) and os.path.getmtime(path) > self.mtime
+
+    def load(self, key):
+        """
+        Create the asset stored for a cache key
+
+        Args:
+            key (tuple): AssetManager cache key
+
+        Returns:
+            pygame.Surface or pygame.mixer.Sound, or None if the pack has no
+            usable entry (missing, outdated, or sound in another mixer format)
+        """
+        entry = self.entries.get(key_name(key))
+        if entry is None or self.is_stale(key):
+            return None
+        kind, pixel_format, width, height, offset, length = entry
+        data = self.view[offset:offset + length]
+
+        if kind == KIND_SOUND:
+            if pygame.mixer.get_init() != self.mixer_format:
+                return None
+            return pygame.mixer.Sound(buffer=data)
+
+        image = pygame.image.frombuffer(data, (width, height), PIXEL_FORMATS[pixel_format])
+        convert = key[3]
+        if convert == 'alpha':
+            return image.convert_alpha()
+        if convert == 'opaque':
+            return image.convert()
+        return image.copy()  # Don't keep the temporary buffer alive
+
+    def close(self):
+        """Release the memory mapping"""
+        self.view.release()
+        self.mapping.close()
+
+
+if __name__ == "__main__":
+    from headless import use_dummy_drivers
+    use_dummy_drivers()
+    pygame.init()
+    pygame.mixer.init()
+    pygame.display.set_mode((1, 1))
+
+    destination = sys.argv[1] if len(sys.argv) > 1 else ASSET_PACK_PATH
+    names = build_pack(destination)
+    print(f"{destination}: {len(names)} entries")
+    for name in names:
+        print(f"  {name}")
@@ -1,7 +1,23 @@
+import time
+from collections import Counter
 import pygame
-import os
-from settings import tile_size, TILE_MAPPING, COLOR_PLATFORM, COIN_VALUES, DEBUG
+from settings import (
+    tile_size, TILE_MAPPING, COLOR_PLATFORM, COIN_VALUES, DEBUG, TILE_IMAGE_PATH,
+    WORLD_STREAMING_MIN_CELLS, ENTITY_GRID_CELL_SIZE, TILE_LAYER_CHUNK_SIZE
+)
 from coin import coin
+from asset_manager import assets
+from spatial_grid import SpatialGrid, SolidGrid
+from enemy_system import EnemySystem
+from colliders import ColliderMap, collide_horizontal, collide_vertical
+from profiler import NULL_PROFILER
+from timestep import interpolate
+from level_compiler import CompiledLevel
+from coin_store import CoinStore
+from entity_pool import entity_pools
+from entity_store import LevelEntity, EntityList
+from level_loader import LevelLayout, render_tile_layer
+from world import ChunkedWorld, level_dimensions
 
 
 class Level:
@@ -10,197 +26,510 @@ class Level:
     and managing all game objects within a level.
     """
     
-    def __init__(self, level_data, player):
+    def __init__(self, level_data, player, profiler=None, defer_load=False, streaming=None, pools=None):
         """
         Initialize the level with data and player reference
         
         Args:
-            level_data: List of strings representing the level layout
+            level_data: List of strings representing the level layout,
+                a CompiledLevel or a preloaded LevelLayout
             player: Player object reference for collision handling
+            profiler: Optional FrameProfiler timing the collision passes
+            defer_load (bool): Don't build the level now, call load_step()
+                until it returns True instead
+            streaming (bool): Only create sprites for chunks near the player,
+                by default used for levels over WORLD_STREAMING_MIN_CELLS cells
+            pools (EntityPools): Where level objects are allocated from and
+                returned to, the shared entity_pools by default
         """
         # Store references
         self.level_data = level_data
         self.player = player
+        self.profiler = profiler or NULL_PROFILER
+        self.pools = pools or entity_pools
         
         # Create sprite groups
         self.tiles = pygame.sprite.Group()
         self.coins = pygame.sprite.Group()
         self.enemies = pygame.sprite.Group()
-        self.powerups = pygame.sprite.Group()
-        self.hazards = pygame.sprite.Group()
-        self.trampolines = pygame.sprite.Group()
-        self.finish_points = pygame.sprite.Group()
+        
+        # Non-moving objects are compact records sharing one image per type
+        self.powerups = EntityList()
+        self.hazards = EntityList()
+        self.trampolines = EntityList()
+        self.finish_points = EntityList()
+        
+        # Coin positions and values in array form for collision tests
+        self.coin_store = CoinStore()
+        
+        # Spatial index of the non-moving objects, used to cull drawing to the camera
+        self.entity_grid = SpatialGrid(ENTITY_GRID_CELL_SIZE)
+        
+        # Static tiles are pre-rendered into chunk surfaces, see _build_tile_layer
+        self.tile_layer = []  # list of (position, surface)
+        self.tile_layer_tiles = Counter()  # Chunk position -> tiles drawn into it
+        self.tile_layer_dirty = True
+        self.tile_layer_count = 0
+        
+        # Object created for each level cell, used to patch single cells
+        self.cell_objects = {}  # (col, row) -> sprite
+        self.object_cells = {}  # sprite -> (col, row)
         
         # Level state
         self.collected_coins = 0
         self.total_coins = 0
         self.level_complete = False
         
-        # Load the level from data
-        self.load_level()
+        # Level area in pixels, the camera stays inside it
+        columns, rows = level_dimensions(level_data)
+        self.pixel_rect = pygame.Rect(0, 0, columns * tile_size, rows * tile_size)
+        
+        # Per-cell wall flags, and the batched enemy patrol that reads them
+        self.solid_grid = SolidGrid(columns, rows)
+        self.enemy_system = EnemySystem(self.solid_grid, self.pixel_rect.width)
+        
+        # Walls merged into large collision rects, separate from the visual tiles
+        self.colliders = ColliderMap(self.solid_grid)
+        
+        # Large levels are streamed in chunks around the player
+        self.world = None
+        if not isinstance(level_data, LevelLayout):
+            if streaming is None:
+                streaming = columns * rows > WORLD_STREAMING_MIN_CELLS
+            if streaming:
+                self.world = ChunkedWorld(self, level_data)
+                self.total_coins = self.world.total_coins
+        
+        # Load the level from data, all at once or in time slices
+        self.loader = self._load_steps()
+        self.loaded = False
+        if not defer_load:
+            self.load_level()
     
     def load_level(self):
         """Parse level data and create game objects"""
-        for row_index, row in enumerate(self.level_data):
-            for col_index, tile_char in enumerate(row):
-                x = col_index * tile_size
-                y = row_index * tile_size
-                
-                # Process different tile types based on character
-                if tile_char == '#':
-                    # Wall/platform tile
-                    tile = Tile((x, y))
-                    self.tiles.add(tile)
-                
-                elif tile_char in ['c', 's', 'g', 'b']:  # Different coin types
-                    # Map tile characters to coin types
-                    coin_type = {
-                        'c': 'bronze',
-                        's': 'silver',
-                        'g': 'gold',
-                        'b': 'bronze'  # Backward compatibility with 'B'
-                    }.get(tile_char.lower(), 'silver')
-                    
-                    # Create coin at center of tile
-                    coin_pos = (x + tile_size // 2, y + tile_size // 2)
-                    coin = coin(coin_pos, coin_type)
-                    self.coins.add(coin)
-                    self.total_coins += 1
-                
-                elif tile_char == 'h':
-                    # Health powerup
-                    from powerup import HealthPowerup
-                    health = HealthPowerup((x + tile_size // 2, y + tile_size // 2))
-                    self.powerups.add(health)
-                
-                elif tile_char == 'w':
-                    # Water hazard
-                    from hazard import WaterHazard
-                    water = WaterHazard((x, y))
-                    self.hazards.add(water)
-                
-                elif tile_char == 't':
-                    # Trampoline
-                    from special_tile import Trampoline
-                    trampoline = Trampoline((x, y))
-                    self.trampolines.add(trampoline)
-                
-                elif tile_char == 'e':
-                    # Enemy
-                    from enemy import Enemy
-                    enemy = Enemy((x, y), self.tiles)
-                    self.enemies.add(enemy)
-                
-                elif tile_char == 'f':
-                    # Level finish point
-                    from special_tile import FinishPoint
-                    finish = FinishPoint((x, y))
-                    self.finish_points.add(finish)
-                
-                elif tile_char == 'p':
-                    # Player start position
-                    self.player.rect.topleft = (x, y)
-                    self.player.velocity.y = 0
+        for _ in self.loader:
+            pass
+        self.loaded = True
+    
+    def load_step(self, time_budget):
+        """
+        Continue a deferred load for a limited time
+        
+        Args:
+            time_budget (float): Seconds to spend loading before returning
+            
+        Returns:
+            bool: True once the level is completely loaded
+        """
+        deadline = time.perf_counter() + time_budget
+        for _ in self.loader:
+            if time.perf_counter() >= deadline:
+                return False
+        self.loaded = True
+        return True
+    
+    def _load_steps(self):
+        """Generator creating the level objects, yielding between small batches"""
+        level_data = self.level_data
+        
+        if self.world is not None:
+            # Only the chunks around the player start are created up front
+            if self.world.player_start is not None:
+                self.player.rect.topleft = self.world.player_start
+            self.world.update(self.player.rect.center)
+        
+        elif isinstance(level_data, LevelLayout):
+            # Preloaded layout, possibly with the tile layer already rendered
+            for index, pos in enumerate(level_data.walls):
+                self.add_tile(pos)
+                if index % 256 == 255:
+                    yield
+            for index, (tile_char, x, y) in enumerate(level_data.entities):
+                self.spawn(tile_char, x, y)
+                if index % 256 == 255:
+                    yield
+            if level_data.tile_layer is not None:
+                self.tile_layer = level_data.tile_layer
+                self._count_tile_layer_tiles()
+        
+        elif isinstance(level_data, CompiledLevel):
+            # Create game objects from the wall and entity tables
+            for index, (col_index, row_index) in enumerate(level_data.wall_positions()):
+                self.add_tile((col_index * tile_size, row_index * tile_size))
+                if index % 256 == 255:
+                    yield
+            for index, (tile_char, col_index, row_index) in enumerate(level_data.entities()):
+                self.spawn(tile_char, col_index * tile_size, row_index * tile_size)
+                if index % 256 == 255:
+                    yield
+            level_data.close()  # Everything has been read out of the mapping
+        
+        else:
+            for row_index, row in enumerate(level_data):
+                for col_index, tile_char in enumerate(row):
+                    self.spawn(tile_char, col_index * tile_size, row_index * tile_size)
+                yield
+        
+        # Merge the walls into collision rects now rather than on the first collision test
+        self.colliders.rebuild()
+    
+    def spawn(self, tile_char, x, y):
+        """
+        Create the game object for one level cell
+        
+        Args:
+            tile_char (str): Level character from TILE_MAPPING
+            x (int): Left edge of the cell in pixels
+            y (int): Top edge of the cell in pixels
+            
+        Returns:
+            The created sprite, or None if the cell has no object
+        """
+        sprite = self._create_object(tile_char, x, y)
+        if sprite is not None:
+            self._track(sprite, x, y)
+        return sprite
+    
+    def _track(self, sprite, x, y):
+        """Remember which cell an object was created for"""
+        cell = (x // tile_size, y // tile_size)
+        self.cell_objects[cell] = sprite
+        self.object_cells[sprite] = cell
+    
+    def _untrack(self, sprite):
+        """Forget the cell of a removed object"""
+        cell = self.object_cells.pop(sprite, None)
+        if cell is not None and self.cell_objects.get(cell) is sprite:
+            del self.cell_objects[cell]
+    
+    def _create_object(self, tile_char, x, y):
+        """Create the sprite for a level character, see spawn()"""
+        # Process different tile types based on character
+        if tile_char == '#':
+            # Wall/platform tile
+            return self.add_tile((x, y))
+        
+        elif tile_char in ['c', 's', 'g', 'b']:  # Different coin types
+            # Map tile characters to coin types
+            coin_type = {
+                'c': 'bronze',
+                's': 'silver',
+                'g': 'gold',
+                'b': 'bronze'  # Backward compatibility with 'B'
+            }.get(tile_char.lower(), 'silver')
+            
+            # Create coin at center of tile
+            coin_pos = (x + tile_size // 2, y + tile_size // 2)
+            new_coin = self.pools.acquire(coin, coin_pos, coin_type)
+            self.coins.add(new_coin)
+            self.coin_store.add(new_coin, COIN_VALUES[coin_type])
+            if self.world is None:  # Streamed levels count all coins up front
+                self.total_coins += 1
+            self.entity_grid.insert(new_coin)
+            return new_coin
+        
+        elif tile_char == 'h':
+            # Health powerup
+            health = self.pools.acquire(HealthPowerup, (x + tile_size // 2, y + tile_size // 2))
+            self.powerups.add(health)
+            self.entity_grid.insert(health)
+            return health
+        
+        elif tile_char == 'w':
+            # Water hazard
+            water = self.pools.acquire(WaterHazard, (x, y))
+            self.hazards.add(water)
+            self.entity_grid.insert(water)
+            return water
+        
+        elif tile_char == 't':
+            # Trampoline
+            trampoline = self.pools.acquire(Trampoline, (x, y))
+            self.trampolines.add(trampoline)
+            self.entity_grid.insert(trampoline)
+            return trampoline
+        
+        elif tile_char == 'e':
+            # Enemy
+            enemy = self.pools.acquire(Enemy, (x, y))
+            self.enemies.add(enemy)
+            self.enemy_system.add(enemy)
+            return enemy
+        
+        elif tile_char == 'f':
+            # Level finish point
+            finish = self.pools.acquire(FinishPoint, (x, y))
+            self.finish_points.add(finish)
+            self.entity_grid.insert(finish)
+            return finish
+        
+        elif tile_char == 'p':
+            # Player start position
+            self.player.rect.topleft = (x, y)
+            self.player.velocity.y = 0
+        
+        return None
+    
+    def add_tile(self, pos):
+        """
+        Add a solid tile to the level
+        
+        Args:
+            pos (tuple): Top-left position (x, y) of the tile
+            
+        Returns:
+            Tile: The new tile
+        """
+        layer_ready = self.tile_layer_ready()
+        tile = self.pools.acquire(Tile, pos)
+        self.tiles.add(tile)
+        self._track(tile, pos[0], pos[1])
+        self.solid_grid.set_solid(pos)
+        self.colliders.mark_dirty(pos)
+        self._update_tile_layer(pos, True, layer_ready)
+        return tile
+    
+    def remove_tile(self, tile):
+        """
+        Remove a solid tile from the level
+        
+        Args:
+            tile (Tile): Tile previously added to the level
+        """
+        layer_ready = self.tile_layer_ready()
+        pos = tile.rect.topleft
+        self.solid_grid.set_solid(pos, False)
+        self.colliders.mark_dirty(pos)
+        self._untrack(tile)
+        self.pools.release(tile)
+        self._update_tile_layer(pos, False, layer_ready)
+    
+    def remove_object(self, sprite):
+        """
+        Remove any object created by spawn() from the level
+        
+        Args:
+            sprite: Sprite returned by spawn()
+        """
+        if isinstance(sprite, Tile):
+            self.remove_tile(sprite)
+            return
+        if sprite in self.coins:
+            self.coin_store.remove(sprite)
+        if sprite in self.enemies:
+            self.enemy_system.remove(sprite)
+        else:
+            self.entity_grid.remove(sprite)
+        self._untrack(sprite)
+        self._discard(sprite)
+    
+    def _discard(self, sprite):
+        """Return a removed object to its pool"""
+        self.pools.release(sprite)
+    
+    def release(self):
+        """
+        Tear the level down, returning its objects to the entity pools
+        The level must not be used afterwards.
+        """
+        for sprite in list(self.object_cells):
+            self._discard(sprite)
+        self.object_cells.clear()
+        self.cell_objects.clear()
+        
+        for group in (self.tiles, self.coins, self.enemies, self.powerups,
+                      self.hazards, self.trampolines, self.finish_points):
+            group.empty()
+        self.coin_store = CoinStore()
+        self.entity_grid.clear()
+        self.tile_layer = []
+        self.tile_layer_tiles.clear()
+        self.world = None
+        if isinstance(self.level_data, CompiledLevel):
+            self.level_data.close()  # Streamed levels read from it until now
+    
+    def patch(self, level_data, changes):
+        """
+        Apply an edit of the level data in place
+        Only the objects of changed cells are replaced; the solid grid,
+        colliders and tile layer are updated for those cells alone.
+        
+        Args:
+            level_data (list): New level rows, the same size as the current ones
+            changes (list): (col, row, tile_char) of every changed cell
+        """
+        if isinstance(self.level_data, CompiledLevel):
+            self.level_data.close()
+        self.level_data = level_data
+        if self.world is not None:
+            self.world.patch(level_data, changes)
+            self.total_coins = self.world.total_coins
+            return
+        
+        # add_tile() and remove_tile() patch the tile layer cell by cell
+        for col, row, tile_char in changes:
+            sprite = self.cell_objects.get((col, row))
+            if sprite is not None:
+                if sprite in self.coins:
+                    self.total_coins -= 1
+                    if sprite.is_collected:
+                        self.collected_coins -= 1
+                self.remove_object(sprite)
+            
+            # A moved start position applies the next time the level starts
+            if tile_char != 'p':
+                self.spawn(tile_char, col * tile_size, row * tile_size)
+    
+    def tile_layer_ready(self):
+        """Whether the pre-rendered tile layer matches the current tiles"""
+        return not self.tile_layer_dirty and self.tile_layer_count == len(self.tiles)
+    
+    def _tile_layer_chunks(self, pos):
+        """Positions of the tile layer chunks a tile cell overlaps"""
+        chunk_size = TILE_LAYER_CHUNK_SIZE
+        left, top = pos
+        # A cell can straddle chunk borders if the chunk size is not a tile multiple
+        return [
+            (chunk_x * chunk_size, chunk_y * chunk_size)
+            for chunk_y in range(top // chunk_size, (top + tile_size - 1) // chunk_size + 1)
+            for chunk_x in range(left // chunk_size, (left + tile_size - 1) // chunk_size + 1)
+        ]
+    
+    def _count_tile_layer_tiles(self):
+        """Mark the tile layer as matching the current tiles and count the tiles in each chunk"""
+        self.tile_layer_tiles = Counter(
+            chunk for tile in self.tiles for chunk in self._tile_layer_chunks(tile.rect.topleft)
+        )
+        self.tile_layer_dirty = False
+        self.tile_layer_count = len(self.tiles)
+    
+    def _update_tile_layer(self, pos, solid, layer_ready):
+        """
+        Draw or clear one tile cell in the pre-rendered tile layer
+        Only the chunks under the cell change; a chunk is created with its
+        first tile and dropped with its last one.
+        
+        Args:
+            pos (tuple): Top-left position (x, y) of the tile
+            solid (bool): Whether a tile was added or removed
+            layer_ready (bool): tile_layer_ready() before the change, the
+                layer is left for rebuilding when it was already stale
+        """
+        if not layer_ready:
+            self.invalidate_tile_layer()
+            return
+        
+        chunk_size = TILE_LAYER_CHUNK_SIZE
+        counts = self.tile_layer_tiles
+        chunks = dict(self.tile_layer)
+        for chunk_pos in self._tile_layer_chunks(pos):
+            chunk = chunks.get(chunk_pos)
+            local = pygame.Rect(pos[0] - chunk_pos[0], pos[1] - chunk_pos[1], tile_size, tile_size)
+            if solid:
+                if chunk is None:
+                    chunk = pygame.Surface((chunk_size, chunk_size), pygame.SRCALPHA)
+                    self.tile_layer.append((chunk_pos, chunk))
+                chunk.fill((0, 0, 0, 0), local)
+                chunk.blit(Tile.load_image(), local)
+                counts[chunk_pos] += 1
+            elif chunk is not None:
+                counts[chunk_pos] -= 1
+                if counts[chunk_pos] > 0:
+                    chunk.fill((0, 0, 0, 0), local)
+                else:
+                    del counts[chunk_pos]
+                    self.tile_layer.remove((chunk_pos, chunk))
+        self.tile_layer_count = len(self.tiles)
+    
+    def invalidate_tile_layer(self):
+        """Mark the pre-rendered tile layer for rebuilding on the next draw"""
+        self.tile_layer_dirty = True
+    
+    def _build_tile_layer(self):
+        """Render all static tiles into chunk surfaces so drawing them is one blit per chunk"""
+        self.tile_layer = render_tile_layer((tile.image, tile.rect) for tile in self.tiles)
+        self._count_tile_layer_tiles()
+    
+    def get_solid_rects(self, rect):
+        """
+        Find the wall collision rects overlapping a rectangle
+        
+        Args:
+            rect (pygame.Rect): Area to test
+            
+        Returns:
+            list: Merged wall rects overlapping the given area
+        """
+        return self.colliders.query(rect)
     
     def check_coin_collisions(self):
         """Check for collisions between player and coins"""
-        collected_value = 0
-        current_time = pygame.time.get_ticks()
+        # One vectorized overlap test over all coins
+        indices, collected_value = self.coin_store.collide(self.player.rect)
+        if not indices:
+            return 0
         
-        # Check each coin for collision with player
-        for coin in self.coins:
-            if not coin.is_collected and coin.rect.colliderect(self.player.rect):
-                # Collect the coin and get its value
-                value = coin.collect(current_time)
-                collected_value += value
-                self.collected_coins += 1
+        # Start the collect animation on the sprites that were hit
+        current_time = pygame.time.get_ticks()
+        sprites = self.coin_store.sprites
+        for index in indices:
+            sprites[index].collect(current_time)
+        self.collected_coins += len(indices)
         
         return collected_value
     
     def check_player_collisions(self):
         """Handle all player collisions with level objects"""
-        self._check_horizontal_collisions()
-        self._check_vertical_collisions()
+        profiler = self.profiler
+        with profiler.section('collide_horizontal'):
+            self._check_horizontal_collisions()
+        with profiler.section('collide_vertical'):
+            self._check_vertical_collisions()
         
         # Check special tile interactions
-        self._check_trampoline_collisions()
-        self._check_hazard_collisions()
-        self._check_powerup_collisions()
-        self._check_finish_point_collisions()
+        with profiler.section('collide_special'):
+            # Only objects near the player can touch it
+            nearby = self.entity_grid.query(self.player.collision_rect)
+            if nearby:
+                self._check_trampoline_collisions([e for e in nearby if e in self.trampolines])
+                self._check_hazard_collisions([e for e in nearby if e in self.hazards])
+                self._check_powerup_collisions([e for e in nearby if e in self.powerups])
+                self._check_finish_point_collisions([e for e in nearby if e in self.finish_points])
     
     def _check_horizontal_collisions(self):
         """Handle horizontal collisions with tiles"""
-        player = self.player
-        player.collision_rect.x += player.velocity.x
-        
-        # Check collisions with tiles
-        for tile in self.tiles:
-            if tile.rect.colliderect(player.collision_rect):
-                # Handle collision based on direction
-                if player.velocity.x > 0:  # Moving right
-                    player.collision_rect.right = tile.rect.left
-                elif player.velocity.x < 0:  # Moving left
-                    player.collision_rect.left = tile.rect.right
-                
-                # Stop horizontal movement
-                player.velocity.x = 0
-        
-        # Update player rect to match collision rect
-        player.rect.centerx = player.collision_rect.centerx
+        collide_horizontal(self.player, self.get_solid_rects)
     
     def _check_vertical_collisions(self):
-        """Handle vertical collisions with tiles"""
-        player = self.player
-        # Apply gravity first
-        player.velocity.y += player.acceleration.y
-        
-        # Apply vertical velocity
-        player.collision_rect.y += player.velocity.y
-        
-        # Reset ground state
-        player.on_ground = False
-        
-        # Check collisions with tiles
-        for tile in self.tiles:
-            if tile.rect.colliderect(player.collision_rect):
-                # Handle collision based on direction
-                if player.velocity.y > 0:  # Falling
-                    player.collision_rect.bottom = tile.rect.top
-                    player.velocity.y = 0
-                    player.on_ground = True  # Mark as on ground when landing
-                    player.jumping = False
-                elif player.velocity.y < 0:  # Jumping/moving up
-                    player.collision_rect.top = tile.rect.bottom
-                    player.velocity.y = 0  # Stop upward movement
-        
-        # Update player rect to match collision rect
-        player.rect.bottom = player.collision_rect.bottom
-    
-    def _check_trampoline_collisions(self):
+        """Handle vertical collisions with tiles, applying gravity first"""
+        collide_vertical(self.player, self.get_solid_rects)
+    
+    def _check_trampoline_collisions(self, trampolines):
         """Check for collisions with trampolines"""
-        for trampoline in self.trampolines:
+        for trampoline in trampolines:
             if self.player.collision_rect.colliderect(trampoline.rect) and self.player.velocity.y > 0:
                 # Bounce the player
                 self.player.velocity.y = -20  # Strong upward force
                 trampoline.activate()  # Trigger trampoline animation
     
-    def _check_hazard_collisions(self):
+    def _check_hazard_collisions(self, hazards):
         """Check for collisions with hazards"""
-        for hazard in self.hazards:
+        for hazard in hazards:
             if self.player.collision_rect.colliderect(hazard.rect):
                 # Apply damage to player
                 hazard.apply_effect(self.player)
     
-    def _check_powerup_collisions(self):
+    def _check_powerup_collisions(self, powerups):
         """Check for collisions with powerups"""
-        for powerup in self.powerups:
+        for powerup in powerups:
             if self.player.collision_rect.colliderect(powerup.rect) and not powerup.collected:
                 # Apply powerup effect
                 powerup.apply(self.player)
     
-    def _check_finish_point_collisions(self):
+    def _check_finish_point_collisions(self, finish_points):
         """Check if player has reached the finish point"""
-        for finish in self.finish_points:
+        for finish in finish_points:
             if self.player.collision_rect.colliderect(finish.rect):
                 self.level_complete = True
     
@@ -212,46 +541,130 @@ class Level:
     
     def update(self):
         """Update all level elements and check collisions"""
+        # Stream chunks in and out around the player
+        if self.world is not None:
+            self.world.update(self.player.rect.center)
+        
+        # Remember where enemies were for interpolated drawing
+        for enemy in self.enemies:
+            enemy.previous_pos = enemy.rect.topleft
+        
         # Update all sprite groups
-        self.coins.update(pygame.time.get_ticks())
-        self.enemies.update()
-        self.powerups.update()
-        self.hazards.update()
-        self.trampolines.update()
+        now = pygame.time.get_ticks()
+        self.coins.update(now)
+        self.enemy_system.update()
+        for trampoline in self.trampolines:
+            if trampoline.active:
+                trampoline.update(now)
         
         # Check collisions
         self.check_player_collisions()
-        collected_value = self.check_coin_collisions()
+        with self.profiler.section('collide_coins'):
+            collected_value = self.check_coin_collisions()
         
         # Return coin value for score updating in main game
         return collected_value
     
-    def draw(self, surface):
-        """Draw all level elements to the screen"""
-        # Draw all sprite groups
-        self.tiles.draw(surface)
+    def draw(self, surface, alpha=1.0, camera=None):
+        """
+        Draw all level elements to the screen
+        
+        Args:
+            surface (pygame.Surface): Surface to draw on
+            alpha (float): Interpolation factor between the previous and current tick
+            camera (Camera): Viewport to offset by and cull against, None draws everything
+        """
+        self.draw_static(surface, camera)
+        self.draw_dynamic(surface, alpha, camera)
+        
+        # Debug drawing
+        if DEBUG:
+            self._draw_debug(surface, camera)
+    
+    def draw_static(self, surface, camera=None):
+        """Draw the elements that never move (the pre-rendered tile layer)"""
+        # Rebuild the cached layer if the tile set changed
+        if self.tile_layer_dirty or self.tile_layer_count != len(self.tiles):
+            self._build_tile_layer()
+        
+        if camera is None:
+            surface.blits([(chunk, pos) for pos, chunk in self.tile_layer], False)
+            return
+        
+        # Only chunks overlapping the viewport
+        view = camera.rect
+        dx, dy = camera.offset
+        surface.blits([
+            (chunk, (pos[0] + dx, pos[1] + dy))
+            for pos, chunk in self.tile_layer
+            if view.colliderect(chunk.get_rect(topleft=pos))
+        ], False)
+    
+    def draw_dynamic(self, surface, alpha=1.0, camera=None):
+        """
+        Draw the elements that can move, animate or disappear
+        
+        Args:
+            surface (pygame.Surface): Surface to draw on
+            alpha (float): Interpolation factor between the previous and current tick
+            camera (Camera): Viewport to offset by and cull against, None draws everything
+            
+        Returns:
+            list: Rectangles that were drawn to
+        """
+        if camera is None:
+            dx = dy = 0
+            specials = [*self.trampolines, *self.hazards, *self.finish_points]
+            powerups = list(self.powerups)
+            coins = self.coins.sprites()
+            enemies = self.enemies.sprites()
+        else:
+            # Look up what is on screen in the entity grid, then keep the draw order
+            dx, dy = camera.offset
+            view = camera.rect
+            specials = []
+            powerups = []
+            coins = []
+            for sprite in self.entity_grid.query(view):
+                if not sprite.alive():
+                    continue  # Removed itself from its group, e.g. a used powerup
+                if sprite in self.coins:
+                    coins.append(sprite)
+                elif sprite in self.powerups:
+                    powerups.append(sprite)
+                else:
+                    specials.append(sprite)
+            enemies = [enemy for enemy in self.enemies if view.colliderect(enemy.rect)]
+        
+        rects = []
         
         # Draw special tiles
-        self.trampolines.draw(surface)
-        self.hazards.draw(surface)
-        self.finish_points.draw(surface)
+        rects.extend(surface.blits([(sprite.image, sprite.rect.move(dx, dy)) for sprite in specials]))
         
-        # Draw enemies and powerups
-        self.enemies.draw(surface)
-        self.powerups.draw(surface)
+        # Enemies move every tick, so draw them between their last two positions
+        blits = []
+        for enemy in enemies:
+            x, y = interpolate(enemy.previous_pos, enemy.rect.topleft, alpha)
+            blits.append((enemy.image, (x + dx, y + dy)))
+        rects.extend(surface.blits(blits))
+        rects.extend(surface.blits([(sprite.image, sprite.rect.move(dx, dy)) for sprite in powerups]))
         
-        # Draw coins last (on top)
-        for coin in self.coins:
-            coin.draw(surface)
+        # Draw coins last (on top), offset into screen space
+        offset = (dx, dy)
+        rects.extend(coin.draw(surface, offset) for coin in coins)
         
-        # Debug drawing
-        if DEBUG:
-            self._draw_debug(surface)
+        return rects
     
-    def _draw_debug(self, surface):
+    def _draw_debug(self, surface, camera=None):
         """Draw debug information"""
-        for tile in self.tiles:
-            pygame.draw.rect(surface, (255, 0, 0), tile.rect, 1)
+        if camera is None:
+            walls = self.get_solid_rects(self.pixel_rect)
+            dx = dy = 0
+        else:
+            walls = self.get_solid_rects(camera.rect)
+            dx, dy = camera.offset
+        for wall in walls:
+            pygame.draw.rect(surface, (255, 0, 0), wall.move(dx, dy), 1)
 
 
 class Tile(pygame.sprite.Sprite):
@@ -266,23 +679,26 @@ class Tile(pygame.sprite.Sprite):
         """
         super().__init__()
         
-        # Try to load the tile image
-        image_path = 'assets/images/tiles/ground.png'
-        try:
-            if os.path.exists(image_path):
-                self.image = pygame.image.load(image_path).convert_alpha()
-                self.image = pygame.transform.scale(self.image, (tile_size, tile_size))
-            else:
-                # Create fallback tile if image not found
-                self.image = self._create_fallback_tile()
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"Error loading tile image: {e}")
-            self.image = self._create_fallback_tile()
+        # All tiles share one cached image
+        self.image = self.load_image()
         
         # Set up the tile's rectangle
         self.rect = self.image.get_rect(topleft=pos)
     
-    def _create_fallback_tile(self):
+    def reset(self, pos):
+        """Reuse a pooled tile at a new position"""
+        self.rect.topleft = pos
+    
+    @staticmethod
+    def load_image():
+        """Get the shared tile image, or the shared fallback if it cannot be loaded"""
+        try:
+            return assets.get_image(TILE_IMAGE_PATH, (tile_size, tile_size))
+        except (pygame.error, FileNotFoundError):
+            return assets.get_surface('tile_fallback', Tile._create_fallback_tile)
+    
+    @staticmethod
+    def _create_fallback_tile():
         """Create a simple colored square as fallback"""
         surface = pygame.Surface((tile_size, tile_size))
         surface.fill(COLOR_PLATFORM)
@@ -295,13 +711,22 @@ class Tile(pygame.sprite.Sprite):
 # These are placeholder classes that would be implemented in separate files
 # I'm including them to show how they'd integrate with the level class
 
-class HealthPowerup(pygame.sprite.Sprite):
+class HealthPowerup(LevelEntity):
     """Placeholder for a health powerup"""
+    __slots__ = ('collected',)
+    
     def __init__(self, pos):
-        super().__init__()
-        self.image = pygame.Surface((20, 20))
-        self.image.fill((0, 255, 0))  # Green for health
-        self.rect = self.image.get_rect(center=pos)
+        super().__init__(self.shared_image().get_rect(center=pos))
+        self.collected = False
+    
+    @staticmethod
+    def create_image():
+        image = pygame.Surface((20, 20))
+        image.fill((0, 255, 0))  # Green for health
+        return image
+    
+    def reset(self, pos):
+        self.rect.center = pos
         self.collected = False
     
     def apply(self, player):
@@ -309,60 +734,71 @@ class HealthPowerup(pygame.sprite.Sprite):
             player.health = min(player.health + 25, 100)
             self.collected = True
             self.kill()
-    
-    def update(self):
-        pass
 
 
-class WaterHazard(pygame.sprite.Sprite):
+class WaterHazard(LevelEntity):
     """Placeholder for a water hazard"""
+    __slots__ = ()
+    
     def __init__(self, pos):
-        super().__init__()
-        self.image = pygame.Surface((tile_size, tile_size//2))
-        self.image.fill((0, 0, 255, 128))  # Semi-transparent blue
-        self.rect = self.image.get_rect(topleft=(pos[0], pos[1] + tile_size//2))
+        super().__init__(self.shared_image().get_rect(topleft=(pos[0], pos[1] + tile_size//2)))
+    
+    @staticmethod
+    def create_image():
+        image = pygame.Surface((tile_size, tile_size//2))
+        image.fill((0, 0, 255, 128))  # Semi-transparent blue
+        return image
+    
+    def reset(self, pos):
+        self.rect.topleft = (pos[0], pos[1] + tile_size//2)
     
     def apply_effect(self, player):
         # Slow down the player in water
         player.velocity.x *= 0.9
-    
-    def update(self):
-        pass
 
 
 class Enemy(pygame.sprite.Sprite):
-    """Placeholder for an enemy"""
-    def __init__(self, pos, obstacles):
+    """Placeholder for an enemy, moved and turned around by the level's EnemySystem"""
+    def __init__(self, pos):
         super().__init__()
-        self.image = pygame.Surface((30, 30))
-        self.image.fill((255, 0, 0))  # Red for enemy
+        
+        # All enemies share one cached image
+        self.image = assets.get_surface('enemy', self.create_image)
         self.rect = self.image.get_rect(topleft=pos)
         self.velocity = pygame.Vector2(2, 0)  # Basic horizontal movement
-        self.obstacles = obstacles
         self.direction = 1  # 1 for right, -1 for left
+        self.previous_pos = None  # Position after the previous tick
     
-    def update(self):
-        # Simple left-right movement
-        self.rect.x += self.velocity.x * self.direction
-        
-        # Check for collisions with obstacles
-        for obstacle in self.obstacles:
-            if self.rect.colliderect(obstacle.rect):
-                self.direction *= -1  # Reverse direction
-                break
-        
-        # Check for edges
-        if self.rect.left < 0 or self.rect.right > pygame.display.get_surface().get_width():
-            self.direction *= -1
+    @staticmethod
+    def create_image():
+        image = pygame.Surface((30, 30))
+        image.fill((255, 0, 0))  # Red for enemy
+        return image
+    
+    def reset(self, pos):
+        self.rect.topleft = pos
+        self.velocity.update(2, 0)
+        self.direction = 1
+        self.previous_pos = None
 
 
-class Trampoline(pygame.sprite.Sprite):
+class Trampoline(LevelEntity):
     """Placeholder for a trampoline"""
+    __slots__ = ('active', 'activation_time')
+    
     def __init__(self, pos):
-        super().__init__()
-        self.image = pygame.Surface((tile_size, tile_size//2))
-        self.image.fill((255, 165, 0))  # Orange for trampoline
-        self.rect = self.image.get_rect(topleft=pos)
+        super().__init__(self.shared_image().get_rect(topleft=pos))
+        self.active = False
+        self.activation_time = 0
+    
+    @staticmethod
+    def create_image():
+        image = pygame.Surface((tile_size, tile_size//2))
+        image.fill((255, 165, 0))  # Orange for trampoline
+        return image
+    
+    def reset(self, pos):
+        self.rect.topleft = pos
         self.active = False
         self.activation_time = 0
     
@@ -371,16 +807,24 @@ class Trampoline(pygame.sprite.Sprite):
         self.activation_time = pygame.time.get_ticks()
         # In a full implementation, you would trigger animation here
     
-    def update(self):
+    def update(self, now):
         # Reset after animation
-        if self.active and pygame.time.get_ticks() - self.activation_time > 500:
+        if self.active and now - self.activation_time > 500:
             self.active = False
 
 
-class FinishPoint(pygame.sprite.Sprite):
+class FinishPoint(LevelEntity):
     """Placeholder for level finish point"""
+    __slots__ = ()
+    
     def __init__(self, pos):
-        super().__init__()
-        self.image = pygame.Surface((tile_size, tile_size))
-        self.image.fill((255, 215, 0))  # Gold for finish
-        self.rect = self.image.get_rect(topleft=pos)
\ No newline at end of file
+        super().__init__(self.shared_image().get_rect(topleft=pos))
+    
+    @staticmethod
+    def create_image():
+        image = pygame.Surface((tile_size, tile_size))
+        image.fill((255, 215, 0))  # Gold for finish
+        return image
+    
+    def reset(self, pos):
+        self.rect.topleft = pos
@@ -0,0 +1,160 @@
+import pygame
+from settings import SOUND_EFFECTS, AUDIO_CHANNEL_GROUPS, SFX_VOLUME
+from asset_manager import assets
+
+
+class AudioManager:
+    """
+    Central playback of sound effects.
+    Each channel group owns a fixed set of reserved mixer channels, so one
+    kind of sound can never take all channels. Sounds are loaded once,
+    limited to a number of simultaneous voices, rate limited by a cooldown,
+    and every request made during a frame is merged into one playback when
+    flush() is called.
+    """
+
+    def __init__(self, effects=SOUND_EFFECTS, groups=AUDIO_CHANNEL_GROUPS, volume=SFX_VOLUME):
+        """
+        Args:
+            effects (dict): name -> (path, group, max voices, cooldown in ms)
+            groups (dict): Channel group name -> number of reserved channels
+            volume (float): Volume of every effect, 0.0 to 1.0
+        """
+        self.effects = effects
+        self.groups = groups
+        self.volume = volume
+
+        self.channels = {}  # group -> list of pygame.mixer.Channel
+        self.sounds = {}  # name -> pygame.mixer.Sound, or None if it failed to load
+        self.last_played = {}  # name -> ticks of the last playback
+        self.pending = {}  # name -> None, requests since the last flush in order
+
+        # Statistics
+        self.played = 0
+        self.merged = 0
+        self.dropped = 0
+
+    @property
+    def initialized(self):
+        """Whether init() ran and the mixer is available"""
+        return bool(self.channels)
+
+    def init(self):
+        """
+        Reserve the mixer channels of every group
+        Call after pygame.mixer.init(); until then play() does nothing.
+        """
+        if not pygame.mixer.get_init():
+            return
+        total = sum(self.groups.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        # Reserved channels are never picked by Sound.play() elsewhere
+        pygame.mixer.set_reserved(total)
+
+        self.channels = {}
+        index = 0
+        for group, count in self.groups.items():
+            self.channels[group] = [pygame.mixer.Channel(index + offset) for offset in range(count)]
+            index += count
+
+    def get_sound(self, name):
+        """
+        Get an effect's Sound, loading it on first use
+        Startup sounds are already decoded by AssetManager.preload, the
+        rest (e.g. level_complete) are decoded here when first played.
+
+        Args:
+            name (str): Key of the effects table
+
+        Returns:
+            pygame.mixer.Sound: The shared cached sound, or None if it failed to load;
+            its volume is left alone, playback sets the channel volume
+        """
+        if name not in self.sounds:
+            try:
+                sound = assets.get_sound(self.effects[name][0])
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Error loading sounds: {e}")
+                sound = None
+            self.sounds[name] = sound
+        return self.sounds[name]
+
+    def play(self, name):
+        """
+        Request an effect, it starts on the next flush()
+
+        Args:
+            name (str): Key of the effects table
+        """
+        if not self.initialized:
+            return
+        if name in self.pending:
+            self.merged += 1
+            return
+        self.pending[name] = None
+
+    def flush(self, now=None):
+        """
+        Start the effects requested since the last flush
+
+        Args:
+            now (int): Current time in ms, defaults to pygame.time.get_ticks()
+        """
+        if not self.pending:
+            return
+        if now is None:
+            now = pygame.time.get_ticks()
+
+        for name in self.pending:
+            self._start(name, now)
+        self.pending.clear()
+
+    def _start(self, name, now):
+        """Play one effect if its cooldown, voice limit and group allow it"""
+        path, group, max_voices, cooldown = self.effects[name]
+        last = self.last_played.get(name)
+        if last is not None and now - last < cooldown:
+            self.dropped += 1
+            return
+
+        sound = self.get_sound(name)
+        if sound is None:
+            return
+
+        free = None
+        voices = 0
+        for channel in self.channels[group]:
+            if not channel.get_busy():
+                if free is None:
+                    free = channel
+            elif channel.get_sound() is sound:
+                voices += 1
+        if voices >= max_voices or free is None:
+            self.dropped += 1
+            return
+
+        free.play(sound)
+        free.set_volume(self.volume)  # After play(), which resets the channel volume
+        self.last_played[name] = now
+        self.played += 1
+
+    def stop(self):
+        """Stop all effects and forget pending requests"""
+        for channels in self.channels.values():
+            for channel in channels:
+                channel.stop()
+        self.pending.clear()
+
+    def stats(self):
+        """Return playback counters as a dictionary"""
+        return {
+            'played': self.played,
+            'merged': self.merged,
+            'dropped': self.dropped,
+            'loaded': sum(1 for sound in self.sounds.values() if sound is not None),
+        }
+
+
+# Shared instance used by the game modules
+audio = AudioManager()
@@ -0,0 +1,207 @@
+"""
+Benchmark suite for the level and player hot paths
+Generates synthetic levels of increasing size and density and times each
+hot path separately, writing the results as JSON.
+
+Example:
+    python benchmark.py --sizes 25x19,100x50,200x100 --densities 0.1,0.3 --output bench.json
+"""
+
+import json
+import time
+import random
+import argparse
+import platform
+import pygame
+from headless import use_dummy_drivers
+
+DEFAULT_SIZES = [(25, 19), (100, 50), (200, 100), (400, 200)]
+DEFAULT_DENSITIES = [0.1, 0.3]
+
+# Relative frequency of each entity among the non-wall cells that get one
+ENTITY_WEIGHTS = {
+    'c': 8,
+    's': 4,
+    'g': 2,
+    'b': 2,
+    'e': 1,
+    'w': 1,
+    't': 1,
+}
+
+
+def generate_level(width, height, density, seed=0):
+    """
+    Generate a synthetic level grid
+
+    Args:
+        width (int): Number of columns
+        height (int): Number of rows
+        density (float): Fraction of interior cells that are walls;
+            the same fraction again is filled with entities
+        seed (int): Random seed so runs are comparable
+
+    Returns:
+        list: Level rows using the TILE_MAPPING characters
+    """
+    rng = random.Random(seed)
+    chars = list(ENTITY_WEIGHTS)
+    weights = list(ENTITY_WEIGHTS.values())
+
+    rows = ['#' * width]
+    for _ in range(height - 2):
+        row = ['#']
+        for _ in range(width - 2):
+            roll = rng.random()
+            if roll < density:
+                row.append('#')
+            elif roll < density * 2:
+                row.append(rng.choices(chars, weights)[0])
+            else:
+                row.append(' ')
+        row.append('#')
+        rows.append(''.join(row))
+    rows.append('#' * width)
+    return rows
+
+
+def time_call(func, repeat):
+    """
+    Time repeated calls of a function
+
+    Args:
+        func: Callable taking no arguments
+        repeat (int): Number of calls
+
+    Returns:
+        dict: Mean, minimum and maximum call time in seconds
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return {
+        'mean': sum(samples) / len(samples),
+        'min': min(samples),
+        'max': max(samples),
+        'calls': repeat,
+    }
+
+
+def benchmark_level(game, rows, repeat):
+    """
+    Time the hot paths for one level
+
+    Args:
+        game (Game): Headless game providing the player, screen and UI
+        rows (list): Level rows
+        repeat (int): Calls per timed function
+
+    Returns:
+        dict: Timings keyed by hot path name
+    """
+    from assets.levels.level import Level
+
+    player = game.player
+    loaded = []
+    results = {'load_level': time_call(lambda: loaded.append(Level(rows, player)), max(1, repeat // 10))}
+
+    # Hand the timed levels' objects back to the entity pools
+    for level in loaded:
+        level.release()
+
+    level = Level(rows, player)
+    if game.level is not None:
+        game.level.release()
+    game.level = level
+    player.bounds = game.level_bounds(level)
+    screen = game.screen
+
+    # First draw builds cached layers, keep it out of the steady-state numbers
+    level.draw(screen)
+
+    results['level_update'] = time_call(level.update, repeat)
+    results['check_coin_collisions'] = time_call(level.check_coin_collisions, repeat)
+    results['level_draw'] = time_call(lambda: level.draw(screen), repeat)
+    results['player_update'] = time_call(player.update, repeat)
+    results['draw_ui'] = time_call(game.draw_ui, repeat)
+
+    results['counts'] = {
+        'tiles': len(level.tiles),
+        'coins': len(level.coins),
+        'enemies': len(level.enemies),
+        'hazards': len(level.hazards),
+        'trampolines': len(level.trampolines),
+    }
+    return results
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, densities=DEFAULT_DENSITIES, repeat=100, seed=0):
+    """
+    Run the benchmark over every size and density combination
+
+    Args:
+        sizes (list): (columns, rows) level sizes
+        densities (list): Wall densities
+        repeat (int): Calls per timed function
+        seed (int): Random seed for level generation
+
+    Returns:
+        dict: Environment details and one result entry per level
+    """
+    use_dummy_drivers()
+    from main import Game
+
+    game = Game()
+    runs = []
+    for width, height in sizes:
+        for density in densities:
+            rows = generate_level(width, height, density, seed)
+            run = {
+                'width': width,
+                'height': height,
+                'density': density,
+                'seed': seed,
+            }
+            run.update(benchmark_level(game, rows, repeat))
+            runs.append(run)
+            print(f"{width}x{height} density {density}: "
+                  f"load {run['load_level']['mean'] * 1000:.2f} ms, "
+                  f"update {run['level_update']['mean'] * 1000:.3f} ms, "
+                  f"draw {run['level_draw']['mean'] * 1000:.3f} ms")
+
+    pygame.quit()
+    return {
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'runs': runs,
+    }
+
+
+def parse_sizes(text):
+    """Parse '25x19,100x50' into a list of (columns, rows) tuples"""
+    sizes = []
+    for item in text.split(','):
+        width, _, height = item.strip().partition('x')
+        sizes.append((int(width), int(height)))
+    return sizes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark level and player hot paths")
+    parser.add_argument('--sizes', type=parse_sizes, default=DEFAULT_SIZES,
+                        help="comma separated COLSxROWS level sizes")
+    parser.add_argument('--densities', type=lambda text: [float(d) for d in text.split(',')],
+                        default=DEFAULT_DENSITIES, help="comma separated wall densities")
+    parser.add_argument('--repeat', type=int, default=100, help="calls per timed function")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for level generation")
+    parser.add_argument('--output', default='bench_results.json', help="JSON file to write")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.sizes, args.densities, args.repeat, args.seed)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
@@ -0,0 +1,55 @@
+import pygame
+from settings import screen_width, screen_height
+
+
+class Camera:
+    """
+    Viewport into the level.
+    Tracks which part of the world is on screen; drawing code offsets
+    positions by it and skips anything outside its rect.
+    """
+
+    def __init__(self, width=screen_width, height=screen_height):
+        """
+        Args:
+            width (int): Viewport width in pixels
+            height (int): Viewport height in pixels
+        """
+        self.rect = pygame.Rect(0, 0, width, height)
+
+    @property
+    def offset(self):
+        """Amount to add to world positions to get screen positions"""
+        return -self.rect.x, -self.rect.y
+
+    def follow(self, target, bounds=None):
+        """
+        Center the viewport on a target
+
+        Args:
+            target (pygame.Rect): Rect to keep centered, usually the player
+            bounds (pygame.Rect): World area the viewport must stay inside
+        """
+        self.rect.center = target.center
+        if bounds is not None:
+            # Levels smaller than the screen stay pinned to the top-left corner
+            self.rect.x = max(bounds.left, min(self.rect.x, bounds.right - self.rect.width))
+            self.rect.y = max(bounds.top, min(self.rect.y, bounds.bottom - self.rect.height))
+
+    def apply(self, pos):
+        """
+        Convert a world position or rect to screen coordinates
+
+        Args:
+            pos: (x, y) tuple or pygame.Rect
+
+        Returns:
+            tuple: Screen position of the top-left corner
+        """
+        if isinstance(pos, pygame.Rect):
+            pos = pos.topleft
+        return pos[0] - self.rect.x, pos[1] - self.rect.y
+
+    def is_visible(self, rect):
+        """Check if a world rect overlaps the viewport"""
+        return self.rect.colliderect(rect)
@@ -1,265 +1,163 @@
 import pygame
-import sys
-import os
-from settings import screen_width, screen_height, tile_size, fps, game_title
-from player import player
-from coin import coin  # Import the improved Coin class
+from settings import (
+    COIN_VALUES, COIN_ANIMATION_SPEED, COIN_SIZE, COIN_SPIN_FRAMES, COIN_IMAGE_PATHS,
+    COLOR_COIN_GOLD, COLOR_COIN_SILVER, COLOR_COIN_BRONZE
+)
+from asset_manager import assets
 
-try:
-    from assets.levels.level import Level
-except ImportError as e:
-    print(f"Error importing level module: {e}")
-    pygame.quit()
-    sys.exit()
+# Fallback colors when a coin image cannot be loaded
+COIN_COLORS = {
+    'bronze': COLOR_COIN_BRONZE,
+    'silver': COLOR_COIN_SILVER,
+    'gold': COLOR_COIN_GOLD,
+}
 
-
-class Game:
-    """Main game class to manage the game loop and resources"""
-      
-    def __init__(self):
-        """Initialize the game, including pygame, display, and game resources"""
-        # Initialize pygame
-        pygame.init()
-        pygame.mixer.init()
-        
-        # Set up display
-        self.screen = pygame.display.set_mode(
-            (screen_width, screen_height)
-        )
-        pygame.display.set_caption(game_title)
-        self.clock = pygame.time.Clock()
-        
-        # Game states
-        self.running = True
-        self.paused = False
-        self.current_level = 1
-        self.max_levels = 3  # Set the number of available levels
-        self.score = 0
-        
-        # Load assets
-        self.load_assets()
-        
-        # Initialize game objects
-        self.player = player(
-            (100, screen_height - 2 * tile_size)
-        )
-        
-        # Preload coin images
-        coin.preload_images()
-        
-        # Set up the first level
-        self.setup_level(self.current_level)
-        
-        # UI elements
-        self.font = pygame.font.Font(None, 36)
-        
-    def load_assets(self):
-        """Load game assets like images and sounds"""
-        self.background_image = pygame.image.load(
-                'assets/images/background/clouds1.jpg'
-            )
-        self.background_image = pygame.image.load(
-                'assets/images/background/clouds1.jpg'
-            ).convert()
-        try:
-            self.background_image = pygame.image.load('assets/images/background/clouds1.jpg').convert()
-            self.background_image = pygame.transform.scale(
-                self.background_image, (screen_width, screen_height)
-            )
-        except FileNotFoundError as e:
-            print(f"Error loading background: {e}")
-            self.background_image = self.create_fallback_background()
-        
-        # Load sounds
-        self.sounds = {}
-        try:
-            # Load music
-            self.sounds['coin_collect'] = pygame.mixer.Sound(
-                'assets/sounds/coin_collect.wav'
-            )
-            self.sounds['jump'] = pygame.mixer.Sound(
-                'assets/sounds/jump.wav'
-            )
-            self.sounds['level_complete'] = pygame.mixer.Sound(
-                'assets/sounds/level_complete.wav'
-            )
-            # Load sound effects
-            self.sounds['coin_collect'] = pygame.mixer.Sound('assets/sounds/coin_collect.wav')
-            self.sounds['jump'] = pygame.mixer.Sound('assets/sounds/jump.wav')
-            self.sounds['level_complete'] = pygame.mixer.Sound('assets/sounds/level_complete.wav')
-        except pygame.error as e:
-            print(f"Error loading sounds: {e}")
+class coin(pygame.sprite.Sprite):
+    """
+    Collectible coin that spins in place until the player picks it up.
+    Its value comes from COIN_VALUES; the level's CoinStore does the
+    collision tests and calls collect() on the coins that were hit.
+    """
     
-    def create_fallback_background(self):
-        """Create a simple gradient background if image fails to load"""
-        bg = pygame.Surface((screen_width, screen_height))
-        for y in range(screen_height):
-            # Create a blue to light blue gradient
-            color = (100, 100, 255 - int(y * 0.3))
-            pygame.draw.line(bg, color, (0, y), (screen_width, y))
-        return bg
+    # Spin frames per coin type, shared by every coin
+    frames = {}
     
-    def setup_level(self, level_number):
-        """Load and set up the specified level"""
-        # Example of loading different levels
-        level_file = f'assets/levels/level{level_number}.txt'
-        
-        # Check if level file exists, otherwise use hardcoded level data
-        if os.path.exists(level_file):
-            with open(level_file, 'r') as f:
-                level_data = f.read().splitlines()
-        else:
-            # Fallback level data (can be customized for each level)
-            if level_number == 1:
-                level_data = [
-                    "####################",
-                    "#                  #",
-                    "#  c g b           #",
-                    "# ######   ####    #",
-                    "#        c         #",
-                    "####################",
-                ]
-            elif level_number == 2:
-                level_data = [
-                    "####################",
-                    "#       g          #",
-                    "#  c    #    b     #",
-                    "# #### ### ###     #",
-                    "#      c      g    #",
-                    "####################",
-                ]
-            else:
-                level_data = [
-                    "####################",
-                    "#       g g g      #",
-                    "# c b c # # # b c  #",
-                    "####### # # ###### #",
-                    "#           g      #",
-                    "####################",
-                ]
-        
-        # Create the level
-        self.level = Level(level_data, self.player)
-        
-        # Reset player position
-        self.player.rect.topleft = (100, screen_height - 2 * tile_size)
-        self.player.velocity.y = 0
+    def __init__(self, pos, coin_type='bronze'):
+        """
+        Initialize a coin
+        
+        Args:
+            pos (tuple): Center position (x, y)
+            coin_type (str): 'bronze', 'silver' or 'gold'
+        """
+        super().__init__()
+        
+        # Every spin frame is COIN_SIZE square, reset() only moves the rect
+        self.rect = pygame.Rect(0, 0, COIN_SIZE, COIN_SIZE)
+        self.reset(pos, coin_type)
     
-    def start_music(self):
-        """Start the background music"""
-        pygame.mixer.music.play(-1)  # Play on loop
+    def reset(self, pos, coin_type='bronze'):
+        """
+        Re-initialize a pooled coin as a new, uncollected one
+        
+        Args:
+            pos (tuple): Center position (x, y)
+            coin_type (str): 'bronze', 'silver' or 'gold'
+        """
+        self.coin_type = coin_type
+        self.value = COIN_VALUES[coin_type]
+        self.is_collected = False
+        self.collected_time = None
+        
+        # Animation state, started from the position so neighbours don't spin in step
+        self.animations = self.get_frames(coin_type)
+        self.animation_time = (pos[0] // COIN_SIZE) % COIN_SPIN_FRAMES
+        self.image = self.animations[int(self.animation_time)]
+        self.rect.center = pos
     
-    def handle_events(self):
-        """Process game events"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_p:
-                    self.paused = not self.paused
-                    if self.paused:
-                        pygame.mixer.music.pause()
-                    else:
-                        pygame.mixer.music.unpause()
-                
-                # Debug: Level skip
-                elif event.key == pygame.K_n and pygame.key.get_mods() & pygame.KMOD_CTRL:
-                    self.next_level()
-        
-        # Handle continuous key presses when not paused
-        if not self.paused:
-            keys = pygame.key.get_pressed()
-            self.player.handle_input(keys)
+    @classmethod
+    def preload_images(cls):
+        """Build the spin frames of every coin type ahead of the first level"""
+        for coin_type in COIN_VALUES:
+            cls.get_frames(coin_type)
     
-    def update(self):
-        """Update game state"""
-        if self.paused:
-            return
-            
-        # Update game objects
-        self.player.update()
-        
-        # Update level and check for coins collected
-        coins_collected = self.level.update()
-        if coins_collected:
-            self.score += coins_collected
-            if 'coin_collect' in self.sounds:
-                self.sounds['coin_collect'].play()
-        
-        # Check for level completion (example: all coins collected)
-        if self.level.is_complete():
-            self.next_level()
+    @classmethod
+    def get_frames(cls, coin_type):
+        """
+        Get the spin frames of a coin type, building them on first use
+        
+        Args:
+            coin_type (str): Coin type
+        
+        Returns:
+            list: COIN_SPIN_FRAMES surfaces of size COIN_SIZE
+        """
+        frames = cls.frames.get(coin_type)
+        if frames is None:
+            try:
+                base = assets.get_image(COIN_IMAGE_PATHS[coin_type], (COIN_SIZE, COIN_SIZE))
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Error loading {coin_type} coin image: {e}")
+                base = assets.get_surface(('coin', coin_type),
+                                          lambda: cls.create_fallback_image(coin_type))
+            frames = [assets.get_surface(('coin', coin_type, index),
+                                         lambda index=index: cls.create_spin_frame(base, index))
+                      for index in range(COIN_SPIN_FRAMES)]
+            cls.frames[coin_type] = frames
+        return frames
     
-    def next_level(self):
-        """Advance to the next level or end game if all levels completed"""
-        if self.current_level < self.max_levels:
-            if 'level_complete' in self.sounds:
-                self.sounds['level_complete'].play()
-            self.current_level += 1
-            self.setup_level(self.current_level)
-        else:
-            # Game completed - could show victory screen
-            print("Game completed! Final score:", self.score)
-            # For now, we'll just reset to level 1
-            self.current_level = 1
-            self.setup_level(self.current_level)
+    @staticmethod
+    def create_fallback_image(coin_type):
+        """Create a plain colored disc as fallback if image loading fails"""
+        surface = pygame.Surface((COIN_SIZE, COIN_SIZE), pygame.SRCALPHA)
+        radius = COIN_SIZE // 2
+        pygame.draw.circle(surface, COIN_COLORS[coin_type], (radius, radius), radius)
+        pygame.draw.circle(surface, (0, 0, 0), (radius, radius), radius, 1)
+        return surface
     
-    def draw_ui(self):
-        """Draw user interface elements"""
-        # Score
-        score_text = self.font.render(f"Score: {self.score}", True, (255, 255, 255))
-        self.screen.blit(score_text, (20, 20))
-        
-        # Level indicator
-        level_text = self.font.render(f"Level: {self.current_level}/{self.max_levels}", True, (255, 255, 255))
-        self.screen.blit(level_text, (screen_width - 150, 20))
-        
-        # Pause indicator
-        if self.paused:
-            pause_text = self.font.render("PAUSED", True, (255, 0, 0))
-            text_rect = pause_text.get_rect(center=(screen_width // 2, screen_height // 2))
-            # Draw semi-transparent background
-            s = pygame.Surface((pause_text.get_width() + 20, pause_text.get_height() + 20))
-            s.set_alpha(150)
-            s.fill((0, 0, 0))
-            self.screen.blit(s, (text_rect.x - 10, text_rect.y - 10))
-            self.screen.blit(pause_text, text_rect)
+    @staticmethod
+    def create_spin_frame(base, index):
+        """
+        Squash the coin image horizontally for one frame of the spin
+        
+        Args:
+            base (pygame.Surface): Full-width coin image
+            index (int): Frame number, 0 faces the viewer
+        
+        Returns:
+            pygame.Surface: Frame of the same size as base, image centered
+        """
+        # Width follows |cos| of the turn angle, never thinner than a sliver
+        turn = index / COIN_SPIN_FRAMES
+        scale = abs(1 - 2 * turn)
+        width = max(2, round(base.get_width() * scale))
+        squashed = pygame.transform.smoothscale(base, (width, base.get_height()))
+        
+        frame = pygame.Surface(base.get_size(), pygame.SRCALPHA)
+        frame.blit(squashed, squashed.get_rect(center=frame.get_rect().center))
+        return frame
     
-    def draw(self):
-        """Draw all game elements"""
-        # Background
-        self.screen.blit(self.background_image, (0, 0))
-        
-        # Game elements
-        self.level.draw(self.screen)
-        self.player.draw(self.screen)
-        
-        # UI
-        self.draw_ui()
-        
-        # Update display
-        pygame.display.flip()
+    def collect(self, current_time):
+        """
+        Mark the coin as picked up; it is no longer drawn
+        
+        Args:
+            current_time (int): pygame.time.get_ticks() value of the pickup
+        
+        Returns:
+            int: Value of the coin
+        """
+        self.is_collected = True
+        self.collected_time = current_time
+        return self.value
     
-    def run(self):
-        """Main game loop"""
-        self.start_music()
-        
-        while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(fps)
+    def update(self, now=None):
+        """
+        Advance the spin animation by one tick
+        
+        Args:
+            now (int): Current pygame.time.get_ticks() value, unused by the spin
+        """
+        if self.is_collected:
+            return
         
-        self.quit()
+        self.animation_time += COIN_ANIMATION_SPEED
+        if self.animation_time >= len(self.animations):
+            self.animation_time = 0
+        self.image = self.animations[int(self.animation_time)]
     
-    def quit(self):
-        """Clean up and exit"""
-        pygame.quit()
-        sys.exit()
-
-
-if __name__ == "__main__":
-    # Create and run the game
-    game = Game()
-    game.run()
\ No newline at end of file
+    def draw(self, surface, offset=(0, 0)):
+        """
+        Draw the coin on the given surface
+        
+        Args:
+            surface (pygame.Surface): Surface to draw on
+            offset (tuple): (dx, dy) added to the coin's level position, the camera offset
+        
+        Returns:
+            pygame.Rect: Area covered by the coin on the surface, drawn or not
+        """
+        dest = self.rect.move(offset)
+        if not self.is_collected:
+            surface.blit(self.image, dest)
+        return dest
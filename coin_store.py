@@ -0,0 +1,129 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, fall back to a plain loop
+    np = None
+
+
+class CoinStore:
+    """
+    Struct-of-arrays storage for the coins of a level.
+    Positions, sizes, values and collected flags live in parallel arrays so
+    the overlap test against the player runs as one vectorized operation.
+    The coin sprites are kept alongside for animation and drawing.
+    """
+
+    def __init__(self):
+        """Initialize an empty store"""
+        self.sprites = []
+        self.x = []
+        self.y = []
+        self.width = []
+        self.height = []
+        self.value = []
+        self.collected = []
+
+        # NumPy copies of the columns, rebuilt after coins are added or removed
+        self.arrays = None
+
+    def add(self, sprite, value):
+        """
+        Add a coin
+
+        Args:
+            sprite: Coin sprite with a rect
+            value (int): Score value of the coin
+
+        Returns:
+            int: Index of the coin
+        """
+        rect = sprite.rect
+        self.sprites.append(sprite)
+        self.x.append(rect.x)
+        self.y.append(rect.y)
+        self.width.append(rect.width)
+        self.height.append(rect.height)
+        self.value.append(value)
+        self.collected.append(False)
+        self.arrays = None
+        return len(self.sprites) - 1
+
+    def remove(self, sprite):
+        """
+        Remove a coin, moving the last coin into its slot
+
+        Args:
+            sprite: Coin sprite previously added
+        """
+        index = self.sprites.index(sprite)
+        last = len(self.sprites) - 1
+        for column in (self.sprites, self.x, self.y, self.width, self.height,
+                       self.value, self.collected):
+            column[index] = column[last]
+            column.pop()
+        self.arrays = None
+
+    def _build_arrays(self):
+        """Create the NumPy columns from the lists"""
+        self.arrays = {
+            'left': np.array(self.x, dtype=np.int32),
+            'top': np.array(self.y, dtype=np.int32),
+            'right': np.array(self.x, dtype=np.int32) + np.array(self.width, dtype=np.int32),
+            'bottom': np.array(self.y, dtype=np.int32) + np.array(self.height, dtype=np.int32),
+            'value': np.array(self.value, dtype=np.int32),
+            'collected': np.array(self.collected, dtype=bool),
+        }
+
+    def collide(self, rect):
+        """
+        Collect every uncollected coin overlapping a rectangle
+
+        Args:
+            rect (pygame.Rect): Area to test, usually the player rect
+
+        Returns:
+            tuple: (list of collected coin indices, total value collected)
+        """
+        if not self.sprites:
+            return [], 0
+
+        if np is None:
+            return self._collide_loop(rect)
+
+        if self.arrays is None:
+            self._build_arrays()
+        arrays = self.arrays
+        hits = np.flatnonzero(
+            ~arrays['collected']
+            & (arrays['left'] < rect.right)
+            & (arrays['right'] > rect.left)
+            & (arrays['top'] < rect.bottom)
+            & (arrays['bottom'] > rect.top)
+        )
+        if not len(hits):
+            return [], 0
+
+        arrays['collected'][hits] = True
+        indices = hits.tolist()
+        for index in indices:
+            self.collected[index] = True
+        return indices, int(arrays['value'][hits].sum())
+
+    def _collide_loop(self, rect):
+        """Pure Python version of collide() used without NumPy"""
+        indices = []
+        total = 0
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        for index, (x, y, width, height) in enumerate(zip(self.x, self.y, self.width, self.height)):
+            if (not self.collected[index] and x < right and x + width > left
+                    and y < bottom and y + height > top):
+                self.collected[index] = True
+                indices.append(index)
+                total += self.value[index]
+        return indices, total
+
+    def remaining(self):
+        """Number of coins not collected yet"""
+        return self.collected.count(False)
+
+    def __len__(self):
+        return len(self.sprites)
@@ -0,0 +1,192 @@
+import math
+import pygame
+from settings import tile_size, COLLIDER_BLOCK_TILES
+from spatial_grid import SpatialGrid
+
+
+def merge_cells(rows):
+    """
+    Greedily merge solid cells into rectangles
+
+    Each rectangle is grown as far right as possible from the first free
+    solid cell, then downwards while the whole span below is solid.
+
+    Args:
+        rows (list): Rows of truthy/falsy solid flags, all the same length
+
+    Returns:
+        list: (col, row, width, height) of each rectangle, in cells
+    """
+    height = len(rows)
+    width = len(rows[0]) if rows else 0
+    used = [bytearray(width) for _ in range(height)]
+    rects = []
+
+    for row in range(height):
+        solid_row = rows[row]
+        used_row = used[row]
+        col = 0
+        while col < width:
+            if not solid_row[col] or used_row[col]:
+                col += 1
+                continue
+
+            # Grow right
+            stop = col + 1
+            while stop < width and solid_row[stop] and not used_row[stop]:
+                stop += 1
+
+            # Grow down while the full span is solid and unclaimed
+            bottom = row + 1
+            while bottom < height:
+                below = rows[bottom]
+                below_used = used[bottom]
+                if not all(below[c] and not below_used[c] for c in range(col, stop)):
+                    break
+                bottom += 1
+
+            for claimed in range(row, bottom):
+                used[claimed][col:stop] = b'\x01' * (stop - col)
+            rects.append((col, row, stop - col, bottom - row))
+            col = stop
+
+    return rects
+
+
+class ColliderMap:
+    """
+    Merged collision rectangles for the solid cells of a level.
+    The level is split into square blocks that are merged independently,
+    so adding or removing a wall only re-merges its own block. Collision
+    code queries the merged rects instead of one rect per wall tile.
+    """
+
+    def __init__(self, solid_grid, block_tiles=COLLIDER_BLOCK_TILES):
+        """
+        Args:
+            solid_grid (SolidGrid): Solid flags of the level cells
+            block_tiles (int): Width and height in cells of an independently merged block
+        """
+        self.solid_grid = solid_grid
+        self.block_tiles = block_tiles
+        self.index = SpatialGrid(tile_size)
+        self.blocks = {}  # (block_x, block_y) -> list of pygame.Rect
+        self.dirty = set()
+
+    def mark_dirty(self, pos):
+        """
+        Schedule the block containing a pixel position for re-merging
+
+        Args:
+            pos (tuple): Pixel position (x, y) of a changed cell
+        """
+        size = self.block_tiles * self.solid_grid.cell_size
+        self.dirty.add((int(pos[0]) // size, int(pos[1]) // size))
+
+    def rebuild(self):
+        """Re-merge every dirty block"""
+        grid = self.solid_grid
+        cell_size = grid.cell_size
+        block_tiles = self.block_tiles
+        for block in self.dirty:
+            for rect in self.blocks.pop(block, ()):
+                self.index.remove(rect, rect)
+
+            col_start = block[0] * block_tiles
+            row_start = block[1] * block_tiles
+            col_stop = min(col_start + block_tiles, grid.columns)
+            row_stop = min(row_start + block_tiles, grid.rows)
+            if col_start >= col_stop or row_start >= row_stop:
+                continue
+
+            rects = []
+            for col, row, width, height in merge_cells(grid.block(col_start, row_start, col_stop, row_stop)):
+                rect = pygame.Rect(
+                    (col_start + col) * cell_size, (row_start + row) * cell_size,
+                    width * cell_size, height * cell_size
+                )
+                self.index.insert(rect, rect)
+                rects.append(rect)
+            if rects:
+                self.blocks[block] = rects
+        self.dirty.clear()
+
+    def query(self, rect):
+        """
+        Find the collision rectangles overlapping an area
+
+        Args:
+            rect (pygame.Rect): Area to test
+
+        Returns:
+            list: Merged rects overlapping rect
+        """
+        if self.dirty:
+            self.rebuild()
+        return self.index.query(rect)
+
+    def __len__(self):
+        if self.dirty:
+            self.rebuild()
+        return len(self.index)
+
+
+def collide_horizontal(body, query):
+    """
+    Move a body's collision rect horizontally and stop it at walls
+
+    Walls the body only sank into by its vertical move this tick are floors
+    or ceilings, left for collide_vertical.
+
+    Args:
+        body: Object with rect, collision_rect and velocity (pygame.Vector2), like the player
+        query: Callable returning the wall rects overlapping a rect, e.g. ColliderMap.query
+    """
+    collision_rect = body.collision_rect
+    velocity = body.velocity
+    collision_rect.x += velocity.x
+    sink = math.ceil(abs(velocity.y))
+
+    for wall in query(collision_rect):
+        if wall.colliderect(collision_rect):
+            if velocity.y > 0 and collision_rect.bottom - wall.top <= sink:
+                continue
+            if velocity.y < 0 and wall.bottom - collision_rect.top <= sink:
+                continue
+
+            if velocity.x > 0:  # Moving right
+                collision_rect.right = wall.left
+            elif velocity.x < 0:  # Moving left
+                collision_rect.left = wall.right
+            velocity.x = 0
+
+    body.rect.centerx = collision_rect.centerx
+
+
+def collide_vertical(body, query):
+    """
+    Apply gravity, move a body's collision rect vertically and land it on walls
+
+    Args:
+        body: Object with rect, collision_rect, velocity, acceleration, on_ground
+            and jumping, like the player
+        query: Callable returning the wall rects overlapping a rect
+    """
+    collision_rect = body.collision_rect
+    velocity = body.velocity
+    velocity.y += body.acceleration.y
+    collision_rect.y += velocity.y
+    body.on_ground = False
+
+    for wall in query(collision_rect):
+        if wall.colliderect(collision_rect):
+            if velocity.y > 0:  # Falling
+                collision_rect.bottom = wall.top
+                velocity.y = 0
+                body.on_ground = True
+                body.jumping = False
+            elif velocity.y < 0:  # Moving up
+                collision_rect.top = wall.bottom
+                velocity.y = 0
+
+    body.rect.bottom = collision_rect.bottom
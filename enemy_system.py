@@ -0,0 +1,155 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, fall back to a plain loop
+    np = None
+
+
+class EnemySystem:
+    """
+    Batched patrol simulation for all enemies of a level.
+    Positions, sizes, speeds and directions are kept in arrays and updated
+    in one pass; walls are found by looking up the cells under each enemy's
+    corners in the level's SolidGrid instead of scanning every tile.
+    Enemies are assumed to be no larger than a tile, so their corners cover
+    every cell they can overlap.
+    """
+
+    def __init__(self, solid_grid, level_width):
+        """
+        Args:
+            solid_grid (SolidGrid): Solid flags of the level cells
+            level_width (int): Level width in pixels, enemies turn at its edges
+        """
+        self.solid_grid = solid_grid
+        self.level_width = level_width
+
+        self.sprites = []
+        self.x = []
+        self.y = []
+        self.width = []
+        self.height = []
+        self.speed = []
+        self.direction = []
+
+        # NumPy copies of the columns, rebuilt after enemies are added or removed
+        self.arrays = None
+
+    def add(self, enemy):
+        """
+        Add an enemy sprite
+
+        Args:
+            enemy (Enemy): Sprite with rect, velocity and direction
+        """
+        self._sync_lists()
+        self.sprites.append(enemy)
+        self.x.append(float(enemy.rect.x))
+        self.y.append(enemy.rect.y)
+        self.width.append(enemy.rect.width)
+        self.height.append(enemy.rect.height)
+        self.speed.append(enemy.velocity.x)
+        self.direction.append(enemy.direction)
+
+    def remove(self, enemy):
+        """
+        Remove an enemy sprite, moving the last enemy into its slot
+
+        Args:
+            enemy (Enemy): Sprite previously added
+        """
+        self._sync_lists()
+        index = self.sprites.index(enemy)
+        last = len(self.sprites) - 1
+        for column in (self.sprites, self.x, self.y, self.width, self.height,
+                       self.speed, self.direction):
+            column[index] = column[last]
+            column.pop()
+
+    def set_direction(self, enemy, direction):
+        """Change the walking direction of one enemy"""
+        self._sync_lists()
+        self.direction[self.sprites.index(enemy)] = direction
+        enemy.direction = direction
+
+    def _sync_lists(self):
+        """Copy array state back into the lists before changing membership"""
+        if self.arrays is not None:
+            self.x = self.arrays['x'].tolist()
+            self.direction = self.arrays['direction'].tolist()
+            self.arrays = None
+
+    def _build_arrays(self):
+        """Create the NumPy columns from the lists"""
+        self.arrays = {
+            'x': np.array(self.x, dtype=np.float64),
+            'y': np.array(self.y, dtype=np.int64),
+            'width': np.array(self.width, dtype=np.int64),
+            'height': np.array(self.height, dtype=np.int64),
+            'speed': np.array(self.speed, dtype=np.float64),
+            'direction': np.array(self.direction, dtype=np.int64),
+        }
+
+    def update(self):
+        """Move every enemy one tick and turn the ones that hit a wall or the level edge"""
+        if not self.sprites:
+            return
+        if np is None:
+            self._update_loop()
+            return
+
+        if self.arrays is None:
+            self._build_arrays()
+        arrays = self.arrays
+        x = arrays['x']
+        direction = arrays['direction']
+        x += arrays['speed'] * direction
+
+        # Same integer truncation as assigning to Rect.x
+        left = x.astype(np.int64)
+        right = left + arrays['width'] - 1
+        top = arrays['y']
+        bottom = top + arrays['height'] - 1
+
+        # Look up the cells under the four corners
+        grid = self.solid_grid
+        cells = grid.cells
+        size = grid.cell_size
+        max_col = grid.columns - 1
+        max_row = grid.rows - 1
+        col_left = np.clip(left // size, 0, max_col)
+        col_right = np.clip(right // size, 0, max_col)
+        row_top = np.clip(top // size, 0, max_row)
+        row_bottom = np.clip(bottom // size, 0, max_row)
+        hit = (cells[row_top, col_left] | cells[row_top, col_right]
+               | cells[row_bottom, col_left] | cells[row_bottom, col_right])
+
+        # Level edges
+        hit |= (left < 0) | (right >= self.level_width)
+        direction[hit] *= -1
+
+        # Write positions back to the sprites for drawing
+        for enemy, new_x, new_direction in zip(self.sprites, left.tolist(), direction.tolist()):
+            enemy.rect.x = new_x
+            enemy.direction = new_direction
+
+    def _update_loop(self):
+        """Pure Python version of update() used without NumPy"""
+        grid = self.solid_grid
+        size = grid.cell_size
+        for index, enemy in enumerate(self.sprites):
+            self.x[index] += self.speed[index] * self.direction[index]
+            left = int(self.x[index])
+            right = left + self.width[index] - 1
+            top = self.y[index]
+            bottom = top + self.height[index] - 1
+
+            hit = (grid.is_solid(left // size, top // size) or grid.is_solid(right // size, top // size)
+                   or grid.is_solid(left // size, bottom // size) or grid.is_solid(right // size, bottom // size))
+            if hit or left < 0 or right >= self.level_width:
+                self.direction[index] *= -1
+
+            enemy.rect.x = left
+            enemy.direction = self.direction[index]
+
+    def __len__(self):
+        return len(self.sprites)
@@ -0,0 +1,103 @@
+from settings import ENTITY_POOL_MAX_FREE
+
+
+class EntityPool:
+    """
+    Free list of released sprites of one class.
+    Released sprites are kept instead of garbage and handed out again by
+    acquire(), which re-initializes them through their reset() method.
+    """
+
+    def __init__(self, cls, max_free=ENTITY_POOL_MAX_FREE):
+        """
+        Args:
+            cls: Sprite class, its constructor and reset() take the same arguments
+            max_free (int): Released sprites kept at most, extra ones are dropped
+        """
+        self.cls = cls
+        self.max_free = max_free
+        self.free = []
+
+        # Statistics
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.discarded = 0
+
+    def acquire(self, *args):
+        """Return a reset pooled sprite, or a new one if the pool is empty"""
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args)
+            self.reused += 1
+            return sprite
+        self.created += 1
+        return self.cls(*args)
+
+    def release(self, sprite):
+        """Remove a sprite from its groups and keep it for reuse"""
+        sprite.kill()
+        self.released += 1
+        if len(self.free) < self.max_free:
+            self.free.append(sprite)
+        else:
+            self.discarded += 1
+
+    def stats(self):
+        """Return pool counters as a dictionary"""
+        return {
+            'free': len(self.free),
+            'created': self.created,
+            'reused': self.reused,
+            'released': self.released,
+            'discarded': self.discarded,
+        }
+
+
+class EntityPools:
+    """One EntityPool per sprite class, created on first use"""
+
+    def __init__(self, max_free=ENTITY_POOL_MAX_FREE):
+        """
+        Args:
+            max_free (int): Free sprites kept per class
+        """
+        self.max_free = max_free
+        self.pools = {}  # class -> EntityPool
+
+    def pool(self, cls):
+        """Return the pool of a class"""
+        pool = self.pools.get(cls)
+        if pool is None:
+            pool = self.pools[cls] = EntityPool(cls, self.max_free)
+        return pool
+
+    def acquire(self, cls, *args):
+        """
+        Get a sprite of a class
+
+        Args:
+            cls: Pooled sprite class
+            *args: Constructor/reset() arguments
+
+        Returns:
+            A reused or new sprite
+        """
+        return self.pool(cls).acquire(*args)
+
+    def release(self, sprite):
+        """Return a sprite acquired from these pools"""
+        self.pool(type(sprite)).release(sprite)
+
+    def clear(self):
+        """Drop every free sprite"""
+        for pool in self.pools.values():
+            pool.free.clear()
+
+    def stats(self):
+        """Return the counters of every pool, keyed by class name"""
+        return {cls.__name__: pool.stats() for cls, pool in self.pools.items()}
+
+
+# Shared pools used by every level
+entity_pools = EntityPools()
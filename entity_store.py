@@ -0,0 +1,99 @@
+import pygame
+from settings import tile_size
+
+
+class LevelEntity:
+    """
+    Compact base for non-moving level objects.
+    Instances only hold their rect and list membership in slots; the image
+    is shared by every instance of a class and created on first use.
+    Subclasses override create_image() and list their own state in __slots__.
+    """
+
+    __slots__ = ('rect', 'owner', 'index')
+
+    image = None  # Shared per subclass, see shared_image()
+
+    def __init__(self, rect):
+        """
+        Args:
+            rect (pygame.Rect): Area the entity covers, not yet in any EntityList
+        """
+        self.rect = rect
+        self.owner = None
+        self.index = None
+
+    @classmethod
+    def shared_image(cls):
+        """Return the image every instance of this class draws with"""
+        image = cls.__dict__.get('image')
+        if image is None:
+            image = cls.create_image()
+            cls.image = image
+        return image
+
+    @staticmethod
+    def create_image():
+        """
+        Create the image shared by every instance of the class
+        Subclasses override this; the default is a magenta tile that makes
+        a missing image obvious.
+
+        Returns:
+            pygame.Surface: The shared image
+        """
+        image = pygame.Surface((tile_size, tile_size))
+        image.fill((255, 0, 255))
+        return image
+
+    def alive(self):
+        """Whether the entity is in an EntityList"""
+        return self.owner is not None
+
+    def kill(self):
+        """Remove the entity from its EntityList"""
+        if self.owner is not None:
+            self.owner.remove(self)
+
+
+class EntityList:
+    """
+    Unordered list of LevelEntity objects.
+    Stands in for a sprite group: entities know their own position in the
+    list, so membership tests and removal are O(1) without hashing.
+    """
+
+    __slots__ = ('items',)
+
+    def __init__(self):
+        self.items = []
+
+    def add(self, entity):
+        """Append an entity"""
+        entity.owner = self
+        entity.index = len(self.items)
+        self.items.append(entity)
+
+    def remove(self, entity):
+        """Remove an entity, moving the last one into its slot"""
+        items = self.items
+        last = items.pop()
+        if last is not entity:
+            items[entity.index] = last
+            last.index = entity.index
+        entity.owner = None
+
+    def empty(self):
+        """Remove every entity"""
+        for entity in self.items:
+            entity.owner = None
+        self.items.clear()
+
+    def __contains__(self, entity):
+        return getattr(entity, 'owner', None) is self
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
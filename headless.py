@@ -0,0 +1,198 @@
+"""
+Headless simulation runner
+Steps the game without a window or audio device, as fast as possible,
+with scripted input instead of the keyboard.
+
+Example:
+    python headless.py --frames 600 --script "right*60,right+up*10,*30"
+    python headless.py --replay session.pkr
+"""
+
+import os
+import json
+import time
+import argparse
+import pygame
+
+REPLAY_STALL_FRAMES = 600  # Frames a replay may go without reading input before it is given up
+
+# Key names usable in input scripts
+KEY_NAMES = {
+    'left': pygame.K_LEFT,
+    'right': pygame.K_RIGHT,
+    'up': pygame.K_UP,
+}
+
+
+class KeyState:
+    """Stand-in for pygame.key.get_pressed() holding a fixed set of keys"""
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class ScriptedInput:
+    """
+    Input source feeding held keys from a script, one entry per frame.
+    Frames past the end of the script have no keys held.
+    """
+
+    def __init__(self, frames=()):
+        """
+        Args:
+            frames: Sequence with one iterable of key names or key codes per frame
+        """
+        self.states = [
+            KeyState(KEY_NAMES.get(key, key) for key in keys)
+            for keys in frames
+        ]
+        self.empty = KeyState()
+        self.frame = 0
+
+    @classmethod
+    def parse(cls, script):
+        """
+        Build an input script from a compact string
+
+        Args:
+            script (str): Comma separated 'keys*count' segments, keys joined
+                with '+', e.g. "right*60,right+up*10,*30"
+
+        Returns:
+            ScriptedInput: Parsed script
+        """
+        frames = []
+        for segment in script.split(','):
+            segment = segment.strip()
+            if not segment:
+                continue
+            keys, _, count = segment.partition('*')
+            names = [name for name in keys.split('+') if name]
+            for name in names:
+                if name not in KEY_NAMES:
+                    raise ValueError(f"Unknown key in input script: {name}")
+            frames.extend([names] * int(count or 1))
+        return cls(frames)
+
+    def __call__(self):
+        """Return the key state for the current frame"""
+        if self.frame < len(self.states):
+            return self.states[self.frame]
+        return self.empty
+
+    def __len__(self):
+        return len(self.states)
+
+
+def use_dummy_drivers():
+    """Point SDL at its dummy video and audio drivers (call before pygame.init)"""
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+
+def run_headless(frames, script=None, level=1, draw=False, replay=None):
+    """
+    Run the game loop without a display as fast as possible
+
+    Args:
+        frames (int): Number of frames to simulate
+        script (ScriptedInput): Input to feed, defaults to no keys held
+        level (int): Level number to start on
+        draw (bool): Also render every frame to the dummy display
+        replay (str): Input recording to play back instead of a script; the
+            run then lasts until every recorded tick has been played and
+            frames and level are ignored
+
+    Returns:
+        dict: Final game state and timings in seconds
+    """
+    use_dummy_drivers()
+    from main import Game
+    from audio_manager import audio
+    from entity_pool import entity_pools
+
+    game = Game()
+    if replay is not None:
+        script = game.start_replay(replay)
+    else:
+        if script is None:
+            script = ScriptedInput()
+        game.input_source = script
+        if level != game.current_level:
+            game.current_level = level
+            game.setup_level(level)
+
+    timings = {'handle_events': 0.0, 'update': 0.0, 'draw': 0.0}
+    clock = time.perf_counter
+    start = clock()
+    frame = 0
+    stalled = 0
+
+    while game.running:
+        if replay is None:
+            if frame >= frames:
+                break
+            script.frame = frame
+        elif script.finished or stalled > REPLAY_STALL_FRAMES:
+            # A stalled replay stops here, verify() reports the ticks left unplayed
+            break
+        else:
+            played = script.tick
+
+        t0 = clock()
+        game.handle_events()
+        t1 = clock()
+        game.continue_level_load()
+        game.update()
+        audio.flush()
+        t2 = clock()
+        if draw:
+            game.draw()
+        t3 = clock()
+
+        timings['handle_events'] += t1 - t0
+        timings['update'] += t2 - t1
+        timings['draw'] += t3 - t2
+        frame += 1
+        if replay is not None:
+            # Level loads read no input, so frames can pass without a tick played
+            stalled = stalled + 1 if script.tick == played else 0
+
+    total = clock() - start
+    timings['total'] = total
+
+    result = {
+        'frames': frame,
+        'score': game.score,
+        'level': game.current_level,
+        'player': {
+            'x': game.player.rect.x,
+            'y': game.player.rect.y,
+            'health': game.player.health,
+            'on_ground': game.player.on_ground,
+        },
+        'timings': timings,
+        'pools': entity_pools.stats(),
+        'frames_per_second': frame / total if total > 0 else 0.0,
+    }
+    if replay is not None:
+        result['replay_mismatches'] = [tick for tick, _, _ in script.verify()]
+
+    pygame.quit()
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the game headless with scripted input")
+    parser.add_argument('--frames', type=int, default=600, help="number of frames to simulate")
+    parser.add_argument('--level', type=int, default=1, help="level to start on")
+    parser.add_argument('--script', default='', help="input script, e.g. 'right*60,right+up*10'")
+    parser.add_argument('--draw', action='store_true', help="also render every frame")
+    parser.add_argument('--replay', metavar='FILE', help="play back an input recording instead")
+    args = parser.parse_args()
+
+    result = run_headless(args.frames, ScriptedInput.parse(args.script), args.level, args.draw, args.replay)
+    print(json.dumps(result, indent=2))
@@ -0,0 +1,220 @@
+"""
+Input recording and replay
+Records the held keys of every logic tick into a compact file and feeds
+them back through Game.input_source, so a session can be replayed exactly
+as a repeatable workload. Checksums of the game state taken while
+recording are compared during replay to catch runs that diverge.
+
+File layout (little-endian):
+    header     magic, version, start level, tick count, run count, checksum count
+    runs       run count records of (key mask uint8, ticks uint16), the
+               key mask of every tick run-length encoded
+    checksums  checksum count records of (tick uint32, crc32 uint32), the
+               state before that tick's input; the last one is the final state
+
+Example:
+    python main.py --record session.pkr
+    python main.py --replay session.pkr
+"""
+
+import zlib
+import struct
+import pygame
+from settings import REPLAY_CHECKSUM_INTERVAL
+from headless import KeyState
+
+MAGIC = b'PKIR'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIII')  # magic, version, start level, ticks, runs, checksums
+RUN = struct.Struct('<BH')
+CHECKSUM = struct.Struct('<II')
+MAX_RUN = 0xFFFF
+
+# Bit of each recorded key in the key mask
+KEY_BITS = (
+    (pygame.K_LEFT, 1),
+    (pygame.K_RIGHT, 2),
+    (pygame.K_UP, 4),
+)
+
+# Key state for every possible mask
+MASK_STATES = [
+    KeyState(key for key, bit in KEY_BITS if mask & bit)
+    for mask in range(1 << len(KEY_BITS))
+]
+
+
+def encode_keys(keys):
+    """Pack the recorded keys of a key state into a mask"""
+    mask = 0
+    for key, bit in KEY_BITS:
+        if keys[key]:
+            mask |= bit
+    return mask
+
+
+def state_checksum(game):
+    """
+    Checksum of the game state that input can influence
+
+    Args:
+        game (Game): Running game
+
+    Returns:
+        int: CRC32 of the score, level, player and enemy state
+    """
+    player = game.player
+    level = game.level
+    state = (
+        game.score,
+        game.current_level,
+        player.rect.topleft,
+        (player.velocity.x, player.velocity.y),
+        player.health,
+        player.on_ground,
+        level.collected_coins,
+        level.total_coins,
+        tuple(enemy.rect.topleft for enemy in level.enemy_system.sprites),
+    )
+    return zlib.crc32(repr(state).encode('ascii'))
+
+
+class InputRecorder:
+    """
+    Input source recording the keys returned by another source every tick.
+    Use in place of Game.input_source; save() writes the recording.
+    """
+
+    def __init__(self, source, game, path, checksum_interval=REPLAY_CHECKSUM_INTERVAL):
+        """
+        Args:
+            source: Input source being recorded, e.g. pygame.key.get_pressed
+            game (Game): Game whose state is checksummed
+            path (str): File written by save()
+            checksum_interval (int): Ticks between state checksums
+        """
+        self.source = source
+        self.game = game
+        self.path = path
+        self.checksum_interval = checksum_interval
+        self.start_level = game.current_level
+        self.runs = []  # [mask, ticks]
+        self.checksums = []  # (tick, crc32)
+        self.tick = 0
+
+    def __call__(self):
+        """Read and record the keys for the current tick"""
+        if self.tick % self.checksum_interval == 0:
+            self.checksums.append((self.tick, state_checksum(self.game)))
+
+        keys = self.source()
+        mask = encode_keys(keys)
+        runs = self.runs
+        if runs and runs[-1][0] == mask and runs[-1][1] < MAX_RUN:
+            runs[-1][1] += 1
+        else:
+            runs.append([mask, 1])
+        self.tick += 1
+        return keys
+
+    def save(self):
+        """Write the recording, ending with a checksum of the current state"""
+        checksums = list(self.checksums)
+        if not checksums or checksums[-1][0] != self.tick:
+            checksums.append((self.tick, state_checksum(self.game)))
+
+        parts = [HEADER.pack(MAGIC, VERSION, self.start_level, self.tick, len(self.runs), len(checksums))]
+        parts.extend(RUN.pack(mask, ticks) for mask, ticks in self.runs)
+        parts.extend(CHECKSUM.pack(tick, checksum) for tick, checksum in checksums)
+        with open(self.path, 'wb') as f:
+            f.write(b''.join(parts))
+
+
+class InputReplay:
+    """
+    Input source playing back a recording.
+    Checks the game state against the recorded checksums as it goes and
+    stops the game once every recorded tick has been played.
+    """
+
+    def __init__(self, path, game=None):
+        """
+        Load a recording
+
+        Args:
+            path (str): Recording written by InputRecorder
+            game (Game): Game being driven, checksums are skipped without one
+
+        Raises:
+            ValueError: If the file is not a recording of a supported version
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"Corrupt input recording: {path}")
+        magic, version, start_level, ticks, run_count, checksum_count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not an input recording (version {VERSION}): {path}")
+        if len(data) < HEADER.size + RUN.size * run_count + CHECKSUM.size * checksum_count:
+            raise ValueError(f"Corrupt input recording: {path}")
+
+        self.game = game
+        self.start_level = start_level
+
+        # One mask byte per tick
+        self.masks = bytearray()
+        offset = HEADER.size
+        for mask, count in RUN.iter_unpack(data[offset:offset + RUN.size * run_count]):
+            self.masks += bytes([mask]) * count
+        if len(self.masks) != ticks:
+            raise ValueError(f"Corrupt input recording: {path}")
+
+        offset += RUN.size * run_count
+        self.expected = dict(CHECKSUM.iter_unpack(data[offset:offset + CHECKSUM.size * checksum_count]))
+        self.mismatches = []  # (tick, expected, actual)
+        self.tick = 0
+
+    def _check(self):
+        """Compare the state against the checksum recorded for this tick, if not done yet"""
+        expected = self.expected.pop(self.tick, None)
+        if expected is None or self.game is None:
+            return
+        actual = state_checksum(self.game)
+        if actual != expected:
+            self.mismatches.append((self.tick, expected, actual))
+
+    def __call__(self):
+        """Return the recorded keys for the current tick"""
+        self._check()
+        if self.tick >= len(self.masks):
+            # Played everything, the final state has just been checked
+            if self.game is not None:
+                self.game.running = False
+            return MASK_STATES[0]
+        keys = MASK_STATES[self.masks[self.tick]]
+        self.tick += 1
+        return keys
+
+    @property
+    def finished(self):
+        """Whether every recorded tick has been played"""
+        return self.tick >= len(self.masks)
+
+    def verify(self):
+        """
+        Check the final state once every tick has been played
+
+        Checksums of ticks the replay never reached count as mismatches with
+        an actual value of None, so a replay stopped early does not pass.
+
+        Returns:
+            list: (tick, expected, actual) of every checksum that did not match
+        """
+        if self.finished:
+            self._check()
+        for tick in sorted(self.expected):
+            self.mismatches.append((tick, self.expected.pop(tick), None))
+        return self.mismatches
+
+    def __len__(self):
+        return len(self.masks)
@@ -0,0 +1,522 @@
+"""
+Level analyzer
+Checks offline that every coin of a text level can be collected.
+Player movement is simulated tick by tick with the game's physics
+(player.update followed by the Level collision passes) from every spot the
+player can stand on or bounce off a trampoline from, trying each walking step
+and jump. The spots reached form a graph whose edges record the coins and finish points touched on the
+way; coins no reachable edge touches can never be collected.
+
+Simplifications:
+    - a coin is hit anywhere in its tile cell
+    - spots less than SPOT_PIXELS apart horizontally count as one
+    - enemies, hazards and powerups are ignored
+    - the player is kept inside the level, as for streamed levels
+    - the player starts at the 'p' cell, or at the Game start position when
+      it fits in the level, else in the first open cell
+
+Example:
+    python level_analyzer.py assets/levels --workers 8 --output report.json
+"""
+
+import os
+import sys
+import json
+import math
+import heapq
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import pygame
+from settings import (
+    tile_size, screen_height, PLAYER_SPEED, JUMP_STRENGTH, GRAVITY,
+    TERMINAL_VELOCITY, TILE_MAPPING
+)
+from spatial_grid import SpatialGrid, SolidGrid
+from colliders import ColliderMap, collide_horizontal, collide_vertical
+from world import COIN_CHARS, level_dimensions
+
+PLAYER_SIZE = (50, 50)  # Player rect, the collision rect is 10 pixels narrower
+TRAMPOLINE_VELOCITY = -20  # Level._check_trampoline_collisions
+DEFAULT_START = (100, screen_height - 2 * tile_size)  # Game.start_level
+MAX_MOVE_TICKS = 600  # Moves that have not landed by then are dead ends
+WALK_TICKS = 3  # Ticks of one walking step
+SPOT_PIXELS = 8  # Width of the columns spots are merged in
+
+# Moves tried from every spot: (jump, direction, ticks the direction key is
+# held or None for until landing)
+MOVES = [(False, -1, WALK_TICKS), (False, 1, WALK_TICKS), (True, 0, None)]
+MOVES += [(True, direction, hold) for direction in (-1, 1) for hold in (3, 6, 12, None)]
+
+
+class LevelModel:
+    """Walls and touchable objects of a level"""
+
+    def __init__(self, rows):
+        """
+        Args:
+            rows (list): Level rows using the TILE_MAPPING characters
+        """
+        self.columns, self.rows = level_dimensions(rows)
+        self.pixel_rect = pygame.Rect(0, 0, self.columns * tile_size, self.rows * tile_size)
+
+        grid = SolidGrid(self.columns, self.rows)
+        self.colliders = ColliderMap(grid)
+        self.touchables = SpatialGrid(tile_size)  # (kind, (col, row), rect)
+        self.coins = []  # (col, row)
+        self.finish_points = []
+        self.unknown = []  # (col, row, tile_char)
+        self.start = None
+
+        for row_index, row in enumerate(rows):
+            y = row_index * tile_size
+            for col_index, char in enumerate(row):
+                x = col_index * tile_size
+                cell = (col_index, row_index)
+                if char == '#':
+                    grid.set_solid((x, y))
+                    self.colliders.mark_dirty((x, y))
+                elif char in COIN_CHARS:
+                    self.coins.append(cell)
+                    self._add_touchable('coin', cell, tile_size)
+                elif char == 'f':
+                    self.finish_points.append(cell)
+                    self._add_touchable('finish', cell, tile_size)
+                elif char == 't':
+                    self._add_touchable('trampoline', cell, tile_size // 2)
+                elif char == 'p':
+                    self.start = (x, y)
+                elif char not in TILE_MAPPING:
+                    self.unknown.append((col_index, row_index, char))
+
+        if self.start is None:
+            self.start = self._default_start()
+
+    def _fits(self, topleft):
+        """Whether the player fits inside the level at a position without touching a wall"""
+        rect = pygame.Rect(topleft, PLAYER_SIZE)
+        return self.pixel_rect.contains(rect) and not self.colliders.query(rect)
+
+    def _default_start(self):
+        """The Game start position, or the first open cell if the player does not fit there"""
+        if self._fits(DEFAULT_START):
+            return DEFAULT_START
+        for row in range(self.rows):
+            for col in range(self.columns):
+                if self._fits((col * tile_size, row * tile_size)):
+                    return col * tile_size, row * tile_size
+        return DEFAULT_START
+
+    def _add_touchable(self, kind, cell, height):
+        """Index an object covering the top height pixels of a cell"""
+        rect = pygame.Rect(cell[0] * tile_size, cell[1] * tile_size, tile_size, height)
+        self.touchables.insert((kind, cell, rect), rect)
+
+
+class Body:
+    """The part of the player state movement depends on, with the player's attribute names"""
+
+    __slots__ = ('rect', 'collision_rect', 'velocity', 'acceleration', 'on_ground', 'jumping')
+
+    def __init__(self, topleft, vy=0.0, on_ground=False):
+        self.rect = pygame.Rect(topleft, PLAYER_SIZE)
+        self.collision_rect = pygame.Rect(0, 0, PLAYER_SIZE[0] - 10, PLAYER_SIZE[1])
+        self.collision_rect.midbottom = self.rect.midbottom
+        self.velocity = pygame.Vector2(0, vy)
+        self.acceleration = pygame.Vector2(0, GRAVITY)
+        self.on_ground = on_ground
+        self.jumping = False
+
+    def state(self):
+        """Hashable state a move can start from"""
+        return self.rect.topleft, self.velocity.y, self.on_ground
+
+
+def step(model, body, direction, jump):
+    """
+    Advance the player by one tick, in the order the game does
+
+    Args:
+        model (LevelModel): Level being played
+        body (Body): Player state, updated in place
+        direction (int): -1, 0 or 1 for the held arrow key
+        jump (bool): Whether the jump key is held
+
+    Returns:
+        list: (kind, (col, row)) of the coins and finish points touched
+    """
+    rect = body.rect
+    collision_rect = body.collision_rect
+    velocity = body.velocity
+    bounds = model.pixel_rect
+
+    # player.handle_input
+    velocity.x = direction * PLAYER_SPEED
+    if jump and body.on_ground:
+        velocity.y = -JUMP_STRENGTH
+        body.on_ground = False
+
+    # player.update, the collision rect is synced before the boundary check
+    velocity.y = min(velocity.y + GRAVITY, TERMINAL_VELOCITY)
+    rect.x += velocity.x
+    collision_rect.midbottom = rect.midbottom
+    rect.y += velocity.y
+    collision_rect.midbottom = rect.midbottom
+    if rect.left < 0:
+        rect.left = 0
+        velocity.x = 0
+    if rect.right > bounds.right:
+        rect.right = bounds.right
+        velocity.x = 0
+    if rect.bottom > bounds.bottom:
+        rect.bottom = bounds.bottom
+        velocity.y = 0
+        body.on_ground = True
+
+    # The Level collision passes
+    collide_horizontal(body, model.colliders.query)
+    collide_vertical(body, model.colliders.query)
+
+    # Special objects take the collision rect, coins the player rect
+    touched = []
+    for kind, cell, object_rect in model.touchables.query(rect):
+        if kind == 'coin':
+            if rect.colliderect(object_rect):
+                touched.append((kind, cell))
+        elif collision_rect.colliderect(object_rect):
+            if kind == 'finish':
+                touched.append((kind, cell))
+            elif velocity.y > 0:
+                velocity.y = TRAMPOLINE_VELOCITY
+    return touched
+
+
+def simulate(model, state, move):
+    """
+    Play one move until the player stands again or bounces off a trampoline
+
+    Args:
+        model (LevelModel): Level being played
+        state (tuple): Body.state() the move starts from
+        move (tuple): (jump, direction, hold) entry of MOVES
+
+    Returns:
+        tuple: (state, ticks, touched) with the state the move ends in,
+        None if it never ends or the player falls out of the level, and the
+        (kind, cell) pairs touched in order
+    """
+    jump, direction, hold = move
+    body = Body(*state)
+    touched = []
+    bottom = model.pixel_rect.bottom
+    for tick in range(MAX_MOVE_TICKS):
+        held = hold is None or tick < hold
+        for item in step(model, body, direction if held else 0, jump and tick == 0):
+            if item not in touched:
+                touched.append(item)
+        if body.velocity.y == TRAMPOLINE_VELOCITY or (body.on_ground and (hold is None or tick + 1 >= hold)):
+            return body.state(), tick + 1, touched
+        if body.collision_rect.top >= bottom:
+            break
+    return None, MAX_MOVE_TICKS, touched
+
+
+def build_graph(model):
+    """
+    Find every spot the player can stand on or bounce from, and the moves between them
+
+    Args:
+        model (LevelModel): Level to explore
+
+    Returns:
+        tuple: (start, edges) where start is the first edge, falling from
+        the start position, and edges maps each reached state to its
+        (state, ticks, touched) moves
+    """
+    # The first state found in each spot stands in for the whole spot
+    spots = {}
+
+    def spot(state):
+        if state is None:
+            return None
+        (x, y), vy, on_ground = state
+        return spots.setdefault((x // SPOT_PIXELS, y, vy, on_ground), state)
+
+    target, ticks, touched = simulate(model, (model.start, 0.0, False), (False, 0, None))
+    start = (spot(target), ticks, touched)
+    edges = {}
+    pending = [start[0]] if start[0] is not None else []
+    while pending:
+        state = pending.pop()
+        if state in edges:
+            continue
+        moves = edges[state] = []
+        for move in MOVES:
+            target, ticks, touched = simulate(model, state, move)
+            target = spot(target)
+            if target == state and not touched:
+                continue  # Blocked move
+            moves.append((target, ticks, touched))
+            if target is not None and target not in edges:
+                pending.append(target)
+    return start, edges
+
+
+def coin_reach(edges):
+    """
+    Find the coins that can still be collected from each state.
+    States are grouped into strongly connected components (Kosaraju), whose
+    coin sets are then accumulated from the components that lead nowhere back.
+
+    Args:
+        edges (dict): Moves from build_graph()
+
+    Returns:
+        dict: State -> frozenset of coin cells reachable from it
+    """
+    # Depth-first finishing order
+    order = []
+    seen = set()
+    for root in edges:
+        if root in seen:
+            continue
+        seen.add(root)
+        stack = [(root, iter(edges[root]))]
+        while stack:
+            state, moves = stack[-1]
+            for target, _, _ in moves:
+                if target is not None and target not in seen:
+                    seen.add(target)
+                    stack.append((target, iter(edges[target])))
+                    break
+            else:
+                stack.pop()
+                order.append(state)
+
+    reverse = {state: [] for state in edges}
+    for state, moves in edges.items():
+        for target, _, _ in moves:
+            if target is not None:
+                reverse[target].append(state)
+
+    # Components come out with every move leading to the same or a later one
+    component = {}
+    components = []
+    for root in reversed(order):
+        if root in component:
+            continue
+        index = len(components)
+        component[root] = index
+        members = [root]
+        for state in members:
+            for source in reverse[state]:
+                if source not in component:
+                    component[source] = index
+                    members.append(source)
+        components.append(members)
+
+    reach = [None] * len(components)
+    for index in range(len(components) - 1, -1, -1):
+        coins = set()
+        for state in components[index]:
+            for target, _, touched in edges[state]:
+                coins.update(cell for kind, cell in touched if kind == 'coin')
+                if target is not None and component[target] != index:
+                    coins |= reach[component[target]]
+        reach[index] = frozenset(coins)
+    return {state: reach[component[state]] for state in edges}
+
+
+def collection_route(start, edges, coins):
+    """
+    Plan a route through the coins, nearest coin first.
+    Each leg is a shortest path in ticks to the closest move touching a coin
+    that leaves every other coin collectable; the visiting order is greedy.
+
+    Args:
+        start (tuple): First edge from build_graph()
+        edges (dict): Moves from build_graph()
+        coins (set): Coin cells to collect
+
+    Returns:
+        tuple: (route, ticks) with the coin cells in collection order; coins
+        that cannot all be collected in one run are left out
+    """
+    reach = coin_reach(edges)
+    remaining = set(coins)
+    route = []
+
+    def collected(path):
+        cells = []
+        for _, _, touched in path:
+            for kind, cell in touched:
+                if kind == 'coin' and cell in remaining and cell not in cells:
+                    cells.append(cell)
+        return cells
+
+    state, total, _ = start
+    for cell in collected([start]):
+        remaining.discard(cell)
+        route.append(cell)
+
+    while remaining and state is not None:
+        # Dijkstra until the cheapest acceptable move touching a remaining
+        # coin is known, keeping the cheapest one overall as a fallback
+        dist = {state: 0}
+        previous = {}
+        heap = [(0, 0, state)]
+        order = 1
+        best = fallback = None  # (ticks, path, cells)
+        while heap:
+            ticks, _, current = heapq.heappop(heap)
+            if ticks > dist[current]:
+                continue
+            if best is not None and ticks >= best[0]:
+                break
+            for edge in edges[current]:
+                cost = ticks + edge[1]
+                target = edge[0]
+                if (best is None or cost < best[0]) and any(
+                        kind == 'coin' and cell in remaining for kind, cell in edge[2]):
+                    path = [edge]
+                    node = current
+                    while node != state:
+                        node, step_edge = previous[node]
+                        path.append(step_edge)
+                    path.reverse()
+                    cells = collected(path)
+                    left = remaining.difference(cells)
+                    if not left or (target is not None and left <= reach[target]):
+                        best = (cost, path, cells)
+                    elif fallback is None or cost < fallback[0]:
+                        fallback = (cost, path, cells)
+                if target is not None and cost < dist.get(target, cost + 1):
+                    dist[target] = cost
+                    previous[target] = (current, edge)
+                    heapq.heappush(heap, (cost, order, target))
+                    order += 1
+        leg = best or fallback
+        if leg is None:
+            break
+        cost, path, cells = leg
+        for cell in cells:
+            remaining.discard(cell)
+            route.append(cell)
+        total += cost
+        state = path[-1][0]
+    return route, total
+
+
+def analyze_level(rows):
+    """
+    Check that a level can be completed and every coin collected
+
+    Args:
+        rows (list): Level rows using the TILE_MAPPING characters
+
+    Returns:
+        dict: Report with the coin counts, unreachable coins, the coin route
+        and an 'errors' list that is empty for a valid level
+    """
+    model = LevelModel(rows)
+    start, edges = build_graph(model)
+
+    touched = set(start[2])
+    for moves in edges.values():
+        for edge in moves:
+            touched.update(edge[2])
+    reachable = {cell for kind, cell in touched if kind == 'coin'}
+    unreachable = [cell for cell in model.coins if cell not in reachable]
+    finish_reachable = any(kind == 'finish' for kind, cell in touched)
+    route, route_ticks = collection_route(start, edges, reachable)
+
+    # Level.is_complete, coins only count if one run collects them all
+    stranded = len(reachable) - len(route)
+    completable = finish_reachable or bool(model.coins and len(route) == len(model.coins))
+
+    errors = []
+    if model.unknown:
+        errors.append(f"{len(model.unknown)} unknown tile characters, first at {model.unknown[0][:2]}")
+    if start[0] is None:
+        errors.append(f"Player start {model.start} never lands")
+    if unreachable:
+        errors.append(f"{len(unreachable)} unreachable coins, first at {unreachable[0]}")
+    if stranded:
+        errors.append(f"{stranded} reachable coins cannot be collected in the same run as the rest")
+    if not completable:
+        errors.append("Level can never be completed")
+
+    return {
+        'size': [model.columns, model.rows],
+        'coins': len(model.coins),
+        'reachable_coins': len(model.coins) - len(unreachable),
+        'unreachable_coins': unreachable,
+        'finish_points': len(model.finish_points),
+        'finish_reachable': finish_reachable,
+        'spots': len(edges),
+        'route': route,
+        'route_ticks': route_ticks,
+        'errors': errors,
+    }
+
+
+def analyze_file(path):
+    """Analyze a text level file, see analyze_level()"""
+    with open(path, 'r') as f:
+        rows = f.read().splitlines()
+    report = analyze_level(rows)
+    report['path'] = path
+    return report
+
+
+def level_files(paths):
+    """Expand directories to the text levels they contain"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(
+                os.path.join(path, name) for name in os.listdir(path) if name.endswith('.txt')
+            ))
+        else:
+            files.append(path)
+    return files
+
+
+def analyze_paths(paths, workers=None):
+    """
+    Analyze level files and directories of them in parallel
+
+    Args:
+        paths (list): Text level files or directories
+        workers (int): Worker processes, os.cpu_count() if None, 1 runs in this process
+
+    Returns:
+        list: analyze_file() reports in file order
+    """
+    files = level_files(paths)
+    if workers == 1 or len(files) < 2:
+        return [analyze_file(path) for path in files]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(analyze_file, files))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check that every coin of the levels can be collected")
+    parser.add_argument('paths', nargs='+', help="text level files or directories of them")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes, one per CPU by default")
+    parser.add_argument('--output', help="JSON file to write the full reports to")
+    args = parser.parse_args()
+
+    reports = analyze_paths(args.paths, args.workers)
+    failed = 0
+    for report in reports:
+        status = "FAIL" if report['errors'] else "ok"
+        print(f"{status:4} {report['path']}: {report['reachable_coins']}/{report['coins']} coins, "
+              f"route {report['route_ticks']} ticks")
+        for error in report['errors']:
+            print(f"     {error}")
+        failed += bool(report['errors'])
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(reports, f, indent=2)
+    print(f"{len(reports) - failed}/{len(reports)} levels valid")
+    sys.exit(1 if failed else 0)
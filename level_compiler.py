@@ -0,0 +1,220 @@
+"""
+Level compiler
+Turns text levels into a compact binary grid that can be memory-mapped and
+built without parsing the level character by character.
+
+File layout (little-endian):
+    header    magic, version, width, height, wall count, entity count
+    tiles     width * height bytes, one TILE_CODES index per cell
+    walls     wall count uint32 cell indices (row * width + col)
+    entities  entity count records of (col uint16, row uint16, code uint8),
+              sorted by code so each entity type is one contiguous table
+
+Example:
+    python level_compiler.py assets/levels/level1.txt assets/levels/level2.txt
+"""
+
+import os
+import sys
+import mmap
+import struct
+from settings import COMPILED_LEVEL_EXTENSION
+
+MAGIC = b'PKLV'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIIII')  # magic, version, reserved, width, height, walls, entities
+ENTITY = struct.Struct('<HHB')
+
+# Tile characters in code order, fixed by the file format: new characters are
+# appended, never inserted. Code UNKNOWN_CODE marks characters without a code.
+TILE_CODES = ('#', ' ', 'c', 's', 'g', 'b', 'e', 'h', 'p', 'f', 'w', 'l', 't')
+UNKNOWN_CODE = 255
+CHAR_TO_CODE = {char: code for code, char in enumerate(TILE_CODES)}
+WALL_CODE = CHAR_TO_CODE['#']
+EMPTY_CODE = CHAR_TO_CODE[' ']
+
+# Translation table from stored codes back to characters
+CODE_TO_CHAR = bytes(
+    ord(TILE_CODES[code]) if code < len(TILE_CODES) else ord(' ')
+    for code in range(256)
+)
+
+
+def compile_level(rows):
+    """
+    Compile level rows into the binary format
+
+    Args:
+        rows (list): Level rows using the TILE_MAPPING characters
+
+    Returns:
+        bytes: Compiled level
+    """
+    width = max((len(row) for row in rows), default=0)
+    height = len(rows)
+
+    tiles = bytearray(width * height)
+    tiles[:] = bytes([EMPTY_CODE]) * len(tiles)
+    walls = []
+    entities = []
+
+    for row_index, row in enumerate(rows):
+        base = row_index * width
+        for col_index, char in enumerate(row):
+            code = CHAR_TO_CODE.get(char, UNKNOWN_CODE)
+            tiles[base + col_index] = code
+            if code == WALL_CODE:
+                walls.append(base + col_index)
+            elif code != EMPTY_CODE and code != UNKNOWN_CODE:
+                entities.append((code, col_index, row_index))
+
+    entities.sort()
+    parts = [
+        HEADER.pack(MAGIC, VERSION, 0, width, height, len(walls), len(entities)),
+        bytes(tiles),
+        struct.pack(f'<{len(walls)}I', *walls),
+    ]
+    parts.extend(ENTITY.pack(col, row, code) for code, col, row in entities)
+    return b''.join(parts)
+
+
+def compile_file(source, destination=None):
+    """
+    Compile a text level file
+
+    Args:
+        source (str): Path of the text level
+        destination (str): Output path, defaults to the source with COMPILED_LEVEL_EXTENSION
+
+    Returns:
+        str: Path of the compiled level
+    """
+    if destination is None:
+        destination = os.path.splitext(source)[0] + COMPILED_LEVEL_EXTENSION
+    with open(source, 'r') as f:
+        rows = f.read().splitlines()
+    with open(destination, 'wb') as f:
+        f.write(compile_level(rows))
+    return destination
+
+
+class CompiledLevel:
+    """
+    Memory-mapped compiled level.
+    The tile grid and wall table are views straight into the mapped file,
+    nothing is decoded until it is asked for.
+    """
+
+    def __init__(self, path):
+        """
+        Map a compiled level file
+
+        Args:
+            path (str): Path of the compiled level
+
+        Raises:
+            ValueError: If the file is not a compiled level of a supported
+                version or is shorter than its header says
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise ValueError(f"Truncated compiled level: {path}")
+            self.mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, width, height, wall_count, entity_count = HEADER.unpack_from(self.mapping)
+        if magic != MAGIC or version != VERSION:
+            self.mapping.close()
+            raise ValueError(f"Not a compiled level (version {VERSION}): {path}")
+        if len(self.mapping) < HEADER.size + width * height + 4 * wall_count + ENTITY.size * entity_count:
+            self.mapping.close()
+            raise ValueError(f"Truncated compiled level: {path}")
+
+        self.width = width
+        self.height = height
+        self.wall_count = wall_count
+        self.entity_count = entity_count
+
+        view = memoryview(self.mapping)
+        offset = HEADER.size
+        self.tiles = view[offset:offset + width * height]
+        offset += width * height
+        self.walls = view[offset:offset + 4 * wall_count].cast('I')
+        offset += 4 * wall_count
+        self.entity_data = view[offset:offset + ENTITY.size * entity_count]
+
+    def wall_positions(self):
+        """Yield the (col, row) cell of every wall"""
+        width = self.width
+        for index in self.walls:
+            yield index % width, index // width
+
+    def entities(self):
+        """Yield (tile_char, col, row) for every non-wall entity, grouped by type"""
+        for col, row, code in ENTITY.iter_unpack(self.entity_data):
+            yield TILE_CODES[code], col, row
+
+    def row(self, index):
+        """Return one row as a level string"""
+        start = index * self.width
+        return bytes(self.tiles[start:start + self.width]).translate(CODE_TO_CHAR).decode('ascii')
+
+    def row_slice(self, index, start, stop):
+        """Return part of one row as a level string"""
+        base = index * self.width
+        return bytes(self.tiles[base + start:base + stop]).translate(CODE_TO_CHAR).decode('ascii')
+
+    def to_rows(self):
+        """Return the whole level as a list of strings"""
+        return [self.row(index) for index in range(self.height)]
+
+    def __len__(self):
+        return self.height
+
+    def close(self):
+        """Release the memory mapping, the level cannot be read afterwards"""
+        if self.mapping.closed:
+            return
+        self.tiles.release()
+        self.walls.release()
+        self.entity_data.release()
+        self.mapping.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def load_level_data(text_path):
+    """
+    Load a level, preferring an up-to-date compiled version
+
+    Args:
+        text_path (str): Path of the text level
+
+    Returns:
+        CompiledLevel or list: Mapped compiled level, or the text rows if no
+        current compiled file exists, or None if neither exists
+    """
+    compiled_path = os.path.splitext(text_path)[0] + COMPILED_LEVEL_EXTENSION
+    text_exists = os.path.exists(text_path)
+    if os.path.exists(compiled_path):
+        if not text_exists or os.path.getmtime(compiled_path) >= os.path.getmtime(text_path):
+            try:
+                return CompiledLevel(compiled_path)
+            except ValueError as e:
+                print(f"Error loading compiled level: {e}")
+    if text_exists:
+        with open(text_path, 'r') as f:
+            return f.read().splitlines()
+    return None
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python level_compiler.py LEVEL.txt [LEVEL.txt ...]")
+        sys.exit(1)
+    for source in sys.argv[1:]:
+        print(f"{source} -> {compile_file(source)}")
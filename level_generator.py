@@ -0,0 +1,260 @@
+"""
+Procedural level generator
+Generates seeded levels of any size in the TILE_MAPPING alphabet. Rows are
+written as they are produced, so only the next platform tier is held in
+memory however large the level is, and batches of levels are spread over
+worker processes.
+
+Layout:
+    - walls around the level and a solid floor
+    - a platform tier every TIER_ROWS rows, runs of platform broken by gaps
+      to drop through or jump over
+    - shafts kept open through up to SHAFT_TIERS tiers with trampolines at
+      the bottom, the way back up since a jump cannot reach the next tier
+    - coins, enemies and pickups on the platforms, bonus coins at jump height
+    - the player start on the floor at the left, the finish on the top tier
+
+Example:
+    python level_generator.py assets/levels --count 100 --size 500x60 --seed 7 --workers 8
+"""
+
+import os
+import random
+import itertools
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+TIER_ROWS = 5  # Rows from one platform tier to the next, leaving room for a full jump
+PLATFORM_RUN = (3, 12)  # Platform length in cells
+GAP_RUN = (2, 4)  # Gap length in cells, a jump clears 6
+SHAFT_WIDTH = 2
+SHAFT_TIERS = 2  # Tiers a shaft passes at most, a bounce climbs about 12 rows
+SHAFT_SPACING = (12, 30)  # Columns from one shaft to the next
+SHAFT_MARGIN = 4  # Columns kept free of shafts at the left, where the player starts
+ITEM_CHANCE = 0.3  # Chance of an item on a platform cell
+BONUS_COIN_CHANCE = 0.1  # Chance of a coin at jump height above a platform cell
+MIN_SIZE = (8, TIER_ROWS + 2)
+TIER_CHARS = bytes.maketrans(b'\x00\x01', b' #')  # Solid flags to tier row characters
+
+# Relative frequency of each item standing on a platform
+ITEM_WEIGHTS = {
+    'c': 8,
+    's': 4,
+    'g': 2,
+    'e': 1,
+    'h': 1,
+    'w': 1,
+}
+
+
+def _build_tier(rng, width, shafts, floor):
+    """
+    Lay out one platform tier
+
+    Args:
+        rng (random.Random): Level random generator
+        width (int): Level width in cells
+        shafts (list): [col, tiers left] of the open shafts, updated in place
+        floor (bool): Whether this is the floor, which ends every shaft
+
+    Returns:
+        tuple: (solid, trampolines) with one solid flag per column and the
+        columns of the trampolines standing on the tier
+    """
+    if floor:
+        solid = bytearray(b'\x01' * width)
+    else:
+        solid = bytearray(width)
+        col = 1
+        platform = True
+        while col < width - 1:
+            run = rng.randint(*(PLATFORM_RUN if platform else GAP_RUN))
+            if platform:
+                solid[col:col + run] = b'\x01' * run
+            col += run
+            platform = not platform
+        del solid[width:]
+        solid[0] = solid[-1] = 1
+
+    # Shafts either continue through this tier or end on it
+    trampolines = []
+    taken = bytearray(width + 2)  # Columns new shafts must keep clear of
+    still_open = []
+    for col, tiers_left in shafts:
+        end = col + SHAFT_WIDTH
+        if floor or tiers_left == 0:
+            solid[col:end] = b'\x01' * SHAFT_WIDTH
+            trampolines.extend(range(col, end))
+        else:
+            solid[col:end] = bytes(SHAFT_WIDTH)
+            still_open.append([col, tiers_left - 1])
+        start = max(col - 2, 0)
+        taken[start:end + 2] = b'\x01' * (end + 2 - start)
+
+    if not floor:
+        opened = []
+        col = SHAFT_MARGIN + rng.randint(0, SHAFT_SPACING[1])
+        while col + SHAFT_WIDTH < width - 1:
+            if not any(taken[col:col + SHAFT_WIDTH]):
+                opened.append([col, rng.randint(0, SHAFT_TIERS - 1)])
+            col += rng.randint(*SHAFT_SPACING)
+
+        # The tier below needs a shaft ending on it to climb back up here
+        if not any(tiers_left == 0 for _, tiers_left in still_open + opened):
+            if opened:
+                opened[-1][1] = 0
+            else:
+                for col in range(SHAFT_MARGIN, width - 1 - SHAFT_WIDTH):
+                    if not any(taken[col:col + SHAFT_WIDTH]):
+                        opened.append([col, 0])
+                        break
+
+        for col, _ in opened:
+            solid[col:col + SHAFT_WIDTH] = bytes(SHAFT_WIDTH)
+        still_open.extend(opened)
+
+    shafts[:] = still_open
+    return solid, trampolines
+
+
+def generate_rows(width, height, seed=0):
+    """
+    Generate a level one row at a time
+
+    Args:
+        width (int): Number of columns
+        height (int): Number of rows
+        seed: Random seed, the same seed and size give the same level
+
+    Yields:
+        str: Level rows from top to bottom, using the TILE_MAPPING characters
+
+    Raises:
+        ValueError: If the level is smaller than MIN_SIZE
+    """
+    if width < MIN_SIZE[0] or height < MIN_SIZE[1]:
+        raise ValueError(f"Levels must be at least {MIN_SIZE[0]}x{MIN_SIZE[1]}, got {width}x{height}")
+
+    rng = random.Random(seed)
+    random_ = rng.random
+    items = [ord(char) for char in ITEM_WEIGHTS]
+    cum_weights = list(itertools.accumulate(ITEM_WEIGHTS.values()))
+    blank = b'#' + b' ' * (width - 2) + b'#'
+    empty_row = blank.decode('ascii')
+    floor = height - 1
+    shafts = []
+
+    # Tiers are counted up from the floor, leaving head room under the ceiling
+    tier_row = floor - (floor - TIER_ROWS) // TIER_ROWS * TIER_ROWS
+    solid, trampolines = _build_tier(rng, width, shafts, tier_row == floor)
+    top_tier = True
+
+    yield '#' * width
+    for row in range(1, height):
+        if row == tier_row:
+            yield solid.translate(TIER_CHARS).decode('ascii')
+            if row < floor:
+                tier_row += TIER_ROWS
+                solid, trampolines = _build_tier(rng, width, shafts, tier_row == floor)
+                top_tier = False
+            continue
+
+        above_tier = tier_row - row
+        if above_tier == 1:
+            # Standing on the tier
+            cells = bytearray(blank)
+            for col in trampolines:
+                cells[col] = ord('t')
+            platform = [col for col in range(1, width - 1) if solid[col] and cells[col] == ord(' ')]
+            chosen = [col for col in platform if random_() < ITEM_CHANCE]
+            for col, item in zip(chosen, rng.choices(items, cum_weights=cum_weights, k=len(chosen))):
+                cells[col] = item
+            if tier_row == floor:
+                cells[2] = ord('p')
+            if top_tier and platform:
+                cells[platform[-1]] = ord('f')
+            yield cells.decode('ascii')
+        elif above_tier == TIER_ROWS - 1:
+            # Just under the tier above, reached by jumping
+            cells = bytearray(blank)
+            for col in range(1, width - 1):
+                if solid[col] and random_() < BONUS_COIN_CHANCE:
+                    cells[col] = ord('g')
+            yield cells.decode('ascii')
+        else:
+            yield empty_row
+
+
+def write_level(path, width, height, seed=0):
+    """
+    Generate a level straight into a text level file
+
+    Args:
+        path (str): File to write
+        width (int): Number of columns
+        height (int): Number of rows
+        seed: Random seed
+
+    Returns:
+        str: The path written
+    """
+    with open(path, 'w') as f:
+        for row in generate_rows(width, height, seed):
+            f.write(row)
+            f.write('\n')
+    return path
+
+
+def level_seed(seed, index):
+    """Seed of one level of a batch, distinct for every batch seed and index"""
+    return f'{seed}:{index}'
+
+
+def generate_batch(directory, count, width, height, seed=0, first=1, workers=None):
+    """
+    Generate numbered levels in parallel worker processes
+
+    Args:
+        directory (str): Output directory, created if missing
+        count (int): Number of levels
+        width (int): Number of columns of each level
+        height (int): Number of rows of each level
+        seed: Batch seed, each level gets level_seed(seed, index)
+        first (int): Number of the first level, files are named levelN.txt
+        workers (int): Worker processes, os.cpu_count() if None, 1 runs in this process
+
+    Returns:
+        list: Paths written, in level order
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = [os.path.join(directory, f'level{first + index}.txt') for index in range(count)]
+    seeds = [level_seed(seed, index) for index in range(count)]
+    if workers == 1 or count < 2:
+        return [write_level(path, width, height, level) for path, level in zip(paths, seeds)]
+
+    workers = workers or os.cpu_count()
+    chunksize = max(1, count // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(write_level, paths, [width] * count, [height] * count, seeds,
+                             chunksize=chunksize))
+
+
+def parse_size(text):
+    """Parse '500x60' into (columns, rows)"""
+    width, _, height = text.partition('x')
+    return int(width), int(height)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate seeded procedural levels")
+    parser.add_argument('directory', help="output directory, e.g. assets/levels")
+    parser.add_argument('--count', type=int, default=1, help="number of levels")
+    parser.add_argument('--size', type=parse_size, default=(200, 30), help="COLSxROWS of each level")
+    parser.add_argument('--seed', type=int, default=0, help="batch random seed")
+    parser.add_argument('--first', type=int, default=1, help="number of the first level file")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes, one per CPU by default")
+    args = parser.parse_args()
+
+    paths = generate_batch(args.directory, args.count, *args.size, seed=args.seed,
+                           first=args.first, workers=args.workers)
+    print(f"{len(paths)} levels written to {args.directory}")
@@ -0,0 +1,217 @@
+import threading
+import pygame
+from settings import tile_size, TILE_LAYER_CHUNK_SIZE, WORLD_STREAMING_MIN_CELLS
+from level_compiler import CompiledLevel, load_level_data
+from world import level_dimensions
+
+# Fallback level data used when no level file exists (can be customized for each level)
+FALLBACK_LEVELS = {
+    1: [
+        "####################",
+        "#                  #",
+        "#  c g b           #",
+        "# ######   ####    #",
+        "#        c         #",
+        "####################",
+    ],
+    2: [
+        "####################",
+        "#       g          #",
+        "#  c    #    b     #",
+        "# #### ### ###     #",
+        "#      c      g    #",
+        "####################",
+    ],
+    3: [
+        "####################",
+        "#       g g g      #",
+        "# c b c # # # b c  #",
+        "####### # # ###### #",
+        "#           g      #",
+        "####################",
+    ],
+}
+
+
+def level_file_path(level_number):
+    """Return the text file path of a level"""
+    return f'assets/levels/level{level_number}.txt'
+
+
+def get_level_data(level_number):
+    """
+    Get the data for a level
+
+    Args:
+        level_number (int): Level to load
+
+    Returns:
+        CompiledLevel or list: Compiled level if an up-to-date one exists,
+        otherwise the text rows, otherwise the hardcoded fallback rows
+    """
+    level_data = load_level_data(level_file_path(level_number))
+    if level_data is None:
+        level_data = FALLBACK_LEVELS.get(level_number, FALLBACK_LEVELS[3])
+    return level_data
+
+
+def render_tile_layer(tiles, chunk_size=TILE_LAYER_CHUNK_SIZE):
+    """
+    Render static tiles into chunk surfaces
+
+    Args:
+        tiles: Iterable of (image, rect) pairs
+        chunk_size (int): Chunk width and height in pixels
+
+    Returns:
+        list: (position, surface) for every chunk containing tiles
+    """
+    chunks = {}
+    for image, rect in tiles:
+        # A tile can straddle chunk borders if the chunk size is not a tile multiple
+        for chunk_y in range(rect.top // chunk_size, (rect.bottom - 1) // chunk_size + 1):
+            for chunk_x in range(rect.left // chunk_size, (rect.right - 1) // chunk_size + 1):
+                chunk = chunks.get((chunk_x, chunk_y))
+                if chunk is None:
+                    chunk = pygame.Surface((chunk_size, chunk_size), pygame.SRCALPHA)
+                    chunks[(chunk_x, chunk_y)] = chunk
+                chunk.blit(image, (rect.x - chunk_x * chunk_size, rect.y - chunk_y * chunk_size))
+
+    return [
+        ((chunk_x * chunk_size, chunk_y * chunk_size), chunk)
+        for (chunk_x, chunk_y), chunk in chunks.items()
+    ]
+
+
+class LevelLayout:
+    """
+    Parsed static data of a level.
+    Everything here can be built away from the main thread; Level turns it
+    into sprites without looking at the level characters again.
+    """
+
+    def __init__(self, width, height, walls, entities, tile_layer=None):
+        """
+        Args:
+            width (int): Level width in cells
+            height (int): Level height in cells
+            walls (list): (x, y) pixel positions of solid tiles
+            entities (list): (tile_char, x, y) for every other level object
+            tile_layer (list): Optional pre-rendered tile layer chunks
+        """
+        self.width = width
+        self.height = height
+        self.walls = walls
+        self.entities = entities
+        self.tile_layer = tile_layer
+
+
+def parse_level(level_data):
+    """
+    Parse level data into a LevelLayout
+
+    Args:
+        level_data: Level rows or a CompiledLevel
+
+    Returns:
+        LevelLayout: Wall and entity positions
+    """
+    walls = []
+    entities = []
+    if isinstance(level_data, CompiledLevel):
+        walls = [(col * tile_size, row * tile_size) for col, row in level_data.wall_positions()]
+        entities = [(char, col * tile_size, row * tile_size) for char, col, row in level_data.entities()]
+        return LevelLayout(level_data.width, level_data.height, walls, entities)
+
+    for row_index, row in enumerate(level_data):
+        y = row_index * tile_size
+        for col_index, tile_char in enumerate(row):
+            if tile_char == '#':
+                walls.append((col_index * tile_size, y))
+            elif tile_char != ' ':
+                entities.append((tile_char, col_index * tile_size, y))
+    width, height = level_dimensions(level_data)
+    return LevelLayout(width, height, walls, entities)
+
+
+class LevelPreloader:
+    """
+    Loads the next level on a worker thread while the current one plays.
+    The worker reads and parses the level and pre-renders its tile layer;
+    the main thread picks the result up with take(). Levels big enough to
+    be streamed are only read, since they are never built in full.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.thread = None
+        self.level_number = None
+        self.layout = None
+        self.error = None
+
+    def start(self, level_number, tile_image):
+        """
+        Begin preloading a level in the background
+
+        Args:
+            level_number (int): Level to preload
+            tile_image (pygame.Surface): Shared tile image used for the tile layer
+        """
+        with self.lock:
+            if self.level_number == level_number:
+                return
+            self.level_number = level_number
+            self.layout = None
+            self.error = None
+
+        self.thread = threading.Thread(
+            target=self._load, args=(level_number, tile_image), daemon=True
+        )
+        self.thread.start()
+
+    def _load(self, level_number, tile_image):
+        """Worker thread body"""
+        try:
+            layout = get_level_data(level_number)
+            columns, rows = level_dimensions(layout)
+            if columns * rows <= WORLD_STREAMING_MIN_CELLS:
+                level_data = layout
+                layout = parse_level(level_data)
+                if isinstance(level_data, CompiledLevel):
+                    level_data.close()
+                size = tile_image.get_size()
+                layout.tile_layer = render_tile_layer(
+                    (tile_image, pygame.Rect(pos, size)) for pos in layout.walls
+                )
+        except (OSError, ValueError, pygame.error) as e:
+            with self.lock:
+                if self.level_number == level_number:
+                    self.error = e
+            return
+
+        with self.lock:
+            # Only publish if nobody asked for a different level meanwhile
+            if self.level_number == level_number:
+                self.layout = layout
+
+    def take(self, level_number):
+        """
+        Hand over a finished preload
+
+        Args:
+            level_number (int): Level the caller wants
+
+        Returns:
+            LevelLayout, or the raw level data of a streamed level, or None
+            if the preload is not ready
+        """
+        with self.lock:
+            if self.level_number != level_number or self.layout is None:
+                if self.error is not None:
+                    print(f"Error preloading level {level_number}: {self.error}")
+                    self.error = None
+                return None
+            layout = self.layout
+            self.layout = None
+            self.level_number = None
+            return layout
@@ -0,0 +1,99 @@
+import os
+import time
+from settings import LEVEL_WATCH_INTERVAL
+from world import level_dimensions
+
+
+def read_rows(path):
+    """Read a text level file into rows, None if it does not exist"""
+    try:
+        with open(path, 'r') as f:
+            return f.read().splitlines()
+    except FileNotFoundError:
+        return None
+
+
+def diff_rows(old_rows, new_rows):
+    """
+    Find the cells that differ between two versions of a level
+
+    Args:
+        old_rows (list): Previous level rows
+        new_rows (list): Edited level rows
+
+    Returns:
+        list: (col, row, tile_char) of each changed cell with its new
+        character, or None if the level size changed
+    """
+    width, height = level_dimensions(old_rows)
+    if level_dimensions(new_rows) != (width, height):
+        return None
+
+    changes = []
+    for row_index, (old, new) in enumerate(zip(old_rows, new_rows)):
+        if old == new:
+            continue
+        # Short rows are padded with empty cells
+        old = old.ljust(width)
+        new = new.ljust(width)
+        for col_index in range(width):
+            if old[col_index] != new[col_index]:
+                changes.append((col_index, row_index, new[col_index]))
+    return changes
+
+
+class LevelWatcher:
+    """
+    Watches a text level file for edits.
+    The file's modification time is checked at most every interval seconds;
+    when it changed, the new rows are compared against the previous ones.
+    """
+
+    def __init__(self, path, interval=LEVEL_WATCH_INTERVAL):
+        """
+        Args:
+            path (str): Text level file to watch
+            interval (float): Seconds between modification time checks
+        """
+        self.path = path
+        self.interval = interval
+        self.mtime = self._mtime()
+        self.rows = read_rows(path)
+        self.next_check = time.perf_counter() + interval
+
+    def _mtime(self):
+        """Modification time of the file, None if it does not exist"""
+        try:
+            return os.path.getmtime(self.path)
+        except OSError:
+            return None
+
+    def poll(self, now=None):
+        """
+        Check the file for changes
+
+        Args:
+            now (float): Current perf_counter() time, read if None
+
+        Returns:
+            tuple: (rows, changes) after an edit, where changes is the list
+            from diff_rows() or None if the level must be rebuilt;
+            None if nothing changed
+        """
+        if now is None:
+            now = time.perf_counter()
+        if now < self.next_check:
+            return None
+        self.next_check = now + self.interval
+
+        mtime = self._mtime()
+        if mtime == self.mtime:
+            return None
+        self.mtime = mtime
+
+        rows = read_rows(self.path)
+        if rows is None or rows == self.rows:
+            return None
+        changes = diff_rows(self.rows, rows) if self.rows is not None else None
+        self.rows = rows
+        return rows, changes
@@ -1,15 +1,28 @@
 import pygame
 import sys
-import os
+import time
+import argparse
 from settings import (
-    screen_width, screen_height, tile_size, fps, game_title
+    screen_width, screen_height, tile_size, fps, game_title, DIRTY_RECT_RENDERING,
+    DEBUG_SHOW_FPS, PROFILE_OUTPUT_PATH, LEVEL_PRELOAD, LEVEL_LOAD_SLICE, LEVEL_HOT_RELOAD,
+    BACKGROUND_IMAGE_PATH, MUSIC_PATH, MUSIC_VOLUME, PLAYER_IMAGE_PATH, TILE_IMAGE_PATH,
+    SOUND_COIN, SOUND_JUMP, STARTUP_TIMING_REPORT, ASSET_PACK_PATH
 )
+from asset_manager import assets
+from audio_manager import audio
+from text_cache import TextCache, GlyphAtlas
+from profiler import FrameProfiler, NULL_PROFILER
+from timestep import FixedTimestep, interpolate
+from camera import Camera
+from level_loader import LevelPreloader, get_level_data, level_file_path
+from level_watcher import LevelWatcher
+from input_recording import InputRecorder, InputReplay
 from player import player
 from coin import coin  # Import the Coin class
 
 
 try:
-    from assets.levels.level import level
+    from assets.levels.level import Level, Tile
 except ImportError as e:
     print(f"Error importing level module: {e}")
     pygame.quit()
@@ -19,24 +32,46 @@ class Game:
     """Main game class to manage the game loop and resources""" 
     def __init__(self):
         """Initialize the game, including pygame, display, and game resources"""
+        # Time spent in each startup stage, see report_startup()
+        self.startup_timings = []
+        stage_start = time.perf_counter()
+        
         # Initialize pygame
         pygame.init()
         pygame.mixer.init()
+        audio.init()
         
         # Set up display
         self.screen = pygame.display.set_mode((screen_width, screen_height))
         pygame.display.set_caption(game_title)
         self.clock = pygame.time.Clock()
+        stage_start = self.record_startup_stage('display', stage_start)
         
         # Game states
         self.running = True
         self.paused = False
+        self.world_advanced = False  # Whether the last tick moved the game world, for interpolation
         self.current_level = 1
         self.max_levels = 3  # Set the number of available levels
         self.score = 0
         
+        # Rendering state for dirty rectangle mode
+        self.dirty_rendering = DIRTY_RECT_RENDERING
+        self.static_background = None
+        self.previous_rects = []
+        self.full_redraw = True
+        
+        # Frame timing instrumentation
+        self.show_fps = DEBUG_SHOW_FPS
+        if DEBUG_SHOW_FPS or PROFILE_OUTPUT_PATH:
+            self.profiler = FrameProfiler(PROFILE_OUTPUT_PATH)
+        else:
+            self.profiler = NULL_PROFILER
+        self.fps_overlay = None
+        
         # Load assets
         self.load_assets()
+        stage_start = self.record_startup_stage('assets', stage_start)
         
         # Initialize game objects
         self.player = player(
@@ -45,52 +80,89 @@ class Game:
         
         # Preload coin images
         coin.preload_images()
+        stage_start = self.record_startup_stage('player and coins', stage_start)
+        
+        # Viewport following the player
+        self.camera = Camera()
+        self.last_camera_pos = None
         
         # Set up the first level
+        self.preloader = LevelPreloader()
+        self.level = None
+        self.pending_level = None
+        self.level_watcher = None
         self.setup_level(self.current_level)
+        stage_start = self.record_startup_stage('level', stage_start)
         
         # UI elements
         self.font = pygame.font.Font(None, 36)
+        self.text_cache = TextCache()
+        self.score_digits = GlyphAtlas(self.font, (255, 255, 255))
+        self.pause_overlay = None
+        self.debug_font = pygame.font.Font(None, 24)
         
+        # Where held keys are read each tick, replaced by scripted or replayed input
+        self.input_source = pygame.key.get_pressed
+        self.recorder = None
+        self.replay = None
+        self.record_startup_stage('ui', stage_start)
+        
+        if STARTUP_TIMING_REPORT:
+            self.report_startup()
+        
+    def record_startup_stage(self, name, start):
+        """
+        Record how long a startup stage took
+        
+        Args:
+            name (str): Stage name
+            start (float): perf_counter() value when the stage began
+            
+        Returns:
+            float: perf_counter() value to start the next stage from
+        """
+        now = time.perf_counter()
+        self.startup_timings.append((name, now - start))
+        return now
+    
+    def report_startup(self):
+        """Print the startup time per stage and per asset"""
+        total = sum(seconds for _, seconds in self.startup_timings)
+        print(f"Startup: {total * 1000:.1f} ms")
+        for name, seconds in self.startup_timings:
+            print(f"  {name:<20} {seconds * 1000:8.1f} ms")
+        print("Assets:")
+        for description, seconds in assets.timing_report():
+            print(f"  {seconds * 1000:8.1f} ms  {description}")
+    
     def load_assets(self):
-        """Load game assets like images and sounds"""
-        self.background_image = pygame.image.load(
-            'assets/images/background/clouds1.jpg'
-        ).convert()
+        """
+        Load the assets needed for the first frame
+        With an asset pack nothing needs decoding; otherwise the source
+        files are decoded in parallel up front. Music and the remaining
+        sound effects are loaded when first used.
+        """
+        if not assets.open_pack(ASSET_PACK_PATH):
+            assets.preload(
+                images=[
+                    (BACKGROUND_IMAGE_PATH, 'opaque'),
+                    (PLAYER_IMAGE_PATH, 'alpha'),
+                    (TILE_IMAGE_PATH, 'alpha'),
+                ],
+                sounds=[SOUND_COIN, SOUND_JUMP],
+            )
+        
         try:
-            self.background_image = pygame.image.load(
-                'assets/images/background/clouds1.jpg'
-            ).convert()
-            self.background_image = pygame.transform.scale(
-                self.background_image, (screen_width, screen_height)
+            self.background_image = assets.get_image(
+                BACKGROUND_IMAGE_PATH, (screen_width, screen_height), convert='opaque'
             )
-        except FileNotFoundError as e:
+        except (pygame.error, FileNotFoundError) as e:
             print(f"Error loading background: {e}")
             self.background_image = self.create_fallback_background()
         
-            pygame.mixer.music.load(
-                'assets/sounds/piano-melody-277609.mp3'
-            )
-        self.sounds = {}
-        try:
-            # Load music
-            pygame.mixer.music.load('assets/sounds/piano-melody-277609.mp3')
-            pygame.mixer.music.set_volume(0.5)  # Set to 50% volume
-            self.sounds['coin_collect'] = pygame.mixer.Sound(
-                'assets/sounds/coin_collect.wav'
-            )
-            self.sounds['jump'] = pygame.mixer.Sound(
-                'assets/sounds/jump.wav'
-            )
-            self.sounds['level_complete'] = pygame.mixer.Sound(
-                'assets/sounds/level_complete.wav'
-            )
-            self.sounds['jump'] = pygame.mixer.Sound('assets/sounds/jump.wav')
-            self.sounds['level_complete'] = pygame.mixer.Sound(
-                'assets/sounds/level_complete.wav'
-            )
-        except pygame.error as e:
-            print(f"Error loading sounds: {e}")
+        # Sound effects are played through the audio manager, which loads
+        # the ones not preloaded here on first use
+        self.music_loaded = False
     
     def create_fallback_background(self):
         """Create a simple gradient background if image fails to load"""
@@ -101,54 +173,144 @@ class Game:
             pygame.draw.line(bg, color, (0, y), (screen_width, y))
         return bg
     
-    def setup_level(self, level_number):
-        """Load and set up the specified level"""
-        # Example of loading different levels
-        level_file = f'assets/levels/level{level_number}.txt'
-        
-        # Check if level file exists, otherwise use hardcoded level data
-        if os.path.exists(level_file):
-            with open(level_file, 'r') as f:
-                level_data = f.read().splitlines()
-        else:
-            # Fallback level data (can be customized for each level)
-            if level_number == 1:
-                level_data = [
-                    "####################",
-                    "#                  #",
-                    "#  c g b           #",
-                    "# ######   ####    #",
-                    "#        c         #",
-                    "####################",
-                ]
-            elif level_number == 2:
-                level_data = [
-                    "####################",
-                    "#       g          #",
-                    "#  c    #    b     #",
-                    "# #### ### ###     #",
-                    "#      c      g    #",
-                    "####################",
-                ]
-            else:
-                level_data = [
-                    "####################",
-                    "#       g g g      #",
-                    "# c b c # # # b c  #",
-                    "####### # # ###### #",
-                    "#           g      #",
-                    "####################",
-                ]
+    def setup_level(self, level_number, level_data=None):
+        """
+        Load and set up the specified level
+        
+        Args:
+            level_number (int): Level to set up
+            level_data: Already loaded level data or LevelLayout, read from disk if None
+        """
+        if level_data is None:
+            level_data = get_level_data(level_number)
         
         # Create the level
-        self.level = Level(level_data, self.player)
+        self.start_level(Level(level_data, self.player, self.profiler))
+        
+        # Start loading the following level in the background
+        if LEVEL_PRELOAD:
+            self.preloader.start(self.following_level(level_number), Tile.load_image())
+    
+    def start_level(self, level):
+        """Make a fully loaded level the current one"""
+        # Hand the previous level's objects back for the next level to reuse
+        if self.level is not None and self.level is not level:
+            self.level.release()
+        self.level = level
+        self.pending_level = None
+        self.full_redraw = True
+        
+        # Pick up edits of the level file while playing
+        if LEVEL_HOT_RELOAD:
+            self.level_watcher = LevelWatcher(level_file_path(self.current_level))
         
         # Reset player position
         self.player.rect.topleft = (100, screen_height - 2 * tile_size)
         self.player.velocity.y = 0
+        self.player.previous_pos = None  # Don't interpolate across the jump
+        self.player.bounds = self.level_bounds(level)
+    
+    def level_bounds(self, level):
+        """Rect the player is kept in: the whole level when it is streamed, else the screen (None)"""
+        return level.world.pixel_rect if level.world is not None else None
+    
+    def following_level(self, level_number):
+        """Return the level that comes after the given one"""
+        return level_number + 1 if level_number < self.max_levels else 1
+    
+    def change_level(self, level_number):
+        """
+        Switch to another level
+        Uses the background preload if it is finished, otherwise loads the
+        level in time slices over the next frames.
+        """
+        self.current_level = level_number
+        if self.pending_level is not None:
+            # Hand back what the level still loading has created so far
+            self.pending_level.release()
+            self.pending_level = None
+        
+        layout = self.preloader.take(level_number)
+        if layout is not None:
+            self.setup_level(level_number, layout)
+            return
+        
+        self.pending_level = Level(
+            get_level_data(level_number), self.player, self.profiler, defer_load=True
+        )
+    
+    def continue_level_load(self):
+        """Spend this frame's loading budget on the pending level, called once per frame"""
+        if self.pending_level is None:
+            return
+        if self.pending_level.load_step(LEVEL_LOAD_SLICE):
+            self.start_level(self.pending_level)
+            if LEVEL_PRELOAD:
+                self.preloader.start(self.following_level(self.current_level), Tile.load_image())
+    
+    def reload_level_edits(self):
+        """Apply edits of the current level file without restarting the level"""
+        edit = self.level_watcher.poll()
+        if edit is None:
+            return
+        rows, changes = edit
+        
+        start = time.perf_counter()
+        if changes is None:
+            # The level size changed, rebuild it but leave the player where it is
+            pos = self.player.rect.topleft
+            level = Level(rows, self.player, self.profiler)
+            self.level.release()
+            self.level = level
+            self.player.rect.topleft = pos
+            self.player.bounds = self.level_bounds(level)
+            print(f"Reloaded level {self.current_level} in {(time.perf_counter() - start) * 1000:.1f} ms")
+        else:
+            self.level.patch(rows, changes)
+            print(f"Patched {len(changes)} cells of level {self.current_level} "
+                  f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+        self.full_redraw = True
+    
+    def start_recording(self, path):
+        """
+        Record the input of every tick, the file is written when the game quits
+        
+        Args:
+            path (str): Recording file to write
+        """
+        self.recorder = InputRecorder(self.input_source, self, path)
+        self.input_source = self.recorder
+    
+    def start_replay(self, path):
+        """
+        Play back a recording instead of reading the keyboard
+        The game stops once the recording ends.
+        
+        Args:
+            path (str): Recording written by start_recording()
+            
+        Returns:
+            InputReplay: The replay, for checking the result afterwards
+        """
+        replay = InputReplay(path, self)
+        if replay.start_level != self.current_level:
+            self.current_level = replay.start_level
+            self.setup_level(replay.start_level)
+        self.replay = replay
+        self.input_source = replay
+        return replay
     
     def start_music(self):
         """Start the background music"""
+        # Load music (streamed by the mixer, so not cached)
+        if not self.music_loaded:
+            try:
+                pygame.mixer.music.load(MUSIC_PATH)
+                pygame.mixer.music.set_volume(MUSIC_VOLUME)
+            except pygame.error as e:
+                print(f"Error loading music: {e}")
+                return
+            self.music_loaded = True
         pygame.mixer.music.play(-1)  # Play on loop
     
     def handle_events(self):
@@ -168,26 +330,35 @@ class Game:
                 # Debug: Level skip
                 elif event.key == pygame.K_n and pygame.key.get_mods() & pygame.KMOD_CTRL:
                     self.next_level()
-        
-        # Handle continuous key presses when not paused
-        if not self.paused:
-            keys = pygame.key.get_pressed()
-            self.player.handle_input(keys)
+
     
     def update(self):
         """Update game state"""
+        # Paused and loading ticks leave everything where it is
+        self.world_advanced = False
         if self.paused:
             return
+        
+        # Keep showing the finished level while the next one loads, see continue_level_load
+        if self.pending_level is not None:
+            return
+        self.world_advanced = True
+        
+        if self.level_watcher is not None:
+            self.reload_level_edits()
+        
+        # Held keys are read once per tick so recordings replay tick for tick
+        self.player.handle_input(self.input_source())
             
         # Update game objects
+        self.player.save_previous_position()
         self.player.update()
         
         # Update level and check for coins collected
         coins_collected = self.level.update()
         if coins_collected:
             self.score += coins_collected
-            if 'coin_collect' in self.sounds:
-                self.sounds['coin_collect'].play()
+            audio.play('coin_collect')
         
         # Check for level completion (example: all coins collected)
         if self.level.is_complete():
@@ -196,72 +367,229 @@ class Game:
     def next_level(self):
         """Advance to the next level or end game if all levels completed"""
         if self.current_level < self.max_levels:
-            if 'level_complete' in self.sounds:
-                self.sounds['level_complete'].play()
-            self.current_level += 1
-            self.setup_level(self.current_level)
+            audio.play('level_complete')
+            self.change_level(self.current_level + 1)
         else:
             # Game completed - could show victory screen
             print("Game completed! Final score:", self.score)
             # For now, we'll just reset to level 1
-            self.current_level = 1
-            self.setup_level(self.current_level)
+            self.change_level(1)
     
     def draw_ui(self):
-        """Draw user interface elements"""
-        # Score
-        score_text = self.font.render(f"Score: {self.score}", True, (255, 255, 255))
-        self.screen.blit(score_text, (20, 20))
+        """
+        Draw user interface elements
+        
+        Returns:
+            list: Rectangles that were drawn to
+        """
+        rects = []
+        
+        # Score label is cached, the number is drawn digit by digit
+        score_label = self.text_cache.render(self.font, "Score: ", (255, 255, 255))
+        label_rect = self.screen.blit(score_label, (20, 20))
+        rects.append(label_rect)
+        rects.append(self.score_digits.draw(self.screen, self.score, label_rect.topright))
         
         # Level indicator
-        level_text = self.font.render(f"Level: {self.current_level}/{self.max_levels}", True, (255, 255, 255))
-        self.screen.blit(level_text, (screen_width - 150, 20))
+        level_text = self.text_cache.render(
+            self.font, f"Level: {self.current_level}/{self.max_levels}", (255, 255, 255)
+        )
+        rects.append(self.screen.blit(level_text, (screen_width - 150, 20)))
         
         # Pause indicator
         if self.paused:
-            pause_text = self.font.render("PAUSED", True, (255, 0, 0))
-            text_rect = pause_text.get_rect(center=(screen_width // 2, screen_height // 2))
-            # Draw semi-transparent background
-            s = pygame.Surface((pause_text.get_width() + 20, pause_text.get_height() + 20))
-            s.set_alpha(150)
-            s.fill((0, 0, 0))
-            self.screen.blit(s, (text_rect.x - 10, text_rect.y - 10))
-            self.screen.blit(pause_text, text_rect)
+            if self.pause_overlay is None:
+                self.pause_overlay = self.create_pause_overlay()
+            overlay, overlay_pos = self.pause_overlay
+            rects.append(self.screen.blit(overlay, overlay_pos))
+        
+        # FPS and frame time overlay
+        if self.show_fps and self.profiler.enabled:
+            rects.append(self.draw_fps_overlay())
+        
+        return rects
     
-    def draw(self):
-        """Draw all game elements"""
-        # Background
-        self.screen.blit(self.background_image, (0, 0))
+    def draw_fps_overlay(self):
+        """
+        Draw FPS and frame time percentiles in the bottom-left corner
         
-        # Game elements
-        self.level.draw(self.screen)
-        self.player.draw(self.screen)
+        Returns:
+            pygame.Rect: Area that was drawn to
+        """
+        # Re-render twice a second rather than every frame
+        if self.fps_overlay is None or self.profiler.frame_count % 30 == 0:
+            times = self.profiler.percentiles()
+            text = "FPS {:.0f}  p50 {:.1f}  p95 {:.1f}  p99 {:.1f} ms".format(
+                self.profiler.fps(), times[50] * 1000, times[95] * 1000, times[99] * 1000
+            )
+            self.fps_overlay = self.debug_font.render(text, True, (255, 255, 0), (0, 0, 0))
+        return self.screen.blit(self.fps_overlay, (10, screen_height - self.fps_overlay.get_height() - 10))
+    
+    def create_pause_overlay(self):
+        """
+        Render the PAUSED banner with its semi-transparent box
         
-        # UI
-        self.draw_ui()
+        Returns:
+            tuple: (surface, top-left position)
+        """
+        pause_text = self.font.render("PAUSED", True, (255, 0, 0))
+        text_rect = pause_text.get_rect(center=(screen_width // 2, screen_height // 2))
+        # Semi-transparent background with the text on top
+        overlay = pygame.Surface((pause_text.get_width() + 20, pause_text.get_height() + 20), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 150))
+        overlay.blit(pause_text, (10, 10))
+        return overlay, (text_rect.x - 10, text_rect.y - 10)
+    
+    def draw(self, alpha=1.0):
+        """
+        Draw all game elements
+        
+        Args:
+            alpha (float): Interpolation factor between the previous and current logic tick
+        """
+        with self.profiler.section('draw'):
+            self.update_camera(alpha)
+            if self.dirty_rendering:
+                update_rects = self.draw_dirty(alpha)
+            else:
+                # Background
+                self.screen.blit(self.background_image, (0, 0))
+                
+                # Game elements
+                self.level.draw(self.screen, alpha, self.camera)
+                self.player.draw(self.screen, alpha, self.camera)
+                
+                # UI
+                self.draw_ui()
+                update_rects = None
         
         # Update display
-        pygame.display.flip()
+        with self.profiler.section('flip'):
+            if update_rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(update_rects)
+    
+    def update_camera(self, alpha=1.0):
+        """Center the camera on where the player is drawn this frame"""
+        target = pygame.Rect(
+            interpolate(self.player.previous_pos, self.player.rect.topleft, alpha),
+            self.player.rect.size
+        )
+        self.camera.follow(target, self.level.pixel_rect)
+    
+    def build_static_background(self):
+        """Render the background and the level's static tiles into one surface"""
+        self.static_background = self.background_image.copy()
+        self.level.draw_static(self.static_background, self.camera)
+        self.last_camera_pos = self.camera.rect.topleft
+    
+    def draw_dirty(self, alpha=1.0):
+        """
+        Draw only the regions that changed since the previous frame
+        
+        Args:
+            alpha (float): Interpolation factor between the previous and current logic tick
+        
+        Returns:
+            list: Screen areas to update, or None when the whole screen changed
+        """
+        # Start over with a full frame when the level, its tiles or the view changed
+        if (self.full_redraw or self.static_background is None or self.level.tile_layer_dirty
+                or self.camera.rect.topleft != self.last_camera_pos):
+            self.build_static_background()
+            self.screen.blit(self.static_background, (0, 0))
+            self.previous_rects = self.draw_dynamic(alpha)
+            self.full_redraw = False
+            return None
+        
+        # Restore the background where moving elements were last frame
+        for rect in self.previous_rects:
+            self.screen.blit(self.static_background, rect, rect)
+        
+        # Draw moving elements, both old and new areas need updating
+        rects = self.draw_dynamic(alpha)
+        update_rects = self.previous_rects + rects
+        self.previous_rects = rects
+        return update_rects
+    
+    def draw_dynamic(self, alpha=1.0):
+        """
+        Draw the level's moving elements, the player and the UI
+        
+        Args:
+            alpha (float): Interpolation factor between the previous and current logic tick
+        
+        Returns:
+            list: Rectangles that were drawn to
+        """
+        rects = self.level.draw_dynamic(self.screen, alpha, self.camera)
+        rects.append(self.player.draw(self.screen, alpha, self.camera))
+        rects.extend(self.draw_ui())
+        return rects
     
     def run(self):
-        """Main game loop"""
+        """
+        Main game loop
+        Logic runs at a fixed TICK_RATE, rendering runs as often as the
+        fps cap allows and interpolates between the last two logic ticks.
+        """
         self.start_music()
         
+        profiler = self.profiler
+        timestep = FixedTimestep()
+        previous_time = time.perf_counter()
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
+            profiler.begin_frame()
+            now = time.perf_counter()
+            ticks = timestep.advance(now - previous_time)
+            previous_time = now
+            
+            with profiler.section('handle_events'):
+                self.handle_events()
+            with profiler.section('level_load'):
+                self.continue_level_load()
+            with profiler.section('update'):
+                for _ in range(ticks):
+                    self.update()
+            # Start this frame's sound effects, merging repeated triggers
+            audio.flush()
+            
+            # Only interpolate towards a state the last tick actually moved to
+            if self.world_advanced and not self.paused:
+                self.draw(timestep.alpha)
+            else:
+                self.draw(1.0)
             self.clock.tick(fps)
+            profiler.end_frame()
         
         self.quit()
     
     def quit(self):
         """Clean up and exit"""
+        if self.recorder is not None:
+            self.recorder.save()
+        if self.replay is not None:
+            mismatches = self.replay.verify()
+            if mismatches:
+                print("Replay diverged at ticks " + ", ".join(str(tick) for tick, _, _ in mismatches))
+            else:
+                print("Replay matched the recording")
+        self.profiler.close()
         pygame.quit()
         sys.exit()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=game_title)
+    parser.add_argument('--record', metavar='FILE', help="record the input of this session")
+    parser.add_argument('--replay', metavar='FILE', help="play back a recorded session")
+    args = parser.parse_args()
+    
     # Create and run the game
     game = Game()
+    if args.record:
+        game.start_recording(args.record)
+    if args.replay:
+        game.start_replay(args.replay)
     game.run()
\ No newline at end of file
@@ -1,6 +1,11 @@
 import pygame
-import os
-from settings import PLAYER_SPEED, GRAVITY, JUMP_STRENGTH, screen_height, tile_size
+from settings import (
+    PLAYER_SPEED, GRAVITY, JUMP_STRENGTH, screen_height, tile_size,
+    PLAYER_IMAGE_PATH
+)
+from asset_manager import assets
+from audio_manager import audio
+from timestep import interpolate
 
 class player(pygame.sprite.Sprite):
     """
@@ -41,17 +46,12 @@ class player(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(topleft=pos)
         self.velocity = pygame.Vector2(0, 0)
         self.acceleration = pygame.Vector2(0, GRAVITY)
+        self.previous_pos = None  # Position after the previous logic tick
+        self.bounds = None  # Rect the player must stay in, the screen if None
         
         # Collision detection helpers
         self.collision_rect = pygame.Rect(0, 0, self.rect.width - 10, self.rect.height)
         self.collision_rect.midbottom = self.rect.midbottom
-        
-        # Sound effects
-        self.jump_sound = None
-        try:
-            self.jump_sound = pygame.mixer.Sound('assets/sounds/jump.wav')
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"Error loading jump sound: {e}")
     
     def load_animations(self):
         """Load all animation frames for the player"""
@@ -66,23 +66,21 @@ class player(pygame.sprite.Sprite):
         
         # Try to load the wizard sprite for now
         try:
-            # For single image (will be expanded for animations)
-            wizard_img = pygame.image.load('assets/images/wizard/wizard.jpg').convert_alpha()
-            wizard_img = pygame.transform.scale(wizard_img, (50, 50))
+            # Shared cached images (will be expanded for animations)
+            wizard_img = assets.get_image(PLAYER_IMAGE_PATH, (50, 50))
+            wizard_img_left = assets.get_image(PLAYER_IMAGE_PATH, (50, 50), flip=(True, False))
             
             # Store the base image for animations
             animations['idle_right'] = [wizard_img]
-            
-            # Create flipped version for left-facing animations
-            animations['idle_left'] = [pygame.transform.flip(wizard_img, True, False)]
+            animations['idle_left'] = [wizard_img_left]
             
             # Temporarily use the same image for all states
             animations['run_right'] = [wizard_img]
-            animations['run_left'] = [pygame.transform.flip(wizard_img, True, False)]
+            animations['run_left'] = [wizard_img_left]
             animations['jump_right'] = [wizard_img]
-            animations['jump_left'] = [pygame.transform.flip(wizard_img, True, False)]
+            animations['jump_left'] = [wizard_img_left]
             
-        except FileNotFoundError as e:
+        except (pygame.error, FileNotFoundError) as e:
             print(f"Error loading player images: {e}")
             # Don't exit - we'll use a fallback image
         
@@ -128,8 +126,7 @@ class player(pygame.sprite.Sprite):
             self.jumping = True
             
             # Play jump sound
-            if self.jump_sound:
-                self.jump_sound.play()
+            audio.play('jump')
     
     def apply_gravity(self):
         """Apply gravity to the player's vertical movement"""
@@ -168,25 +165,37 @@ class player(pygame.sprite.Sprite):
             self.image = animation[min(self.current_frame, len(animation) - 1)]
     
     def check_boundaries(self):
-        """Prevent player from moving off screen edges"""
+        """Prevent player from moving off screen edges, or off the level when it has bounds"""
+        if self.bounds is not None:
+            right_edge = self.bounds.right
+            bottom_edge = self.bounds.bottom
+        else:
+            # Right boundary (assuming screen_width is defined in settings)
+            right_edge = None
+            if hasattr(pygame, 'display') and pygame.display.get_surface():
+                right_edge = pygame.display.get_surface().get_width()
+            bottom_edge = screen_height
+        
         # Left boundary
         if self.rect.left < 0:
             self.rect.left = 0
             self.velocity.x = 0
         
-        # Right boundary (assuming screen_width is defined in settings)
-        if hasattr(pygame, 'display') and pygame.display.get_surface():
-            screen_width = pygame.display.get_surface().get_width()
-            if self.rect.right > screen_width:
-                self.rect.right = screen_width
-                self.velocity.x = 0
+        # Right boundary
+        if right_edge is not None and self.rect.right > right_edge:
+            self.rect.right = right_edge
+            self.velocity.x = 0
         
         # Bottom boundary (for falling)
-        if self.rect.bottom > screen_height:
-            self.rect.bottom = screen_height
+        if self.rect.bottom > bottom_edge:
+            self.rect.bottom = bottom_edge
             self.velocity.y = 0
             self.on_ground = True
     
+    def save_previous_position(self):
+        """Remember the current position for interpolated drawing"""
+        self.previous_pos = self.rect.topleft
+    
     def update_collision_rect(self):
         """Update the collision rectangle to match player position"""
         self.collision_rect.midbottom = self.rect.midbottom
@@ -210,12 +219,26 @@ class player(pygame.sprite.Sprite):
         # Update animation
         self.update_animation()
     
-    def draw(self, surface):
-        """Draw the player on the given surface"""
-        surface.blit(self.image, self.rect)
+    def draw(self, surface, alpha=1.0, camera=None):
+        """
+        Draw the player on the given surface
+        
+        Args:
+            surface (pygame.Surface): Surface to draw on
+            alpha (float): Interpolation factor between the previous and current tick
+            camera (Camera): Viewport to offset the drawing by
+        
+        Returns:
+            pygame.Rect: Area that was drawn to
+        """
+        pos = interpolate(self.previous_pos, self.rect.topleft, alpha)
+        if camera is not None:
+            pos = camera.apply(pos)
+        drawn = surface.blit(self.image, pos)
         
         # Debug: Draw collision rect (comment out in production)
         # pygame.draw.rect(surface, (255, 0, 0), self.collision_rect, 2)
+        return drawn
 
 
 # Example usage (if this file is run directly)
@@ -0,0 +1,162 @@
+import csv
+import json
+import time
+from collections import deque
+from contextlib import nullcontext
+from settings import PROFILE_HISTORY
+
+# Sections recorded every frame, in CSV column order
+SECTION_NAMES = (
+    'handle_events',
+    'level_load',
+    'update',
+    'collide_horizontal',
+    'collide_vertical',
+    'collide_special',
+    'collide_coins',
+    'draw',
+    'flip',
+)
+
+
+class _SectionTimer:
+    """Context manager adding the time spent inside it to a profiler section"""
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        sections = self.profiler.current
+        sections[self.name] = sections.get(self.name, 0.0) + time.perf_counter() - self.start
+        return False
+
+
+class FrameProfiler:
+    """
+    Per-frame hot path timer.
+    Records wall time per named section for every frame, keeps a rolling
+    history for FPS and percentile reporting, and can stream every frame
+    to a CSV or JSON lines file for offline analysis.
+    """
+
+    def __init__(self, output_path=None, history=PROFILE_HISTORY):
+        """
+        Initialize the profiler
+
+        Args:
+            output_path (str): Optional .csv or .json/.jsonl file to stream samples to
+            history (int): Number of recent frames kept for statistics
+        """
+        self.enabled = True
+        self.current = {}
+        self.frame_times = deque(maxlen=history)
+        self.frame_count = 0
+        self.frame_start = None
+        self.timers = {}
+
+        # Output stream
+        self.output_file = None
+        self.csv_writer = None
+        if output_path:
+            self.output_file = open(output_path, 'w', newline='')
+            if output_path.endswith('.csv'):
+                self.csv_writer = csv.writer(self.output_file)
+                self.csv_writer.writerow(('frame', 'frame_time') + SECTION_NAMES)
+
+    def section(self, name):
+        """
+        Time a block of code as part of the current frame
+
+        Args:
+            name (str): Section name
+
+        Returns:
+            Context manager timing the block
+        """
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = _SectionTimer(self, name)
+        return timer
+
+    def begin_frame(self):
+        """Mark the start of a frame"""
+        self.current = {}
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Mark the end of a frame and record its samples"""
+        if self.frame_start is None:
+            return
+        frame_time = time.perf_counter() - self.frame_start
+        self.frame_times.append(frame_time)
+        self.frame_count += 1
+        self.frame_start = None
+
+        if self.csv_writer:
+            self.csv_writer.writerow(
+                [self.frame_count, f"{frame_time:.6f}"]
+                + [f"{self.current.get(name, 0.0):.6f}" for name in SECTION_NAMES]
+            )
+        elif self.output_file:
+            sample = {'frame': self.frame_count, 'frame_time': frame_time}
+            sample.update(self.current)
+            self.output_file.write(json.dumps(sample) + '\n')
+
+    def fps(self):
+        """Average frames per second over the recorded history"""
+        if not self.frame_times:
+            return 0.0
+        total = sum(self.frame_times)
+        return len(self.frame_times) / total if total > 0 else 0.0
+
+    def percentiles(self, points=(50, 95, 99)):
+        """
+        Frame time percentiles over the recorded history
+
+        Args:
+            points (tuple): Percentiles to compute
+
+        Returns:
+            dict: Percentile -> frame time in seconds
+        """
+        if not self.frame_times:
+            return {point: 0.0 for point in points}
+        ordered = sorted(self.frame_times)
+        last = len(ordered) - 1
+        return {point: ordered[min(last, int(round(point / 100 * last)))] for point in points}
+
+    def close(self):
+        """Flush and close the output file"""
+        if self.output_file:
+            self.output_file.close()
+            self.output_file = None
+            self.csv_writer = None
+
+
+class NullProfiler:
+    """Profiler with the same interface that records nothing"""
+
+    enabled = False
+    _context = nullcontext()
+
+    def section(self, name):
+        return self._context
+
+    def begin_frame(self):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def close(self):
+        pass
+
+
+# Shared do-nothing instance for code running without profiling
+NULL_PROFILER = NullProfiler()
@@ -7,8 +7,13 @@ This file contains all configurable parameters for the game
 game_title = "Pinky's Coins"
 screen_width = 800
 screen_height = 600
-fps = 60
+fps = 60  # Render frame cap, 0 for uncapped
+TICK_RATE = 60  # Fixed game logic ticks per second, independent of the render rate
+MAX_TICKS_PER_FRAME = 5  # Logic ticks allowed to catch up in one rendered frame
 tile_size = 32
+TILE_LAYER_CHUNK_SIZE = 1024  # Size in pixels of each pre-rendered tile layer chunk
+DIRTY_RECT_RENDERING = False  # Only redraw and update changed screen regions
+COLLIDER_BLOCK_TILES = 16  # Wall cells are merged into collision rects within blocks of this many tiles
 
 # Player physics
 PLAYER_SPEED = 5
@@ -22,6 +27,7 @@ UI_FONT_COLOR = (255, 255, 255)
 UI_SCORE_POS = (20, 20)  # Position for score display
 UI_LEVEL_POS = (screen_width - 150, 20)  # Position for level display
 UI_HEALTH_POS = (20, 50)  # Position for health display
+TEXT_CACHE_SIZE = 64  # Maximum number of cached text surfaces
 
 # Enemy settings
 ENEMY_SPEED = 2
@@ -33,6 +39,8 @@ COIN_VALUES = {
     'gold': 5
 }
 COIN_ANIMATION_SPEED = 0.1
+COIN_SIZE = 30  # Coin image width and height in pixels
+COIN_SPIN_FRAMES = 8  # Frames of the spinning animation
 
 # Colors
 COLOR_BG = (255, 230, 250)        # Light pink background
@@ -56,9 +64,45 @@ MUSIC_PATH = 'assets/sounds/piano-melody-277609.mp3'
 SOUND_COIN = 'assets/sounds/coin_collect.wav'
 SOUND_JUMP = 'assets/sounds/jump.wav'
 SOUND_LEVEL_COMPLETE = 'assets/sounds/level_complete.wav'
+TILE_IMAGE_PATH = 'assets/images/tiles/ground.png'
+COIN_IMAGE_PATHS = {
+    'bronze': 'assets/images/bronzecoin.png',
+    'silver': 'assets/images/silvercoin.png',
+    'gold': 'assets/images/golden_coin.png',
+}
+
+# Sound effects: name -> (path, channel group, max simultaneous voices, cooldown in ms)
+SOUND_EFFECTS = {
+    'coin_collect': (SOUND_COIN, 'pickup', 2, 50),
+    'jump': (SOUND_JUMP, 'player', 1, 100),
+    'level_complete': (SOUND_LEVEL_COMPLETE, 'ui', 1, 0),
+}
+AUDIO_CHANNEL_GROUPS = {  # Mixer channels reserved for each group
+    'pickup': 3,
+    'player': 2,
+    'ui': 1,
+}
+
+# Asset cache
+ASSET_CACHE_BUDGET = 64 * 1024 * 1024  # Approximate memory budget in bytes
+ASSET_LOADER_THREADS = 4  # Threads decoding startup assets in parallel
+ASSET_PACK_PATH = 'assets/assets.pak'  # Pre-converted assets built by asset_pack.py, used if present
+STARTUP_TIMING_REPORT = False  # Print a per-stage and per-asset breakdown of startup time
 
 # Levels
 MAX_LEVELS = 3
+COMPILED_LEVEL_EXTENSION = '.lvb'  # Binary levels built by level_compiler.py
+LEVEL_PRELOAD = True  # Load the next level on a background thread
+LEVEL_LOAD_SLICE = 0.004  # Seconds per frame spent loading when the preload isn't ready
+LEVEL_HOT_RELOAD = False  # Apply edits of the current level file while playing
+LEVEL_WATCH_INTERVAL = 0.5  # Seconds between checks of the level file for edits
+
+# Chunked streaming for levels larger than the screen
+WORLD_STREAMING_MIN_CELLS = 20000  # Levels with more cells than this are streamed
+WORLD_CHUNK_TILES = 16  # Chunk width and height in tiles
+WORLD_ACTIVE_RADIUS = 2  # Chunks around the player's chunk that have sprites
+ENTITY_GRID_CELL_SIZE = 128  # Cell size in pixels of the grid used to cull level objects
+ENTITY_POOL_MAX_FREE = 4096  # Released level objects kept for reuse, per object type
 LEVEL_PATHS = [
     'assets/levels/level1.txt',
     'assets/levels/level2.txt',
@@ -69,6 +113,9 @@ LEVEL_PATHS = [
 DEBUG = False  # Set to True to enable debug features
 DEBUG_COLLISION_RECTS = False  # Show collision rectangles
 DEBUG_SHOW_FPS = True  # Show FPS counter
+PROFILE_OUTPUT_PATH = None  # Stream per-frame timings to this .csv or .jsonl file
+PROFILE_HISTORY = 600  # Frames kept for FPS and percentile statistics
+REPLAY_CHECKSUM_INTERVAL = 600  # Ticks between game state checksums in input recordings
 
 # Game difficulty
 DIFFICULTY_EASY = {
@@ -99,6 +146,7 @@ TILE_MAPPING = {
     'c': 'coin_bronze',      # Bronze coin
     's': 'coin_silver',    # Silver coin
     'g': 'coin_gold',      # Gold coin
+    'b': 'coin_bronze',    # Bronze coin (older levels)
     'e': 'enemy',       # Enemy
     'h': 'health',      # Health pickup
     'p': 'player',      # Player start position
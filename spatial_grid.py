@@ -0,0 +1,166 @@
+from settings import tile_size
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, SolidGrid falls back to bytearrays
+    np = None
+
+
+class SpatialGrid:
+    """
+    Uniform grid spatial index.
+    Buckets objects by the grid cells their rectangle covers so that
+    overlap queries only have to look at the few cells near the query rect.
+    """
+
+    def __init__(self, cell_size=tile_size):
+        """
+        Initialize an empty grid
+
+        Args:
+            cell_size (int): Width and height of a grid cell in pixels
+        """
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y) -> list of (rect, item)
+        self.count = 0
+
+    def _cell_range(self, rect):
+        """Return the range of cell coordinates covered by a rectangle"""
+        size = self.cell_size
+        left = rect.left // size
+        top = rect.top // size
+        # Rect.right/bottom are exclusive, so step back one pixel
+        right = (rect.right - 1) // size
+        bottom = (rect.bottom - 1) // size
+        return left, top, right, bottom
+
+    def insert(self, item, rect=None):
+        """
+        Add an object to the grid
+
+        Args:
+            item: Object to store (a sprite, a Rect, or anything else)
+            rect (pygame.Rect): Area covered by the item, defaults to item.rect
+        """
+        if rect is None:
+            rect = item.rect
+        entry = (rect, item)
+        left, top, right, bottom = self._cell_range(rect)
+        for cell_y in range(top, bottom + 1):
+            for cell_x in range(left, right + 1):
+                self.cells.setdefault((cell_x, cell_y), []).append(entry)
+        self.count += 1
+
+    def remove(self, item, rect=None):
+        """
+        Remove an object from the grid
+
+        Args:
+            item: Object previously passed to insert()
+            rect (pygame.Rect): Area the item was inserted with, defaults to item.rect
+        """
+        if rect is None:
+            rect = item.rect
+        removed = False
+        left, top, right, bottom = self._cell_range(rect)
+        for cell_y in range(top, bottom + 1):
+            for cell_x in range(left, right + 1):
+                bucket = self.cells.get((cell_x, cell_y))
+                if not bucket:
+                    continue
+                for index, (_, stored) in enumerate(bucket):
+                    if stored is item:
+                        del bucket[index]
+                        removed = True
+                        break
+                if not bucket:
+                    del self.cells[(cell_x, cell_y)]
+        if removed:
+            self.count -= 1
+
+    def query(self, rect):
+        """
+        Find all objects whose rectangle overlaps the given rect
+
+        Args:
+            rect (pygame.Rect): Area to search
+
+        Returns:
+            list: Items overlapping rect, each reported once
+        """
+        found = []
+        seen = set()
+        cells = self.cells
+        left, top, right, bottom = self._cell_range(rect)
+        for cell_y in range(top, bottom + 1):
+            for cell_x in range(left, right + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if not bucket:
+                    continue
+                for item_rect, item in bucket:
+                    key = id(item)
+                    if key not in seen and item_rect.colliderect(rect):
+                        seen.add(key)
+                        found.append(item)
+        return found
+
+    def clear(self):
+        """Remove every object from the grid"""
+        self.cells.clear()
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+
+class SolidGrid:
+    """
+    Dense per-cell solid flags for a level.
+    Answers "is this cell a wall" with one array lookup, and lets batched
+    code test many cells at once when NumPy is available.
+    """
+
+    def __init__(self, columns, rows, cell_size=tile_size):
+        """
+        Args:
+            columns (int): Level width in cells
+            rows (int): Level height in cells
+            cell_size (int): Cell width and height in pixels
+        """
+        self.columns = columns
+        self.rows = rows
+        self.cell_size = cell_size
+        if np is not None:
+            self.cells = np.zeros((rows, columns), dtype=bool)
+        else:
+            self.cells = [bytearray(columns) for _ in range(rows)]
+
+    def set_solid(self, pos, solid=True):
+        """
+        Mark the cell containing a pixel position
+
+        Args:
+            pos (tuple): Pixel position (x, y)
+            solid (bool): New flag value
+        """
+        col = int(pos[0]) // self.cell_size
+        row = int(pos[1]) // self.cell_size
+        if 0 <= col < self.columns and 0 <= row < self.rows:
+            self.cells[row][col] = solid
+
+    def is_solid(self, col, row):
+        """Check a cell, cells outside the level are not solid"""
+        if 0 <= col < self.columns and 0 <= row < self.rows:
+            return bool(self.cells[row][col])
+        return False
+
+    def block(self, col_start, row_start, col_stop, row_stop):
+        """
+        Copy out a rectangular block of flags
+
+        Returns:
+            list: One list of flags per row, from row_start to row_stop
+        """
+        if np is not None:
+            return self.cells[row_start:row_stop, col_start:col_stop].tolist()
+        return [list(self.cells[row][col_start:col_stop]) for row in range(row_start, row_stop)]
@@ -0,0 +1,38 @@
+import pygame
+import pytest
+
+from asset_pack import AssetPack, build_pack
+from asset_manager import AssetManager
+
+COIN_IMAGE = ('assets/images/bronzecoin.png', (30, 30), (False, False), 'alpha')
+
+
+@pytest.fixture
+def pack_data(tmp_path):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    path = tmp_path / 'assets.pak'
+    build_pack(str(path), images=[COIN_IMAGE], sounds=[])
+    yield path.read_bytes()
+    pygame.quit()
+
+
+@pytest.mark.parametrize('size', [0, 10, 30, 100, -10])
+def test_truncated_pack_is_not_opened(tmp_path, pack_data, size):
+    path = tmp_path / 'bad.pak'
+    path.write_bytes(pack_data[:size])
+    with pytest.raises(ValueError):
+        AssetPack(str(path))
+    assert not AssetManager().open_pack(str(path))
+
+
+def test_failed_pack_entry_falls_back_to_the_file(tmp_path, pack_data, monkeypatch):
+    path = tmp_path / 'assets.pak'
+    path.write_bytes(pack_data)
+    manager = AssetManager()
+    assert manager.open_pack(str(path))
+
+    def broken(key):
+        raise ValueError("corrupt entry")
+    monkeypatch.setattr(manager.pack, 'load', broken)
+    assert manager.get_image(*COIN_IMAGE).get_size() == COIN_IMAGE[1]
@@ -0,0 +1,71 @@
+import pytest
+
+import main
+from headless import ScriptedInput, run_headless
+from input_recording import InputRecorder, InputReplay
+
+# Level 1 ends a few steps right of the player start, level 2 is an empty room;
+# like the fallback levels the player walks along the bottom of the screen
+LEVELS = {
+    1: ['#' * 25] + ['#' + ' ' * 23 + '#'] * 17 + ['#' + ' ' * 7 + 'f' + ' ' * 15 + '#'],
+    2: ['#' * 25] + ['#' + ' ' * 23 + '#'] * 18,
+}
+
+
+@pytest.fixture
+def levels(monkeypatch):
+    """Play the test levels and load every level change over several frames"""
+    monkeypatch.setattr(main, 'get_level_data', lambda number: list(LEVELS[number]))
+    monkeypatch.setattr(main, 'LEVEL_PRELOAD', False)
+    monkeypatch.setattr(main, 'LEVEL_LOAD_SLICE', 0)
+
+
+def record(path, script):
+    """Record a session playing the whole script from level 1"""
+    game = main.Game()
+    recorder = InputRecorder(script, game, path, checksum_interval=20)
+    game.input_source = recorder
+
+    updates = 0
+    while recorder.tick < len(script):
+        script.frame = recorder.tick
+        game.continue_level_load()
+        game.update()
+        updates += 1
+    recorder.save()
+    return game, updates
+
+
+def test_replay_across_level_change(tmp_path, levels):
+    path = str(tmp_path / 'session.pkr')
+    script = ScriptedInput.parse('right*60,right+up*10,*30')
+    game, updates = record(path, script)
+    assert game.current_level == 2
+    assert updates > len(script)  # The level load ticks read no input
+
+    result = run_headless(0, replay=path)
+    assert result['level'] == 2
+    assert result['frames'] == updates
+    assert result['replay_mismatches'] == []
+
+
+def test_unplayed_ticks_are_mismatches(tmp_path, levels):
+    path = str(tmp_path / 'session.pkr')
+    record(path, ScriptedInput.parse('right*100'))
+
+    replay = InputReplay(path)
+    for _ in range(30):
+        replay()
+    assert not replay.finished
+    assert [tick for tick, _, actual in replay.verify() if actual is None] == [40, 60, 80, 100]
+
+
+@pytest.mark.parametrize('size', [0, 10, -1, -9])
+def test_truncated_recording_is_rejected(tmp_path, levels, size):
+    path = tmp_path / 'session.pkr'
+    record(str(path), ScriptedInput.parse('right*30,left*30'))
+    data = path.read_bytes()
+    path.write_bytes(data[:size])
+
+    with pytest.raises(ValueError, match='Corrupt input recording'):
+        InputReplay(str(path))
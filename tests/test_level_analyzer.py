@@ -0,0 +1,54 @@
+from level_analyzer import analyze_level, coin_reach, collection_route
+
+
+def coin(cell):
+    return ('coin', cell)
+
+
+def test_coin_reach_follows_moves_one_way():
+    # a <-> b form a loop, b drops into c for good, d falls out of the level
+    edges = {
+        'a': [('b', 4, [coin((1, 0))])],
+        'b': [('a', 4, []), ('c', 2, [coin((2, 0))])],
+        'c': [('c', 3, [])],
+        'd': [(None, 9, [coin((3, 0))])],
+    }
+    reach = coin_reach(edges)
+    assert reach['a'] == reach['b'] == {(1, 0), (2, 0)}
+    assert reach['c'] == frozenset()
+    assert reach['d'] == {(3, 0)}
+
+
+def test_collection_route_avoids_stranding_coins():
+    # The nearest coin is at the bottom of a pit the far coin cannot be reached from
+    edges = {
+        'start': [('pit', 1, [coin((1, 0))]), ('ledge', 5, [coin((2, 0))])],
+        'ledge': [('start', 1, [])],
+        'pit': [],
+    }
+    route, ticks = collection_route(('start', 0, []), edges, {(1, 0), (2, 0)})
+    assert route == [(2, 0), (1, 0)]
+    assert ticks == 7
+
+
+def test_collection_route_counts_the_first_move():
+    edges = {'start': [('start', 2, [coin((5, 0))])]}
+    route, ticks = collection_route(('start', 10, [coin((4, 0))]), edges, {(4, 0), (5, 0)})
+    assert route == [(4, 0), (5, 0)]
+    assert ticks == 12
+
+
+def test_analyze_level_finds_walled_in_coin():
+    rows = [
+        '############',
+        '#          #',
+        '#          #',
+        '#      ### #',
+        '#p     #c# #',
+        '#  c   ### #',
+        '############',
+    ]
+    report = analyze_level(rows)
+    assert report['reachable_coins'] == 1
+    assert report['unreachable_coins'] == [(8, 4)]
+    assert report['route'] == [(3, 5)]
@@ -0,0 +1,39 @@
+import pytest
+
+from settings import TILE_MAPPING
+from level_compiler import TILE_CODES, CompiledLevel, compile_level
+
+ROWS = [
+    '#######',
+    '#p c f#',
+    '# sgb #',
+    '#######',
+]
+
+
+def write(tmp_path, data):
+    path = tmp_path / 'level.lvb'
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_every_tile_character_has_a_code():
+    assert set(TILE_MAPPING) <= set(TILE_CODES)
+    assert len(set(TILE_CODES)) == len(TILE_CODES)
+
+
+def test_round_trip(tmp_path):
+    with CompiledLevel(write(tmp_path, compile_level(ROWS))) as level:
+        assert level.to_rows() == ROWS
+        assert sorted(level.entities()) == sorted([
+            ('p', 1, 1), ('c', 3, 1), ('f', 5, 1), ('s', 2, 2), ('g', 3, 2), ('b', 4, 2),
+        ])
+    assert level.mapping.closed
+    level.close()  # Closing twice is harmless
+
+
+@pytest.mark.parametrize('size', [0, 10, 40])
+def test_truncated_file(tmp_path, size):
+    path = write(tmp_path, compile_level(ROWS)[:size])
+    with pytest.raises(ValueError, match="Truncated"):
+        CompiledLevel(path)
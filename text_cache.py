@@ -0,0 +1,93 @@
+import pygame
+from collections import OrderedDict
+from settings import TEXT_CACHE_SIZE
+
+
+class TextCache:
+    """
+    Bounded cache of rendered text surfaces.
+    Text that does not change between frames is rendered once and reused.
+    """
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        """
+        Initialize an empty cache
+
+        Args:
+            max_size (int): Maximum number of surfaces kept, least recently used go first
+        """
+        self.max_size = max_size
+        self.surfaces = OrderedDict()  # (text, color, font) -> surface
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        """
+        Get an antialiased rendering of some text
+
+        Args:
+            font (pygame.font.Font): Font to render with
+            text (str): Text to render
+            color (tuple): Text color
+
+        Returns:
+            pygame.Surface: Shared surface, do not draw onto it
+        """
+        key = (text, tuple(color), font)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drop every cached surface"""
+        self.surfaces.clear()
+
+
+class GlyphAtlas:
+    """
+    Pre-rendered glyphs for drawing counters.
+    Numbers are drawn by blitting one cached surface per digit, so a changing
+    score never has to go through the font renderer.
+    """
+
+    def __init__(self, font, color, characters='0123456789-'):
+        """
+        Render every glyph once
+
+        Args:
+            font (pygame.font.Font): Font to render with
+            color (tuple): Glyph color
+            characters (str): Characters available in the atlas
+        """
+        self.glyphs = {char: font.render(char, True, color) for char in characters}
+        self.height = max(glyph.get_height() for glyph in self.glyphs.values())
+
+    def draw(self, surface, value, pos):
+        """
+        Draw a number glyph by glyph
+
+        Args:
+            surface (pygame.Surface): Surface to draw on
+            value (int): Number to draw
+            pos (tuple): Top-left position (x, y)
+
+        Returns:
+            pygame.Rect: Area that was drawn to
+        """
+        x, y = pos
+        blits = []
+        for char in str(value):
+            glyph = self.glyphs[char]
+            blits.append((glyph, (x, y)))
+            x += glyph.get_width()
+        surface.blits(blits, False)
+        return pygame.Rect(pos[0], y, x - pos[0], self.height)
@@ -0,0 +1,68 @@
+from settings import TICK_RATE, MAX_TICKS_PER_FRAME
+
+
+class FixedTimestep:
+    """
+    Accumulator for running game logic at a fixed tick rate.
+    Real elapsed time is added every rendered frame and consumed in whole
+    ticks; the leftover fraction is used to interpolate what gets drawn.
+    """
+
+    def __init__(self, tick_rate=TICK_RATE, max_ticks=MAX_TICKS_PER_FRAME):
+        """
+        Args:
+            tick_rate (int): Logic ticks per second
+            max_ticks (int): Most ticks run for one rendered frame, so a long
+                stall slows the game down instead of freezing it catching up
+        """
+        self.tick_time = 1.0 / tick_rate
+        self.max_ticks = max_ticks
+        self.accumulator = 0.0
+
+    def advance(self, elapsed):
+        """
+        Add elapsed real time
+
+        Args:
+            elapsed (float): Seconds since the previous frame
+
+        Returns:
+            int: Number of logic ticks to run this frame
+        """
+        self.accumulator += elapsed
+        ticks = int(self.accumulator / self.tick_time)
+        if ticks > self.max_ticks:
+            # Drop the backlog we cannot catch up on
+            ticks = self.max_ticks
+            self.accumulator = self.tick_time * ticks
+        self.accumulator -= ticks * self.tick_time
+        return ticks
+
+    @property
+    def alpha(self):
+        """Fraction of a tick between the last logic state and the next one"""
+        return self.accumulator / self.tick_time
+
+    def reset(self):
+        """Forget accumulated time"""
+        self.accumulator = 0.0
+
+
+def interpolate(previous, current, alpha):
+    """
+    Blend two positions
+
+    Args:
+        previous (tuple): Position (x, y) after the previous tick, or None
+        current (tuple): Position (x, y) after the latest tick
+        alpha (float): Blend factor, 0 gives previous and 1 gives current
+
+    Returns:
+        tuple: Interpolated integer position
+    """
+    if previous is None or alpha >= 1.0:
+        return current
+    return (
+        round(previous[0] + (current[0] - previous[0]) * alpha),
+        round(previous[1] + (current[1] - previous[1]) * alpha),
+    )
@@ -0,0 +1,198 @@
+import pygame
+from settings import tile_size, WORLD_CHUNK_TILES, WORLD_ACTIVE_RADIUS
+from level_compiler import CompiledLevel
+
+COIN_CHARS = 'csgb'
+
+
+def level_dimensions(level_data):
+    """
+    Size of a level in cells
+
+    Args:
+        level_data: Level rows, a CompiledLevel or a LevelLayout
+
+    Returns:
+        tuple: (columns, rows)
+    """
+    if isinstance(level_data, (list, tuple)):
+        return max((len(row) for row in level_data), default=0), len(level_data)
+    return level_data.width, level_data.height
+
+
+class ChunkState:
+    """Compact record of an evicted chunk's changes"""
+
+    __slots__ = ('collected', 'enemies')
+
+    def __init__(self, collected, enemies):
+        """
+        Args:
+            collected (frozenset): (col, row) cells of coins already collected
+            enemies (tuple): (x, y, direction) of each enemy when evicted
+        """
+        self.collected = collected
+        self.enemies = enemies
+
+
+class ChunkedWorld:
+    """
+    Streams a level into sprites chunk by chunk.
+    The level is split into square chunks of WORLD_CHUNK_TILES cells and only
+    chunks within WORLD_ACTIVE_RADIUS of the player have sprites. Evicted
+    chunks keep just the cells of collected coins and enemy positions.
+    """
+
+    def __init__(self, level, level_data, chunk_tiles=WORLD_CHUNK_TILES, radius=WORLD_ACTIVE_RADIUS):
+        """
+        Args:
+            level (Level): Level receiving the sprites
+            level_data: Level rows or a CompiledLevel
+            chunk_tiles (int): Chunk width and height in cells
+            radius (int): Chunks around the player's chunk that stay loaded
+        """
+        self.level = level
+        self.level_data = level_data
+        self.chunk_tiles = chunk_tiles
+        self.radius = radius
+
+        self.width, self.height = level_dimensions(level_data)
+        self.chunks_x = -(-self.width // chunk_tiles)
+        self.chunks_y = -(-self.height // chunk_tiles)
+        self.pixel_rect = pygame.Rect(0, 0, self.width * tile_size, self.height * tile_size)
+
+        self.active = {}  # (chunk_x, chunk_y) -> list of (tile_char, cell, sprite)
+        self.saved = {}  # (chunk_x, chunk_y) -> ChunkState
+        self.center_chunk = None
+
+        # Whole-level facts needed without loading every chunk
+        self.total_coins = 0
+        self.player_start = None
+        self._scan()
+
+    def _row_slice(self, row, start, stop):
+        """Return part of a level row as a string"""
+        if isinstance(self.level_data, CompiledLevel):
+            return self.level_data.row_slice(row, start, stop)
+        return self.level_data[row][start:stop]
+
+    def _scan(self):
+        """Count coins and find the player start"""
+        self.total_coins = 0
+        self.player_start = None
+        if isinstance(self.level_data, CompiledLevel):
+            for tile_char, col, row in self.level_data.entities():
+                if tile_char in COIN_CHARS:
+                    self.total_coins += 1
+                elif tile_char == 'p' and self.player_start is None:
+                    self.player_start = (col * tile_size, row * tile_size)
+            return
+
+        for row_index, row in enumerate(self.level_data):
+            self.total_coins += sum(row.count(char) for char in COIN_CHARS)
+            if self.player_start is None and 'p' in row:
+                self.player_start = (row.index('p') * tile_size, row_index * tile_size)
+
+    def chunk_at(self, pos):
+        """Return the chunk containing a pixel position"""
+        size = self.chunk_tiles * tile_size
+        return int(pos[0]) // size, int(pos[1]) // size
+
+    def update(self, pos):
+        """
+        Load chunks near a position and evict far ones
+
+        Args:
+            pos (tuple): Pixel position to stream around, usually the player center
+        """
+        center = self.chunk_at(pos)
+        if center == self.center_chunk:
+            return
+        self.center_chunk = center
+
+        center_x, center_y = center
+        radius = self.radius
+        wanted = {
+            (chunk_x, chunk_y)
+            for chunk_y in range(max(0, center_y - radius), min(self.chunks_y, center_y + radius + 1))
+            for chunk_x in range(max(0, center_x - radius), min(self.chunks_x, center_x + radius + 1))
+        }
+
+        # Keep one extra ring loaded so walking along a border doesn't thrash
+        for chunk in list(self.active):
+            if max(abs(chunk[0] - center_x), abs(chunk[1] - center_y)) > radius + 1:
+                self.deactivate(chunk)
+        for chunk in wanted:
+            if chunk not in self.active:
+                self.activate(chunk)
+
+    def activate(self, chunk):
+        """Create the sprites of one chunk"""
+        state = self.saved.get(chunk)
+        size = self.chunk_tiles
+        col_start = chunk[0] * size
+        col_stop = min(col_start + size, self.width)
+        row_start = chunk[1] * size
+        row_stop = min(row_start + size, self.height)
+
+        objects = []
+        for row in range(row_start, row_stop):
+            text = self._row_slice(row, col_start, col_stop)
+            for offset, tile_char in enumerate(text):
+                if tile_char == ' ' or tile_char == 'p':
+                    continue
+                col = col_start + offset
+                if state is not None:
+                    if tile_char in COIN_CHARS and (col, row) in state.collected:
+                        continue
+                    if tile_char == 'e':
+                        continue  # Restored from the saved positions below
+                sprite = self.level.spawn(tile_char, col * tile_size, row * tile_size)
+                if sprite is not None:
+                    objects.append((tile_char, (col, row), sprite))
+
+        if state is not None:
+            for x, y, direction in state.enemies:
+                enemy = self.level.spawn('e', x, y)
+                self.level.enemy_system.set_direction(enemy, direction)
+                objects.append(('e', None, enemy))
+
+        self.active[chunk] = objects
+
+    def deactivate(self, chunk):
+        """Remove the sprites of one chunk, keeping its changes in compact form"""
+        objects = self.active.pop(chunk)
+        state = self.saved.get(chunk)
+        collected = list(state.collected) if state is not None else []
+        enemies = []
+        for tile_char, cell, sprite in objects:
+            if tile_char in COIN_CHARS:
+                if sprite.is_collected:
+                    collected.append(cell)
+            elif tile_char == 'e':
+                enemies.append((sprite.rect.x, sprite.rect.y, sprite.direction))
+            self.level.remove_object(sprite)
+
+        self.saved[chunk] = ChunkState(frozenset(collected), tuple(enemies))
+
+    def patch(self, level_data, changes):
+        """
+        Switch to edited level data of the same size
+        Loaded chunks with changed cells are rebuilt, the others pick up
+        the new data when they are next loaded.
+
+        Args:
+            level_data (list): New level rows
+            changes (list): (col, row, tile_char) of every changed cell
+        """
+        self.level_data = level_data
+        self._scan()
+        size = self.chunk_tiles
+        for chunk in {(col // size, row // size) for col, row, _ in changes}:
+            if chunk in self.active:
+                self.deactivate(chunk)
+                self.activate(chunk)
+
+    def loaded_chunks(self):
+        """Number of chunks that currently have sprites"""
+        return len(self.active)